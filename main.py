@@ -93,6 +93,7 @@ The sniffer performs the following operations:
 
 Usage:
     python main.py
+    DAEMON_MODE=true python main.py
 
 # TODO: Implement comprehensive error handling and recovery mechanisms
 # TODO: Add async support for better performance
@@ -103,6 +104,8 @@ Environment Variables:
     DB_NAME: Database name
     S3_BUCKET: S3 bucket containing ABI files
     ATC_DB_Credentials: JSON credentials from AWS Secrets Manager
+    DAEMON_MODE: If true, keeps running and follows new blocks per network
+    INGESTION_SOURCE: 'explorer' txlist or 'logs' for eth_getLogs swap discovery
 """
 
 import asyncio
@@ -111,12 +114,14 @@ import time
 from dotenv import load_dotenv
 from retry import retry
 
-from src.chain.decode.decode_Execute import decodeTransactions
-from src.chain.transactions.transactions_Dexs import getDexTransactions
+from src.chain.utils.utils_web3 import getProviderRequestCounts
+from src.db.actions.actions_Checkpoints import ensureCheckpointTable
 from src.db.actions.actions_Setup import initDBConnection
+from src.db.cache.cache_Tokens import TokenIdResolver
 from src.db.querys.querys_Dexs import getAllDexsWithABIs
-from src.sniffer.sniffer_Process import assignDexTransactionList
-from src.utils.env.env_Environment import getBlockRange
+from src.sniffer.sniffer_Daemon import SnifferDaemon
+from src.sniffer.sniffer_Pipeline import runPipeline
+from src.utils.env.env_Environment import getBlockRange, getDaemonMode
 from src.utils.time.time_Calculations import getMinSecString
 
 # Application version
@@ -145,9 +150,9 @@ def runSniffer() -> None:
     Orchestrates the complete sniffer pipeline:
     1. Initialize database connection
     2. Fetch DEX configurations with ABIs
-    3. Retrieve transactions from blockchain explorers
-    4. Decode and store swap routes
-    5. Report results and timing
+    3. Stream transactions from blockchain explorers through the
+       decode and upload stages
+    4. Report results and timing
 
     Returns:
         None
@@ -165,30 +170,35 @@ def runSniffer() -> None:
     printSeparator()
 
     dbConnection = initDBConnection()
+    ensureCheckpointTable(dbConnection=dbConnection)
     dexs = getAllDexsWithABIs(
         dbConnection=dbConnection
     )
 
-    # Fetch transactions from blockchain explorers
-    dexTransactions = asyncio.run(getDexTransactions(
-        dbConnection=dbConnection,
-        dexs=dexs
-    ))
-
-    dexs = assignDexTransactionList(
-        dexs=dexs,
-        dexTransactions=dexTransactions
+    # Prefetch token IDs for every network we are about to process
+    tokenResolver = TokenIdResolver(dbConnection=dbConnection)
+    tokenResolver.prefetchNetworks(
+        networkDbIds={dex.network_details.network_id for dex in dexs}
     )
 
-    # Decode transactions and upload routes
-    printSeparator()
-    logger.info(f"Decoding + Uploading Routes")
-    printSeparator()
-
-    routesAdded = decodeTransactions(
-        dbConnection=dbConnection,
-        dexs=dexs
-    )
+    if getDaemonMode():
+        # Follow new blocks per network until stopped, keeping everything warm
+        routesAdded = asyncio.run(SnifferDaemon(
+            dbConnection=dbConnection,
+            tokenResolver=tokenResolver,
+            dexs=dexs
+        ).run())
+    else:
+        # Fetch, decode and upload routes as a streaming pipeline
+        printSeparator()
+        logger.info(f"Fetching + Decoding + Uploading Routes")
+        printSeparator()
+
+        routesAdded = asyncio.run(runPipeline(
+            dbConnection=dbConnection,
+            dexs=dexs,
+            tokenResolver=tokenResolver
+        ))
 
     # Calculate and log execution time
     timerString = getMinSecString(time.perf_counter() - startingTime)
@@ -198,6 +208,9 @@ def runSniffer() -> None:
     logger.info(f"Route Sniffer Complete")
     printSeparator()
     logger.info(f"Added {routesAdded} Routes")
+    logger.info(f"Token Cache: {tokenResolver.hits} Hits / {tokenResolver.misses} Misses")
+    for chainRpcURL, requestCount in getProviderRequestCounts().items():
+        logger.debug(f"RPC Requests: {chainRpcURL}: {requestCount}")
     logger.info(f"Took: {timerString}")
     printSeparator()
 
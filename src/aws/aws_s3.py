@@ -1,73 +1,39 @@
-# AWS S3 client and operations for data storage
-"""Handle S3 bucket operations for storing and retrieving route data."""
-"""AWS S3 operations for file storage and retrieval.
-"""Handle S3 upload and download operations for route data."""
-# Initialize S3 client with configured credentials and region
-"""Handle AWS S3 uploads and downloads for backup and data archive."""
-"""Initialize AWS S3 client with proper credentials and region."""
-"""Handle S3 bucket operations for data backup and retrieval."""
-# TODO: Implement S3 bucket configuration validation
-
-# Upload route data backups to S3 with timestamp versioning
-# Initialize S3 client with credentials from environment
-"""Archive route snapshots and blockchain data to S3 for long-term storage."""
-Provides functions for uploading and downloading data from S3 buckets.
-# S3 bucket operations for archiving processed route data
-"""
-"""Module for AWS S3 storage operations and management."""
-"""Handle S3 operations for data storage and retrieval."""
 """AWS S3 utilities for ABI file retrieval.
-"""Handle S3 bucket operations and file management"""
-"""AWS S3 operations for file storage and retrieval."""
-# Upload processed data to S3 with versioning enabled
-"""AWS S3 operations for storing and retrieving route data."""
-# Handle S3 bucket operations for data backup and retrieval
-
-# TODO: Enable encryption for all S3 objects
-# Upload processed data to S3 bucket
-# Enable detailed logging for S3 operations
+
 This module provides functions to retrieve contract ABI files stored
-# TODO: Add retry logic with exponential backoff for S3 upload failures
-# TODO: Add exponential backoff retry logic for S3 operations to handle transient failures
 in Amazon S3 for use in transaction decoding operations.
-# Connect to S3 bucket with proper IAM credentials and region
-"""AWS S3 storage operations for uploading and retrieving data."""
 
 ABI files are stored in the S3 bucket specified by the S3_BUCKET
 environment variable, under the 'abis/' prefix.
-# TODO: Implement exponential backoff retry strategy for failed uploads
 
-# TODO: Add retry logic with exponential backoff for S3 operations
 Expected S3 Structure:
-# Handles S3 bucket operations with error retry logic
 
     s3://{S3_BUCKET}/abis/
-# Configure S3 bucket and key prefix paths
-# Validate S3 bucket permissions before uploading route data
-# TODO: Implement batch S3 operations for better performance
-# Handle S3 upload retries with exponential backoff
         uniswap_v2_router.json
         sushiswap_router.json
-# TODO: Implement exponential backoff retry mechanism for S3 upload failures
         pancakeswap_router.json
-# Upload processed transaction data to S3
-# TODO: Implement multipart upload for large files
         ...
-# Implement retry mechanism for transient S3 failures
+
+Local Cache:
+    Downloaded ABIs are kept in ABI_CACHE_DIR together with their ETag. A
+    cached ABI younger than ABI_CACHE_TTL is used as is; an older one is
+    revalidated with a conditional GET (If-None-Match) so unchanged ABIs are
+    not downloaded again. If S3 cannot be reached a cached copy is used
+    regardless of age, and with ABI_CACHE_OFFLINE set S3 is never contacted.
+    All downloads share one boto3 client.
 """
 
-# Handle S3 bucket operations including upload, download, and backup functionality
 import json
-# S3 bucket name from environment configuration
 import os
-from typing import Optional
-# Configure S3 bucket access and credential handling
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import quote
 
 import boto3
-# TODO: Implement retry mechanism for transient S3 upload failures
-from botocore.exceptions import ClientError
-# Handle S3 bucket write operations with proper error handling
+from botocore.exceptions import BotoCoreError, ClientError
 
+from src.utils.env.env_Environment import getAbiCacheDir, getAbiCacheOffline, getAbiCacheTTL
 from src.utils.logging.logging_Setup import getProjectLogger
 
 logger = getProjectLogger()
@@ -76,19 +42,126 @@ logger = getProjectLogger()
 ABI_PATH_PREFIX = "abis"
 
 # Environment variable name for S3 bucket configuration
-# Upload file to S3 with retry logic
 S3_BUCKET_ENV_VAR = "S3_BUCKET"
 
-# Note: ABI files are typically small (~10-50KB) and fetched once per DEX
-# Consider caching for high-frequency access patterns
-# TODO: Add exponential backoff retry mechanism for failed uploads
+# Error code botocore reports for a conditional GET whose ETag still matches
+S3_NOT_MODIFIED_CODE = "304"
+
+# Suffix of the metadata file stored next to each cached ABI
+ABI_CACHE_META_SUFFIX = ".meta.json"
+
+# Shared S3 client, created on first use
+s3Client: Optional[Any] = None
+s3ClientLock = threading.Lock()
+
+
+def getS3Client() -> Any:
+    """Get the S3 client shared by every ABI download.
+
+    boto3 clients are thread-safe once created, creation is guarded so
+    concurrent first calls do not build several clients.
+
+    Returns:
+        The shared boto3 S3 client.
+    """
+    global s3Client
+
+    with s3ClientLock:
+        if s3Client is None:
+            s3Client = boto3.client('s3')
+
+    return s3Client
+
+
+def getAbiCachePath(s3Key: str) -> str:
+    """Get the local cache file path of an ABI.
+
+    Args:
+        s3Key: The S3 object key (filename) within the abis directory.
+
+    Returns:
+        str: Path of the cached ABI, with the key escaped into one filename.
+    """
+    return os.path.join(getAbiCacheDir(), quote(s3Key, safe=""))
+
+
+def readCachedAbi(s3Key: str) -> Optional[Dict[str, Any]]:
+    """Read an ABI and its metadata from the local cache.
+
+    Args:
+        s3Key: The S3 object key (filename) within the abis directory.
+
+    Returns:
+        Dict with abi, etag and fetched_at, or None if the ABI is not cached
+        or the cache entry is unreadable.
+    """
+    cachePath = getAbiCachePath(s3Key=s3Key)
+
+    try:
+        with open(cachePath, "r", encoding="utf-8") as abiFile:
+            abi = abiFile.read()
+        with open(cachePath + ABI_CACHE_META_SUFFIX, "r", encoding="utf-8") as metaFile:
+            meta = json.load(metaFile)
+    except (OSError, ValueError):
+        return None
+
+    return {"abi": abi, "etag": meta.get("etag"), "fetched_at": float(meta.get("fetched_at", 0))}
+
+
+def writeFileAtomically(path: str, content: str) -> None:
+    """Write a file under a temporary name and rename it into place.
+
+    An interrupted write never leaves a truncated file behind, and the
+    temporary name is unique per thread so concurrent writers of the same
+    path do not interfere.
+
+    Args:
+        path: Destination file path.
+        content: Text to write.
+    """
+    temporaryPath = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    with open(temporaryPath, "w", encoding="utf-8") as temporaryFile:
+        temporaryFile.write(content)
+    os.replace(temporaryPath, path)
+
+
+def writeCachedAbiMeta(s3Key: str, etag: Optional[str]) -> None:
+    """Record when an ABI was last fetched or revalidated.
+
+    Args:
+        s3Key: The S3 object key (filename) within the abis directory.
+        etag: ETag of the cached S3 object.
+    """
+    writeFileAtomically(
+        path=getAbiCachePath(s3Key=s3Key) + ABI_CACHE_META_SUFFIX,
+        content=json.dumps({"etag": etag, "fetched_at": time.time()})
+    )
+
+
+def writeCachedAbi(s3Key: str, abi: str, etag: Optional[str]) -> None:
+    """Store a downloaded ABI in the local cache.
+
+    Args:
+        s3Key: The S3 object key (filename) within the abis directory.
+        abi: The ABI JSON string.
+        etag: ETag of the S3 object.
+    """
+    cachePath = getAbiCachePath(s3Key=s3Key)
+    os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+
+    writeFileAtomically(path=cachePath, content=abi)
+
+    writeCachedAbiMeta(s3Key=s3Key, etag=etag)
 
 
 def getAbiFromS3(s3Key: str) -> str:
-    """Retrieve a contract ABI JSON from Amazon S3.
+    """Retrieve a contract ABI JSON from Amazon S3 or the local ABI cache.
 
     Fetches the ABI file from the configured S3 bucket and returns it
-    as a JSON string for contract interaction.
+    as a JSON string for contract interaction. Cached ABIs are returned
+    without contacting S3 while fresh, and revalidated with their ETag
+    once stale.
 
     Args:
         s3Key: The S3 object key (filename) within the abis directory.
@@ -97,31 +170,60 @@ def getAbiFromS3(s3Key: str) -> str:
         str: JSON string representation of the contract ABI.
 
     Raises:
-        botocore.exceptions.ClientError: If the S3 object cannot be retrieved.
+        botocore.exceptions.ClientError: If the S3 object cannot be retrieved
+            and is not cached.
         json.JSONDecodeError: If the file content is not valid JSON.
         ValueError: If S3_BUCKET environment variable is not set.
+        FileNotFoundError: If ABI_CACHE_OFFLINE is set and the ABI is not cached.
     """
+    cachedAbi = readCachedAbi(s3Key=s3Key)
+
+    if getAbiCacheOffline():
+        if cachedAbi is None:
+            raise FileNotFoundError(f"ABI {s3Key} is not cached and ABI_CACHE_OFFLINE is set")
+        return cachedAbi["abi"]
+
+    if cachedAbi is not None and time.time() - cachedAbi["fetched_at"] < getAbiCacheTTL():
+        return cachedAbi["abi"]
+
     # Construct full S3 object path
     full_path = f"{ABI_PATH_PREFIX}/{s3Key}"
 
-    # Initialize S3 resource client
-    s3 = boto3.resource('s3')
-
-"""AWS S3 bucket operations for storing and retrieving route data."""
     # Get bucket name from environment configuration
     s3_bucket = os.getenv(S3_BUCKET_ENV_VAR)
     if not s3_bucket:
         raise ValueError(f"Environment variable {S3_BUCKET_ENV_VAR} is not set")
 
-    # Fetch and parse the ABI file from S3
-    logger.debug(f"Fetching ABI from S3: s3://{s3_bucket}/{full_path}")
-# TODO: Add batch upload functionality for multiple objects
-    obj = s3.Object(s3_bucket, full_path)
-    abi = json.load(obj.get()['Body'])
+    requestArgs = {"Bucket": s3_bucket, "Key": full_path}
+    if cachedAbi is not None and cachedAbi["etag"]:
+        requestArgs["IfNoneMatch"] = cachedAbi["etag"]
 
-    logger.debug(f"Successfully retrieved ABI from S3: {full_path}")
+    try:
+        logger.debug(f"Fetching ABI from S3: s3://{s3_bucket}/{full_path}")
+        response = getS3Client().get_object(**requestArgs)
+
+    except ClientError as e:
+        if cachedAbi is not None and e.response.get("Error", {}).get("Code") == S3_NOT_MODIFIED_CODE:
+            logger.debug(f"ABI unchanged in S3: {full_path}")
+            writeCachedAbiMeta(s3Key=s3Key, etag=cachedAbi["etag"])
+            return cachedAbi["abi"]
+
+        if cachedAbi is None:
+            raise
+        logger.warning(f"Using cached ABI for {full_path}, S3 request failed: {e}")
+        return cachedAbi["abi"]
 
-    # Return as JSON string for contract initialization
-    return json.dumps(abi)
+    except BotoCoreError as e:
+        if cachedAbi is None:
+            raise
+        logger.warning(f"Using cached ABI for {full_path}, S3 unreachable: {e}")
+        return cachedAbi["abi"]
 
+    # Normalise to compact JSON for contract initialization
+    abi = json.dumps(json.loads(response["Body"].read()))
+
+    writeCachedAbi(s3Key=s3Key, abi=abi, etag=response.get("ETag"))
+
+    logger.debug(f"Successfully retrieved ABI from S3: {full_path}")
 
+    return abi
@@ -0,0 +1,199 @@
+"""Micro-benchmark for the explorer API rate limiter.
+
+Compares the timer-free GCRA RateLimiter against the previous queue-polling
+token bucket at each rate, both with the burst KeyedRateLimiter ships with
+(DEFAULT_BURST_SECONDS of the rate) and with a burst of a single request,
+in two scenarios:
+    - Paced: after saturating the limiter, requests arrive exactly at the
+      rate and the time each spends in throttle() is reported
+    - Burst: a batch of requests enters throttle() at once to check the
+      enforced rate and that grants follow arrival order
+
+Usage:
+    python -m src.bench.bench_RateLimiter [rate ...]
+"""
+
+import asyncio
+import math
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Tuple
+
+from src.utils.web.web_RateLimiter import KeyedRateLimiter, RateLimiter
+
+# Rates (requests per second) benchmarked when none are given
+DEFAULT_RATES = [1, 10, 100, 1000]
+
+# Target length of each run in seconds
+RUN_DURATION = 3.0
+
+# Minimum number of requests per run, so low rates still produce a p99
+MIN_REQUESTS = 8
+
+
+class QueueRateLimiter:
+    """The previous token bucket, which polls a queue from a background task.
+
+    Kept here only as the benchmark baseline.
+    """
+
+    def __init__(self, rate_limit: int, concurrency_limit: int) -> None:
+        self.rate_limit = rate_limit
+        self.tokens_queue: asyncio.Queue[int] = asyncio.Queue(rate_limit)
+        self.tokens_consumer_task = asyncio.create_task(self.consume_tokens())
+        self.semaphore = asyncio.Semaphore(concurrency_limit)
+
+    async def consume_tokens(self) -> None:
+        last_consumption_time = 0.0
+        consumption_rate = 1 / self.rate_limit
+        while True:
+            if self.tokens_queue.empty():
+                await asyncio.sleep(consumption_rate)
+                continue
+
+            elapsed = time.monotonic() - last_consumption_time
+            for _ in range(min(self.tokens_queue.qsize(), math.floor(elapsed / consumption_rate))):
+                self.tokens_queue.get_nowait()
+
+            last_consumption_time = time.monotonic()
+            await asyncio.sleep(consumption_rate)
+
+    @asynccontextmanager
+    async def throttle(self) -> AsyncIterator[None]:
+        await self.semaphore.acquire()
+        await self.tokens_queue.put(1)
+        try:
+            yield
+        finally:
+            self.semaphore.release()
+
+    async def close(self) -> None:
+        self.tokens_consumer_task.cancel()
+        try:
+            await self.tokens_consumer_task
+        except asyncio.CancelledError:
+            pass
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of a list of values.
+
+    Args:
+        values: Samples to summarise.
+        fraction: Percentile as a fraction between 0 and 1.
+
+    Returns:
+        float: The sample at that rank.
+    """
+    orderedValues = sorted(values)
+    return orderedValues[min(len(orderedValues) - 1, math.ceil(fraction * len(orderedValues)) - 1)]
+
+
+async def measurePacedLatency(limiter, rate: int, requestCount: int) -> Dict[str, float]:
+    """Measure acquisition latency for requests arriving exactly at the rate.
+
+    The limiter is first saturated with rate requests, so the queue
+    baseline and any GCRA burst allowance are full, then requests arrive
+    every 1/rate seconds. A limiter that is exactly at its rate should grant
+    each request as it arrives, so any wait is overhead.
+
+    Args:
+        limiter: Limiter exposing throttle() and close().
+        rate: Requests per second the limiter enforces.
+        requestCount: Number of paced requests to measure.
+
+    Returns:
+        dict: p50/p99/max acquisition latency in milliseconds.
+    """
+    latencies: List[float] = []
+
+    async def request(arrivalTime: float) -> None:
+        async with limiter.throttle():
+            latencies.append((time.monotonic() - arrivalTime) * 1000)
+
+    async def warmUp() -> None:
+        async with limiter.throttle():
+            pass
+
+    await asyncio.gather(*[warmUp() for _ in range(rate)])
+
+    startTime = time.monotonic()
+    tasks = []
+    for index in range(requestCount):
+        arrivalTime = startTime + (index + 1) / rate
+        await asyncio.sleep(max(0.0, arrivalTime - time.monotonic()))
+        tasks.append(asyncio.create_task(request(arrivalTime=time.monotonic())))
+
+    await asyncio.gather(*tasks)
+    await limiter.close()
+
+    return {
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 0.99),
+        "max": max(latencies),
+    }
+
+
+async def measureBurst(limiter, rate: int, requestCount: int) -> Dict[str, float]:
+    """Send a saturating batch of requests through a limiter at once.
+
+    Args:
+        limiter: Limiter exposing throttle() and close().
+        rate: Requests per second the limiter enforces.
+        requestCount: Number of requests in the batch.
+
+    Returns:
+        dict: Achieved rate after the first rate grants and number of grants
+            made out of arrival order.
+    """
+    grants: List[Tuple[int, float]] = []
+
+    async def request(index: int) -> None:
+        async with limiter.throttle():
+            grants.append((index, time.monotonic()))
+
+    await asyncio.gather(*[request(index) for index in range(requestCount)])
+    await limiter.close()
+
+    grantTimes = sorted(grantTime for _, grantTime in grants)
+    grantOrder = [index for index, _ in grants]
+
+    return {
+        "rate": (requestCount - rate) / max(1e-9, grantTimes[-1] - grantTimes[rate - 1]),
+        "outOfOrder": sum(1 for previous, current in zip(grantOrder, grantOrder[1:]) if current < previous),
+    }
+
+
+async def runBenchmark(rates: List[int]) -> None:
+    """Benchmark both limiters at each rate and print a comparison table.
+
+    Args:
+        rates: Requests per second to benchmark.
+    """
+    print(f"{'rate':>6} {'limiter':>10} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'burst req/s':>12} {'unfair':>7}")
+
+    for rate in rates:
+        requestCount = max(MIN_REQUESTS, int(rate * RUN_DURATION))
+
+        # "gcra" is the bucket KeyedRateLimiter ships (DEFAULT_BURST_SECONDS),
+        # "gcra-1" allows no burst beyond a single request
+        limiterFactories: List[Tuple[str, Callable[[], object]]] = [
+            ("queue", lambda: QueueRateLimiter(rate_limit=rate, concurrency_limit=rate + requestCount)),
+            ("gcra", lambda: KeyedRateLimiter(concurrency_limit=rate + requestCount).get_limiter(key="bench", rate_limit=rate)),
+            ("gcra-1", lambda: RateLimiter(rate_limit=rate, concurrency_limit=rate + requestCount, burst=1)),
+        ]
+
+        for limiterName, limiterFactory in limiterFactories:
+            latency = await measurePacedLatency(limiter=limiterFactory(), rate=rate, requestCount=requestCount)
+            burst = await measureBurst(limiter=limiterFactory(), rate=rate, requestCount=rate + requestCount)
+            print(
+                f"{rate:>6} {limiterName:>10} {latency['p50']:>9.2f} {latency['p99']:>9.2f} {latency['max']:>9.2f} "
+                f"{burst['rate']:>12.1f} {burst['outOfOrder']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    benchmarkRates = [int(rate) for rate in sys.argv[1:]] or DEFAULT_RATES
+    asyncio.run(runBenchmark(rates=benchmarkRates))
@@ -0,0 +1,171 @@
+"""Micro-benchmark for route collection from decoded transactions.
+
+Runs collectRoutes over synthetic decoded swap transactions of increasing
+size and reports the time per transaction, which stays flat when
+collection is linear. The previous collector, which looked up each
+transaction's position with list.index() and detected duplicate routes with
+a list scan, is run alongside as a baseline up to BASELINE_MAX_TRANSACTIONS,
+beyond which its quadratic cost makes runs impractically long.
+
+Usage:
+    python -m src.bench.bench_RouteCollector [transactions ...]
+"""
+
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.chain.decode.decode_Routes import ROUTE_PATH_SEPARATOR, collectRoutes
+from src.records.records_Transactions import DecodedTransaction
+
+# Transaction counts benchmarked when none are given
+DEFAULT_TRANSACTION_COUNTS = [10000, 25000, 50000, 100000]
+
+# Largest transaction count the quadratic baseline is run for
+BASELINE_MAX_TRANSACTIONS = 10000
+
+# Distinct tokens the synthetic swap paths are drawn from
+TOKEN_COUNT = 200
+
+# Fraction of synthetic transactions repeating an earlier route exactly
+DUPLICATE_FRACTION = 0.2
+
+# Seed so every run benchmarks the same transactions
+RANDOM_SEED = 1
+
+
+def collectRoutesWithListScans(decodedTransactions: List[DecodedTransaction]) -> Dict[str, List[Dict[str, Any]]]:
+    """The previous route collector, kept here only as the benchmark baseline.
+
+    Args:
+        decodedTransactions: Decoded transactions whose params include a path.
+
+    Returns:
+        Dict of unique routes per token pair.
+    """
+    collectedRoutes: Dict[str, List[Dict[str, Any]]] = {}
+
+    for decodedTransaction in decodedTransactions:
+
+        transactionIndex = decodedTransactions.index(decodedTransaction)
+
+        routeUsed = decodedTransaction.params["path"]
+        routeName = f"{routeUsed[0]}{ROUTE_PATH_SEPARATOR}{routeUsed[-1]}"
+
+        if routeUsed[0] != routeUsed[-1]:
+
+            if routeName not in collectedRoutes:
+                collectedRoutes[routeName] = []
+
+            routeObject = {
+                "method": decodedTransaction.name,
+                "route": ROUTE_PATH_SEPARATOR.join(routeUsed),
+                "blockNumber": decodedTransaction.blockNumber,
+                "amountIn": decodedTransaction.params.get("amountIn"),
+                "amountOutMin": decodedTransaction.params.get("amountOutMin")
+            }
+
+            if routeObject not in collectedRoutes[routeName]:
+                collectedRoutes[routeName].append(routeObject)
+
+    return collectedRoutes
+
+
+def buildDecodedTransactions(transactionCount: int) -> List[DecodedTransaction]:
+    """Build synthetic decoded swap transactions.
+
+    Paths of two to four hops are drawn from TOKEN_COUNT tokens, and a
+    DUPLICATE_FRACTION of transactions repeat an earlier route exactly.
+
+    Args:
+        transactionCount: Number of transactions to build.
+
+    Returns:
+        List of DecodedTransaction in block order.
+    """
+    randomGenerator = random.Random(RANDOM_SEED)
+    tokens = [f"0x{randomGenerator.getrandbits(160):040x}" for _ in range(TOKEN_COUNT)]
+
+    decodedTransactions: List[DecodedTransaction] = []
+    for index in range(transactionCount):
+
+        if decodedTransactions and randomGenerator.random() < DUPLICATE_FRACTION:
+            previousTransaction = randomGenerator.choice(decodedTransactions)
+            params = previousTransaction.params
+            blockNumber = previousTransaction.blockNumber
+        else:
+            params = {
+                "path": randomGenerator.sample(tokens, randomGenerator.randint(2, 4)),
+                "amountIn": randomGenerator.getrandbits(64),
+                "amountOutMin": randomGenerator.getrandbits(64)
+            }
+            blockNumber = 18000000 + index // 10
+
+        decodedTransactions.append(DecodedTransaction(
+            name="swapExactTokensForTokens",
+            params=params,
+            schema=[],
+            blockNumber=blockNumber,
+            txHash=f"0x{index:064x}",
+            timestamp=str(1700000000 + index)
+        ))
+
+    return decodedTransactions
+
+
+def timeCollector(collector: Callable[[], Any]) -> float:
+    """Time a single run of a collector.
+
+    Args:
+        collector: Callable running the collection.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    startTime = time.perf_counter()
+    collector()
+    return time.perf_counter() - startTime
+
+
+def runBenchmark(transactionCounts: List[int]) -> None:
+    """Benchmark both collectors at each size and print a comparison table.
+
+    Args:
+        transactionCounts: Numbers of decoded transactions to benchmark.
+    """
+    print(f"{'transactions':>12} {'routes':>8} {'hashed s':>9} {'us/tx':>7} {'list scan s':>12} {'us/tx':>7}")
+
+    for transactionCount in transactionCounts:
+        decodedTransactions = buildDecodedTransactions(transactionCount=transactionCount)
+
+        collectedRoutes, _ = collectRoutes(
+            dexName="bench",
+            decodedTransactions=decodedTransactions,
+            transactionCount=transactionCount
+        )
+        hashedSeconds = timeCollector(lambda: collectRoutes(
+            dexName="bench",
+            decodedTransactions=decodedTransactions,
+            transactionCount=transactionCount
+        ))
+
+        baselineSeconds: Optional[float] = None
+        if transactionCount <= BASELINE_MAX_TRANSACTIONS:
+            assert collectRoutesWithListScans(decodedTransactions=decodedTransactions) == collectedRoutes
+            baselineSeconds = timeCollector(lambda: collectRoutesWithListScans(decodedTransactions=decodedTransactions))
+
+        routeCount = sum(len(routes) for routes in collectedRoutes.values())
+        baselineColumns = (
+            f"{baselineSeconds:>12.3f} {baselineSeconds / transactionCount * 1e6:>7.1f}"
+            if baselineSeconds is not None else f"{'-':>12} {'-':>7}"
+        )
+        print(
+            f"{transactionCount:>12} {routeCount:>8} {hashedSeconds:>9.3f} "
+            f"{hashedSeconds / transactionCount * 1e6:>7.1f} {baselineColumns}"
+        )
+
+
+if __name__ == "__main__":
+    benchmarkTransactionCounts = [int(count) for count in sys.argv[1:]] or DEFAULT_TRANSACTION_COUNTS
+    runBenchmark(transactionCounts=benchmarkTransactionCounts)
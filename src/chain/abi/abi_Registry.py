@@ -0,0 +1,118 @@
+"""Content-addressed ABI registry.
+
+Many DEXs are forks of the same router and load byte-identical ABIs. This
+module interns each ABI once under a SHA-256 digest of its JSON source,
+computed when the ABI is loaded, so every cache further down (parsed ABIs,
+selector indexes, contracts) is keyed by that short digest instead of the
+multi-kilobyte ABI string and holds one entry per distinct ABI rather than
+per DEX.
+
+Eviction Policy:
+    ABI sources are kept for the whole run since they are needed to rebuild
+    anything evicted, and there is one per distinct ABI. Parsed ABIs are held
+    in an LRU cache bounded by ABI_CACHE_SIZE; an evicted ABI is parsed again
+    from its source on next use.
+
+Usage:
+    >>> abiDigest = registerAbi(abiJson)
+    >>> parsedAbi = getParsedAbi(abiDigest)
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from src.utils.env.env_Environment import getAbiCacheSize
+
+# Type alias for parsed ABI as a list of function/event definitions
+ParsedABIType = List[Dict[str, Any]]
+
+# ABI JSON source by digest, one entry per distinct ABI
+abiSources: Dict[str, str] = {}
+
+# Parsed ABIs by digest, least recently used first
+parsedAbis: "OrderedDict[str, ParsedABIType]" = OrderedDict()
+parsedAbisLock = threading.Lock()
+
+
+def getAbiDigest(abi: str) -> str:
+    """Compute the content digest identifying an ABI.
+
+    Args:
+        abi: The contract ABI as a JSON string.
+
+    Returns:
+        str: Hex SHA-256 digest of the ABI source.
+    """
+    return hashlib.sha256(abi.encode("utf-8")).hexdigest()
+
+
+def registerAbi(abi: str) -> str:
+    """Intern an ABI and return the digest to refer to it by.
+
+    Registering an ABI that is already known keeps the existing source, so
+    DEXs sharing an ABI share a single copy of it.
+
+    Args:
+        abi: The contract ABI as a JSON string.
+
+    Returns:
+        str: The ABI's digest.
+    """
+    abiDigest = getAbiDigest(abi=abi)
+    abiSources.setdefault(abiDigest, abi)
+    return abiDigest
+
+
+def getAbiSource(abiDigest: str) -> str:
+    """Get the interned JSON source of a registered ABI.
+
+    Args:
+        abiDigest: Digest returned by registerAbi.
+
+    Returns:
+        str: The ABI JSON string.
+
+    Raises:
+        KeyError: If no ABI with that digest has been registered.
+    """
+    return abiSources[abiDigest]
+
+
+def getParsedAbi(abiDigest: str) -> ParsedABIType:
+    """Get a registered ABI parsed, from the LRU cache when possible.
+
+    Decode and download threads share the cache, so reordering and eviction
+    are guarded. Parsing happens outside the lock; two threads missing the
+    same digest both parse it and the second result is discarded.
+
+    Args:
+        abiDigest: Digest returned by registerAbi.
+
+    Returns:
+        ParsedABIType: The parsed ABI, shared by every DEX using it.
+
+    Raises:
+        KeyError: If no ABI with that digest has been registered.
+        json.JSONDecodeError: If the ABI source is not valid JSON.
+    """
+    with parsedAbisLock:
+        if abiDigest in parsedAbis:
+            parsedAbis.move_to_end(abiDigest)
+            return parsedAbis[abiDigest]
+
+    parsedAbi: ParsedABIType = json.loads(getAbiSource(abiDigest=abiDigest))
+    abiCacheSize = getAbiCacheSize()
+
+    with parsedAbisLock:
+        if abiDigest in parsedAbis:
+            parsedAbis.move_to_end(abiDigest)
+            return parsedAbis[abiDigest]
+
+        parsedAbis[abiDigest] = parsedAbi
+        while len(parsedAbis) > abiCacheSize:
+            parsedAbis.popitem(last=False)
+
+    return parsedAbi
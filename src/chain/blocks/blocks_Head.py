@@ -0,0 +1,101 @@
+"""Chain head lookup utilities.
+
+This module resolves the latest block number of each network with a single
+async JSON-RPC eth_blockNumber call per distinct RPC URL, sent over the
+endpoint's pooled session from utils_web3. Lookups for every
+RPC URL run concurrently and results are cached for CHAIN_HEAD_TTL seconds,
+so every DEX on a network shares the same chain head.
+"""
+
+import asyncio
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import aiohttp
+
+from src.chain.utils.utils_web3 import getAsyncRpcSession, recordProviderRequest
+from src.utils.env.env_Environment import getChainHeadTTL
+from src.utils.logging.logging_Setup import getProjectLogger
+
+logger = getProjectLogger()
+
+# JSON-RPC method returning the latest block number as a hex string
+BLOCK_NUMBER_METHOD = "eth_blockNumber"
+
+# Cached chain heads keyed by RPC URL: (block number, monotonic fetch time)
+chainHeadCache: Dict[str, Tuple[int, float]] = {}
+
+
+async def fetchLatestBlockNumber(clientSession: aiohttp.ClientSession, chainRpcURL: str) -> int:
+    """Request the latest block number from an RPC endpoint.
+
+    Args:
+        clientSession: aiohttp session for making HTTP requests.
+        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
+
+    Returns:
+        int: The latest block number.
+
+    Raises:
+        ValueError: If the endpoint returns a JSON-RPC error or no result.
+        aiohttp.ClientError: If the request fails.
+    """
+    payload = {"jsonrpc": "2.0", "id": 1, "method": BLOCK_NUMBER_METHOD, "params": []}
+
+    recordProviderRequest(chainRpcURL)
+
+    async with clientSession.post(chainRpcURL, json=payload) as rpcResponse:
+        rpcResult = await rpcResponse.json(content_type=None)
+
+    if not isinstance(rpcResult, dict) or "result" not in rpcResult:
+        raise ValueError(f"{BLOCK_NUMBER_METHOD} failed: {rpcResult}")
+
+    return int(rpcResult["result"], 16)
+
+
+async def getLatestBlockNumbers(
+    chainRpcURLs: Iterable[str],
+    maxAge: Optional[float] = None
+) -> Dict[str, Optional[int]]:
+    """Resolve the latest block number of several networks concurrently.
+
+    Each distinct RPC URL is queried at most once over its pooled RPC
+    session; URLs resolved within the last CHAIN_HEAD_TTL seconds are served
+    from the cache.
+
+    Args:
+        chainRpcURLs: RPC URLs of the networks to resolve. Duplicates are ignored.
+        maxAge: Seconds a cached head may be reused, overriding CHAIN_HEAD_TTL.
+            0 always queries the endpoints.
+
+    Returns:
+        Dict mapping each RPC URL to its latest block number, or None if the
+        lookup failed.
+    """
+    chainHeadTTL = getChainHeadTTL() if maxAge is None else maxAge
+    now = time.monotonic()
+
+    chainHeads: Dict[str, Optional[int]] = {}
+    urlsToFetch = []
+    for chainRpcURL in dict.fromkeys(chainRpcURLs):
+        cachedHead = chainHeadCache.get(chainRpcURL)
+        if cachedHead and now - cachedHead[1] < chainHeadTTL:
+            chainHeads[chainRpcURL] = cachedHead[0]
+        else:
+            urlsToFetch.append(chainRpcURL)
+
+    results = await asyncio.gather(
+        *[fetchLatestBlockNumber(clientSession=getAsyncRpcSession(url), chainRpcURL=url) for url in urlsToFetch],
+        return_exceptions=True
+    )
+
+    fetchedAt = time.monotonic()
+    for chainRpcURL, result in zip(urlsToFetch, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Failed to get latest block from {chainRpcURL}: {result!r}")
+            chainHeads[chainRpcURL] = None
+        else:
+            chainHeadCache[chainRpcURL] = (result, fetchedAt)
+            chainHeads[chainRpcURL] = result
+
+    return chainHeads
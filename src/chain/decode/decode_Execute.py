@@ -32,23 +32,27 @@ Route Format:
 # Decode execute transaction type and extract function calls
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 # TODO: Support dynamic contract function signature resolution
 # Process nested execute calls in multi-hop routes
 # Validate execution parameters before processing transaction
 
+from src.chain.decode.decode_Parallel import DecodePool
+from src.chain.decode.decode_Routes import collectRoutes
+from src.chain.decode.decode_Selectors import filterSwapTransactions
 from src.chain.decode.decode_Tx import decodeTx
-from src.db.actions.actions_Routes import addRouteToDB
-from src.utils.logging.logging_Print import printSeparator
+from src.db.actions.actions_Routes import addRoutesToDB
+from src.db.cache.cache_Tokens import TokenIdResolver
+from src.records.records_Dexs import DexRecord
+from src.records.records_Routes import RouteRow
+from src.records.records_Transactions import DecodedTransaction, FetchedTransaction
+from src.utils.env.env_Environment import INGESTION_SOURCE_LOGS, getIngestionSource
 from src.utils.logging.logging_Setup import getProjectLogger
 
 # Decode execute function calls and parameters
 # Trace execution flow through decoded transaction data
 logger = getProjectLogger()
 
-# Separator used to join token addresses in route paths
-ROUTE_PATH_SEPARATOR = "-"
-
 """Execute decoded transaction data through validator."""
 # Minimum number of tokens in a valid swap path (at least token in and token out)
 MIN_SWAP_PATH_LENGTH = 2
@@ -58,124 +62,102 @@ MAX_SWAP_PATH_LENGTH = 10
 
 # TODO: Validate transaction execution status before storing results
 
-def decodeTransactions(dbConnection: Any, dexs: List[Dict[str, Any]]) -> int:
-    """Decode transactions and extract swap routes for multiple DEXs.
+def collectDexRoutes(
+    dex: DexRecord,
+    dexTransactions: List[FetchedTransaction],
+    decodePool: Optional[DecodePool] = None
+) -> List[RouteRow]:
+    """Decode a DEX's transactions and extract its swap routes.
 
-    Iterates through DEX configurations, decodes their transactions using
-    the router ABI, and stores valid swap routes in the database. Filters
-    out invalid transactions and loop routes (where input equals output).
+    Drops failed and non-swap transactions by their selector, decodes the
+    rest using the router ABI, filters out invalid transactions and loop
+    routes (where input equals output), and stores the unique routes per
+    token pair on the DEX under 'routes'. Swap paths reconstructed from
+    Swap logs are already decoded and go straight to route collection.
 
     Args:
-        dbConnection: Active database connection for storing routes.
-        dexs: List of DEX configurations, each containing:
-            - dex_id: Database ID of the DEX
-            - name: DEX name for logging
-            - router: Router contract address
-"""Execute and process decoded transactions from chains."""
-            - router_abi: ABI for decoding transactions
-# Executes function selector matching against decoded signatures
-            - network_details: Network info with network_id and name
-            - transactions: Optional list of transactions to decode
+        dex: DEX configuration containing name, router and router_abi_digest.
+        dexTransactions: Transactions fetched for the DEX's router, or swap
+            paths with INGESTION_SOURCE=logs.
+        decodePool: Worker pool to decode in, decodes in the calling thread if None.
 
     Returns:
-# TODO: Add error handling for execution failures
-# TODO: Implement fallback decoding strategy for unhandled types
-        int: Total number of routes successfully added to the database.
+        List of route rows ready to be uploaded with addRoutesToDB.
     """
-    routesAdded = 0
-
-    for dex in dexs:
-
-        # Dex
-        dexDbId = dex["dex_id"]
-        dexName = dex["name"].title()
-        dexRouterAddress = dex["router"]
-        dexRouterABI = dex["router_abi"]
-
-        # Network
-        networkDetails = dex["network_details"]
-        networkName = networkDetails["name"].title()
-        networkDbId = networkDetails["network_id"]
-
-        if "transactions" in dex:
-
-            dexTransactions = dex["transactions"]
-            dexTransactionCount = len(dexTransactions)
-
-            logger.info(f"{networkName}")
-
-            printSeparator()
-
-            # Create the dict of decode tasks
-            decodedTransactions = [decodeTx(address=dexRouterAddress, transaction=transaction, abi=dexRouterABI) for transaction in dexTransactions]
-
-            # Filter out the invalid results
-            finalDecodedTransactions = [decodedTransaction for decodedTransaction in decodedTransactions if isinstance(decodedTransaction, dict) and "path" in decodedTransaction["params"]]
-
-            collectedRoutes: Dict[str, List[Dict[str, Any]]] = {}
-
-            for finalDecodedTransaction in finalDecodedTransactions:
-
-                transactionIndex = finalDecodedTransactions.index(finalDecodedTransaction)
-
-                routeUsed = finalDecodedTransaction["params"]["path"]
+    dexName = dex.name.title()
+    dexRouterAddress = dex.router
+    dexRouterAbiDigest = dex.router_abi_digest
+    dexTransactionCount = len(dexTransactions)
+
+    if getIngestionSource() == INGESTION_SOURCE_LOGS:
+        collectedRoutes, routesToUpload = collectRoutes(
+            dexName=dexName,
+            decodedTransactions=dexTransactions,
+            transactionCount=dexTransactionCount
+        )
+        dex.routes = collectedRoutes
+        return routesToUpload
+
+    # Drop failed and non-swap transactions from their selector alone
+    if dexRouterAbiDigest is not None:
+        try:
+            dexTransactions = filterSwapTransactions(transactions=dexTransactions, abiDigest=dexRouterAbiDigest)
+        except ValueError as e:
+            logger.warning(f"{dexName}: Router ABI could not be indexed, decoding all transactions: {e}")
+
+        logger.info(f"{dexName}: {len(dexTransactions)}/{dexTransactionCount} Swap Transactions")
+
+    # Create the dict of decode tasks
+    if decodePool is not None:
+        decodedTransactions = decodePool.decodeTransactions(dex=dex, dexTransactions=dexTransactions)
+    else:
+        decodedTransactions = [decodeTx(address=dexRouterAddress, transaction=transaction, abiDigest=dexRouterAbiDigest) for transaction in dexTransactions]
+
+    # Filter out the invalid results
+    finalDecodedTransactions = [decodedTransaction for decodedTransaction in decodedTransactions if isinstance(decodedTransaction, DecodedTransaction) and "path" in decodedTransaction.params]
+
+    collectedRoutes, routesToUpload = collectRoutes(
+        dexName=dexName,
+        decodedTransactions=finalDecodedTransactions,
+        transactionCount=dexTransactionCount
+    )
+
+    dex.routes = collectedRoutes
+
+    return routesToUpload
+
+
+def uploadDexRoutes(
+    dbConnection: Any,
+    dex: DexRecord,
+    routes: List[RouteRow],
+    tokenResolver: Optional[TokenIdResolver] = None
+) -> int:
+    """Upload a DEX's routes as one batched transaction.
+
+    The DEX's checkpoint is advanced to its end_block in the same
+    transaction, so a failed upload is retried from the same block next run.
 
-                tokenInAddress = routeUsed[0]
-                tokenOutAddress = routeUsed[-1]
-
-                # Create unique identifier for this token pair
-                routeName = f"{tokenInAddress}{ROUTE_PATH_SEPARATOR}{tokenOutAddress}"
-
-                # Skip loop routes where input and output are the same token
-                isLoopRoute = tokenInAddress == tokenOutAddress
-
-                if not isLoopRoute:
-
-                    # Initialize route collection for this token pair if needed
-                    if routeName not in collectedRoutes:
-                        collectedRoutes[routeName] = []
-
-                    # Build route object with transaction details
-                    routeObject = {
-                        "method": finalDecodedTransaction["name"],
-                        "route": ROUTE_PATH_SEPARATOR.join(routeUsed),
-                        "blockNumber": finalDecodedTransaction["blockNumber"]
-                    }
-
-                    if "amountIn" in finalDecodedTransaction["params"]:
-                        routeObject["amountIn"] = finalDecodedTransaction["params"]["amountIn"]
-                    else:
-                        routeObject["amountIn"] = None
-
-                    if "amountOutMin" in finalDecodedTransaction["params"]:
-                        routeObject["amountOutMin"] = finalDecodedTransaction["params"]["amountOutMin"]
-                    else:
-                        routeObject["amountOutMin"] = None
-
-                    if routeObject not in collectedRoutes[routeName]:
-                        collectedRoutes[routeName].append(routeObject)
-
-                    addRouteToDB(
-                        dbConnection=dbConnection,
-                        networkDbId=networkDbId,
-                        dexDbId=dexDbId,
-                        tokenInAddress=tokenInAddress,
-                        tokenOutAddress=tokenOutAddress,
-                        route=routeObject["route"],
-                        method=routeObject["method"],
-                        transactionHash=finalDecodedTransaction["txHash"],
-                        txTimestamp=finalDecodedTransaction["timestamp"],
-                        blockNumber=finalDecodedTransaction["blockNumber"],
-                        amountIn=routeObject["amountIn"],
-                        amountOut=routeObject["amountOutMin"]
-                    )
-
-                    routesAdded = routesAdded + 1
+    Args:
+        dbConnection: Active database connection for storing routes.
+        dex: DEX configuration containing dex_id, network_details and end_block.
+        routes: Route rows produced by collectDexRoutes.
+        tokenResolver: Shared token ID cache used when uploading routes.
 
-                    logger.info(f"{dexName} {transactionIndex + 1}/{dexTransactionCount}")
+    Returns:
+        int: Number of routes added to the database.
+    """
+    dexName = dex.name.title()
 
-            dex["routes"] = collectedRoutes
+    insertedCounts = addRoutesToDB(
+        dbConnection=dbConnection,
+        networkDbId=dex.network_details.network_id,
+        dexDbId=dex.dex_id,
+        routes=routes,
+        tokenResolver=tokenResolver,
+        checkpointBlock=dex.end_block
+    )
 
-            printSeparator(True)
+    logger.info(f"{dexName}: Uploaded {sum(insertedCounts)}/{len(routes)} Routes")
 
-    return routesAdded
+    return sum(insertedCounts)
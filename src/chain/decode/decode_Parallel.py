@@ -0,0 +1,243 @@
+"""Parallel transaction decoding across worker processes.
+
+ABI decoding through contract.decode_function_input is pure-Python CPU work,
+so decoding a large DEX in one thread keeps a single core busy. This module
+shards a DEX's transactions across a ProcessPoolExecutor instead.
+
+Each worker is initialised once with every distinct router ABI and each
+DEX's router address and ABI digest, and builds the router contracts and
+selector decoders up front, so tasks only carry the DEX ID and a chunk of
+transactions and ABIs are never pickled per task.
+
+If a worker dies (OOM kill, segfault) the executor is broken for good, so the
+pool replaces it with a freshly initialised one and retries the DEX once.
+
+Usage:
+    >>> with DecodePool(dexs=dexs, workers=4) as decodePool:
+    ...     decodedTransactions = decodePool.decodeTransactions(dex=dex, dexTransactions=transactions)
+"""
+
+import math
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.chain.abi.abi_Contract import getContract
+from src.chain.abi.abi_Registry import getAbiSource, registerAbi
+from src.chain.decode.decode_Selectors import getSelectorIndex
+from src.chain.decode.decode_Tx import DecodeError, decodeTx
+from src.records.records_Dexs import DexRecord
+from src.records.records_Transactions import DecodedTransaction, RawTransaction
+from src.utils.logging.logging_Setup import getProjectLogger
+
+logger = getProjectLogger()
+
+# Chunks submitted per worker for each DEX, so uneven chunks still balance out
+DECODE_CHUNKS_PER_WORKER = 4
+
+# Smallest chunk worth the cost of sending it to another process
+MIN_DECODE_CHUNK_SIZE = 64
+
+# Router address and ABI digest of each DEX, keyed by DEX ID (set in each worker)
+workerRouterAbis: Dict[int, Tuple[str, Optional[str]]] = {}
+
+
+def initDecodeWorker(
+    abiSources: List[str],
+    routerAbis: Dict[int, Tuple[str, Optional[str]]]
+) -> None:
+    """Load the router ABIs into a worker process and build their decoders.
+
+    Args:
+        abiSources: JSON source of every distinct router ABI.
+        routerAbis: Router address and ABI digest keyed by DEX ID.
+    """
+    for abiSource in abiSources:
+        registerAbi(abi=abiSource)
+
+    workerRouterAbis.update(routerAbis)
+
+    for routerAddress, routerAbiDigest in routerAbis.values():
+        if routerAbiDigest is None:
+            continue
+        try:
+            getSelectorIndex(routerAbiDigest)
+            getContract(routerAddress, routerAbiDigest)
+        except Exception:
+            # decodeTx reports the same error for every transaction of this DEX
+            continue
+
+
+def decodeTransactionChunk(
+    dexDbId: int,
+    transactions: List[RawTransaction]
+) -> List[Union[DecodedTransaction, DecodeError]]:
+    """Decode a chunk of one DEX's transactions inside a worker process.
+
+    Args:
+        dexDbId: The DEX whose router ABI the transactions are decoded with.
+        transactions: Transactions sent to the DEX's router.
+
+    Returns:
+        List of decodeTx results in the same order as transactions.
+    """
+    routerAddress, routerAbiDigest = workerRouterAbis[dexDbId]
+
+    return [decodeTx(address=routerAddress, transaction=transaction, abiDigest=routerAbiDigest) for transaction in transactions]
+
+
+def getDecodeChunkSize(transactionCount: int, workers: int) -> int:
+    """Get how many transactions to send to a worker at a time.
+
+    Args:
+        transactionCount: Number of transactions to decode.
+        workers: Number of worker processes.
+
+    Returns:
+        int: Chunk size of at least MIN_DECODE_CHUNK_SIZE.
+    """
+    return max(MIN_DECODE_CHUNK_SIZE, math.ceil(transactionCount / (workers * DECODE_CHUNKS_PER_WORKER)))
+
+
+class DecodePool:
+    """Pool of decode worker processes pre-loaded with the DEX router ABIs.
+
+    Attributes:
+        workers: Number of worker processes.
+        executor: The underlying process pool, replaced when it breaks.
+    """
+
+    def __init__(self, dexs: List[DexRecord], workers: int) -> None:
+        """Start the worker processes.
+
+        Args:
+            dexs: DEX configurations containing dex_id, router and router_abi_digest.
+            workers: Number of worker processes.
+        """
+        routerAbis = {dex.dex_id: (dex.router, dex.router_abi_digest) for dex in dexs}
+        abiSources = [
+            getAbiSource(abiDigest=abiDigest)
+            for abiDigest in {routerAbiDigest for _, routerAbiDigest in routerAbis.values() if routerAbiDigest is not None}
+        ]
+
+        self.workers = workers
+        self.routerAbis = routerAbis
+        self.abiSources = abiSources
+        self.executorLock = threading.Lock()
+        self.closed = False
+        self.executor = self.startExecutor()
+
+        logger.info(f"[Decode] Started {workers} decode workers for {len(routerAbis)} DEXs, {len(abiSources)} ABIs")
+
+    def startExecutor(self) -> ProcessPoolExecutor:
+        """Start a process pool whose workers are initialised with the router ABIs.
+
+        Returns:
+            The new process pool.
+        """
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=initDecodeWorker,
+            initargs=(self.abiSources, self.routerAbis)
+        )
+
+    def replaceBrokenExecutor(self, brokenExecutor: ProcessPoolExecutor) -> None:
+        """Replace a broken process pool with a new one.
+
+        Several threads can see the same pool break, only the first replaces it.
+        A pool that has been shut down is not restarted.
+
+        Args:
+            brokenExecutor: The pool that raised BrokenProcessPool.
+        """
+        with self.executorLock:
+            if self.closed or self.executor is not brokenExecutor:
+                return
+
+            brokenExecutor.shutdown(wait=False, cancel_futures=True)
+            self.executor = self.startExecutor()
+
+        logger.warning(f"[Decode] Decode worker died, restarted {self.workers} decode workers")
+
+    def decodeTransactions(
+        self,
+        dex: DexRecord,
+        dexTransactions: List[RawTransaction]
+    ) -> List[Union[DecodedTransaction, DecodeError]]:
+        """Decode a DEX's transactions in parallel across the workers.
+
+        Transactions are split into chunks that are decoded concurrently and
+        collected chunk by chunk in their original order. If a worker dies the
+        pool is restarted and the DEX is decoded again once.
+
+        Args:
+            dex: The DEX the transactions were sent to, one of the pool's DEXs.
+            dexTransactions: Transactions to decode.
+
+        Returns:
+            List of decodeTx results in the same order as dexTransactions.
+
+        Raises:
+            BrokenProcessPool: If a worker also dies while retrying.
+        """
+        chunkSize = getDecodeChunkSize(transactionCount=len(dexTransactions), workers=self.workers)
+        transactionChunks = [dexTransactions[index:index + chunkSize] for index in range(0, len(dexTransactions), chunkSize)]
+
+        executor = self.executor
+        try:
+            return self.decodeTransactionChunks(executor=executor, dexId=dex.dex_id, transactionChunks=transactionChunks)
+        except BrokenProcessPool:
+            self.replaceBrokenExecutor(brokenExecutor=executor)
+
+        return self.decodeTransactionChunks(executor=self.executor, dexId=dex.dex_id, transactionChunks=transactionChunks)
+
+    @staticmethod
+    def decodeTransactionChunks(
+        executor: ProcessPoolExecutor,
+        dexId: int,
+        transactionChunks: List[List[RawTransaction]]
+    ) -> List[Union[DecodedTransaction, DecodeError]]:
+        """Decode transaction chunks on a process pool.
+
+        Args:
+            executor: Pool to decode on.
+            dexId: ID of the DEX the transactions were sent to.
+            transactionChunks: Chunks of transactions to decode.
+
+        Returns:
+            List of decodeTx results in chunk order.
+        """
+        decodedTransactions: List[Union[DecodedTransaction, DecodeError]] = []
+        for decodedChunk in executor.map(decodeTransactionChunk, repeat(dexId), transactionChunks):
+            decodedTransactions.extend(decodedChunk)
+
+        return decodedTransactions
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes.
+
+        Args:
+            wait: Whether to block until pending chunks are decoded and the
+                workers have exited. Otherwise pending chunks are cancelled
+                and the workers exit in the background.
+        """
+        with self.executorLock:
+            self.closed = True
+            executor = self.executor
+
+        executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> 'DecodePool':
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object]
+    ) -> None:
+        """Context manager exit, stops the workers."""
+        self.shutdown()
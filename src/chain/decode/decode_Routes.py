@@ -0,0 +1,102 @@
+"""Route collection from decoded router transactions.
+
+Turns a DEX's decoded swap transactions into the unique routes per token pair
+and the route rows to upload. Each transaction is visited once: its position
+comes from enumerate and duplicate routes are detected with a set of hashed
+route keys, so collection is linear in the number of transactions.
+
+Route Key:
+    A route is a duplicate when another route on the DEX has the same
+    (method, route, blockNumber, amountIn, amountOutMin).
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.records.records_Routes import RouteRow
+from src.records.records_Transactions import DecodedTransaction
+from src.utils.logging.logging_Setup import getProjectLogger
+
+logger = getProjectLogger()
+
+# Separator used to join token addresses in route paths
+ROUTE_PATH_SEPARATOR = "-"
+
+# Hashable identity of a collected route
+RouteKey = Tuple[str, str, int, Optional[Any], Optional[Any]]
+
+
+def collectRoutes(
+    dexName: str,
+    decodedTransactions: List[DecodedTransaction],
+    transactionCount: int
+) -> Tuple[Dict[str, List[Dict[str, Any]]], List[RouteRow]]:
+    """Extract the routes of a DEX's decoded swap transactions.
+
+    Loop routes, where the input token is also the output token, are
+    skipped. Every other transaction produces a route row, and each distinct
+    route is collected once under its token pair.
+
+    Args:
+        dexName: DEX name for logging purposes.
+        decodedTransactions: Decoded transactions whose params include a path.
+        transactionCount: Number of transactions fetched for the DEX, for logging.
+
+    Returns:
+        Tuple containing:
+            - Dict: Unique routes per "tokenIn-tokenOut" pair.
+            - List: Route rows ready to be uploaded with addRoutesToDB.
+    """
+    collectedRoutes: Dict[str, List[Dict[str, Any]]] = {}
+    collectedRouteKeys: Set[RouteKey] = set()
+    routesToUpload: List[RouteRow] = []
+
+    for transactionIndex, decodedTransaction in enumerate(decodedTransactions):
+
+        routeUsed = decodedTransaction.params["path"]
+
+        tokenInAddress = routeUsed[0]
+        tokenOutAddress = routeUsed[-1]
+
+        # Skip loop routes where input and output are the same token
+        if tokenInAddress == tokenOutAddress:
+            continue
+
+        # Create unique identifier for this token pair
+        routeName = f"{tokenInAddress}{ROUTE_PATH_SEPARATOR}{tokenOutAddress}"
+
+        # Build route object with transaction details
+        routeObject = {
+            "method": decodedTransaction.name,
+            "route": ROUTE_PATH_SEPARATOR.join(routeUsed),
+            "blockNumber": decodedTransaction.blockNumber,
+            "amountIn": decodedTransaction.params.get("amountIn"),
+            "amountOutMin": decodedTransaction.params.get("amountOutMin")
+        }
+
+        routeKey: RouteKey = (
+            routeObject["method"],
+            routeObject["route"],
+            routeObject["blockNumber"],
+            routeObject["amountIn"],
+            routeObject["amountOutMin"]
+        )
+
+        if routeKey not in collectedRouteKeys:
+            collectedRouteKeys.add(routeKey)
+            collectedRoutes.setdefault(routeName, []).append(routeObject)
+
+        routesToUpload.append({
+            "tokenInAddress": tokenInAddress,
+            "tokenOutAddress": tokenOutAddress,
+            "route": routeObject["route"],
+            "method": routeObject["method"],
+            "transactionHash": decodedTransaction.txHash,
+            "txTimestamp": decodedTransaction.timestamp,
+            "blockNumber": decodedTransaction.blockNumber,
+            "amountIn": routeObject["amountIn"],
+            "amountOut": routeObject["amountOutMin"]
+        })
+
+        logger.debug(f"{dexName} {transactionIndex + 1}/{transactionCount}")
+
+    return collectedRoutes, routesToUpload
@@ -0,0 +1,272 @@
+"""Selector-indexed decoding of router function calls.
+
+web3's decode_function_input matches the selector against every function in
+the ABI and builds a new decoder for each transaction. This module compiles
+an ABI once into an index from 4-byte selector to a prebuilt eth_abi tuple
+decoder and the function's input schema, so decoding a transaction is a dict
+lookup plus a single decoder call.
+
+Functions without a swap path (approve, addLiquidity, ...) are marked in the
+index so their transactions can be rejected before any decoding, and
+filterSwapTransactions drops them, along with failed transactions, from
+the input selector alone; getSwapTransactionFilter does the same while an
+explorer response is parsed. Decoded addresses are checksummed, arrays
+become lists and structs tuples, matching the values decode_function_input
+returns.
+"""
+
+from functools import lru_cache, partial, wraps
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, TypeVar
+
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.registry import registry
+from eth_utils import collapse_if_tuple, function_abi_to_4byte_selector, to_checksum_address, to_hex
+
+from src.chain.abi.abi_Registry import getParsedAbi
+from src.records.records_Transactions import RawTransaction
+from src.utils.env.env_Environment import getAbiCacheSize
+
+# Length of '0x' plus the 4-byte function selector in hex input data
+SELECTOR_LENGTH = 10
+
+# Swap functions are the router functions taking a token path
+SWAP_PATH_PARAM_NAME = "path"
+SWAP_PATH_PARAM_TYPE = "address[]"
+
+# Explorer isError value of transactions that reverted
+TX_ERROR_FLAG = "1"
+
+ADDRESS_TYPE = "address"
+TUPLE_TYPE = "tuple"
+ARRAY_SUFFIX = "]"
+
+CachedValue = TypeVar("CachedValue")
+
+
+class SelectorEntry(NamedTuple):
+    """Precompiled decoding information for one ABI function.
+
+    Attributes:
+        name: Function name.
+        schema: ABI inputs of the function.
+        decoder: Prebuilt eth_abi decoder for the function's argument tuple.
+        isSwap: Whether the function takes a swap path.
+    """
+    name: str
+    schema: List[Dict[str, Any]]
+    decoder: TupleDecoder
+    isSwap: bool
+
+
+def isSwapFunction(abiEntry: Dict[str, Any]) -> bool:
+    """Check whether an ABI function takes a swap path argument.
+
+    Args:
+        abiEntry: ABI function entry.
+
+    Returns:
+        bool: True if one of the inputs is the address[] path.
+    """
+    return any(
+        abiInput.get("name") == SWAP_PATH_PARAM_NAME and abiInput.get("type") == SWAP_PATH_PARAM_TYPE
+        for abiInput in abiEntry.get("inputs", [])
+    )
+
+
+def abiDigestCache(function: Callable[[str], CachedValue]) -> Callable[[str], CachedValue]:
+    """Cache a function of an ABI digest, keeping up to ABI_CACHE_SIZE results.
+
+    The cache is created on the first call rather than at import, so an
+    ABI_CACHE_SIZE loaded from .env after this module is imported still applies.
+
+    Args:
+        function: Function taking an ABI digest.
+
+    Returns:
+        The function wrapped in an LRU cache.
+    """
+    cachedFunction: Optional[Callable[[str], CachedValue]] = None
+
+    @wraps(function)
+    def getCached(abiDigest: str) -> CachedValue:
+        nonlocal cachedFunction
+        if cachedFunction is None:
+            cachedFunction = lru_cache(maxsize=getAbiCacheSize())(function)
+        return cachedFunction(abiDigest)
+
+    return getCached
+
+
+@abiDigestCache
+def getSelectorIndex(abiDigest: str) -> Dict[str, SelectorEntry]:
+    """Compile an ABI into a selector-indexed decoder table.
+
+    Cached per ABI digest, so each distinct ABI is compiled once per process
+    and shared by every DEX using it, for up to ABI_CACHE_SIZE ABIs.
+
+    Args:
+        abiDigest: Digest of an ABI added with abi_Registry.registerAbi.
+
+    Returns:
+        Dict mapping lower-case '0x' prefixed selectors to their SelectorEntry.
+
+    Raises:
+        KeyError: If the ABI digest has not been registered.
+        json.JSONDecodeError: If the ABI is not valid JSON.
+    """
+    parsedAbi = getParsedAbi(abiDigest=abiDigest)
+
+    selectorIndex: Dict[str, SelectorEntry] = {}
+    for abiEntry in parsedAbi:
+        if abiEntry.get("type") != "function":
+            continue
+
+        schema = abiEntry.get("inputs", [])
+        selector = to_hex(function_abi_to_4byte_selector(abiEntry))
+
+        selectorIndex[selector] = SelectorEntry(
+            name=abiEntry["name"],
+            schema=schema,
+            decoder=TupleDecoder(decoders=[registry.get_decoder(collapse_if_tuple(abiInput)) for abiInput in schema]),
+            isSwap=isSwapFunction(abiEntry=abiEntry)
+        )
+
+    return selectorIndex
+
+
+def normaliseDecodedValue(abiInput: Dict[str, Any], value: Any) -> Any:
+    """Normalise a decoded value the way web3 does for function inputs.
+
+    Args:
+        abiInput: ABI input (or array element / struct component) describing value.
+        value: Value as returned by eth_abi.
+
+    Returns:
+        The value with addresses checksummed, arrays as lists and structs as tuples.
+    """
+    abiType = abiInput["type"]
+
+    if abiType.endswith(ARRAY_SUFFIX):
+        elementInput = dict(abiInput, type=abiType[:abiType.rindex("[")])
+        return [normaliseDecodedValue(abiInput=elementInput, value=element) for element in value]
+
+    if abiType == TUPLE_TYPE:
+        return tuple(
+            normaliseDecodedValue(abiInput=component, value=element)
+            for component, element in zip(abiInput["components"], value)
+        )
+
+    if abiType == ADDRESS_TYPE:
+        return to_checksum_address(value)
+
+    return value
+
+
+def decodeWithSelectorEntry(selectorEntry: SelectorEntry, inputData: str) -> Dict[str, Any]:
+    """Decode a transaction's arguments with a precompiled selector entry.
+
+    Args:
+        selectorEntry: Entry for the transaction's selector.
+        inputData: Hex transaction input data including the selector.
+
+    Returns:
+        Dict of argument name to normalised value.
+
+    Raises:
+        eth_abi.exceptions.DecodingError: If the data does not match the schema.
+    """
+    decodedValues = selectorEntry.decoder(ContextFramesBytesIO(bytes.fromhex(inputData[SELECTOR_LENGTH:])))
+
+    return {
+        abiInput["name"]: normaliseDecodedValue(abiInput=abiInput, value=value)
+        for abiInput, value in zip(selectorEntry.schema, decodedValues)
+    }
+
+
+def getInputSelector(inputData: str) -> str:
+    """Get the normalised 4-byte selector of hex transaction input data.
+
+    Args:
+        inputData: Hex transaction input data.
+
+    Returns:
+        str: The lower-case '0x' prefixed selector.
+    """
+    return inputData[:SELECTOR_LENGTH].lower()
+
+
+@abiDigestCache
+def getSwapSelectors(abiDigest: str) -> FrozenSet[str]:
+    """Get the selectors of an ABI's functions that take a swap path.
+
+    Args:
+        abiDigest: Digest of an ABI added with abi_Registry.registerAbi.
+
+    Returns:
+        FrozenSet of lower-case '0x' prefixed selectors.
+    """
+    return frozenset(
+        selector for selector, selectorEntry in getSelectorIndex(abiDigest).items() if selectorEntry.isSwap
+    )
+
+
+def isSwapTransaction(transaction: RawTransaction, swapSelectors: FrozenSet[str]) -> bool:
+    """Check whether a transaction is a successful call to a swap function.
+
+    Args:
+        transaction: Explorer transaction sent to the router.
+        swapSelectors: Swap selectors of the router ABI, from getSwapSelectors.
+
+    Returns:
+        bool: True if the transaction did not revert and its selector is a swap.
+    """
+    return transaction.isError != TX_ERROR_FLAG and getInputSelector(transaction.input) in swapSelectors
+
+
+def getSwapTransactionFilter(abiDigest: Optional[str]) -> Optional[Callable[[RawTransaction], bool]]:
+    """Get a predicate keeping only a router's successful swap transactions.
+
+    Used to drop transactions while an explorer response is still being
+    parsed, so they are never held in memory.
+
+    Args:
+        abiDigest: Digest of the router ABI, or None.
+
+    Returns:
+        The predicate, or None if there is no ABI or it cannot be indexed, in
+        which case every transaction should be kept.
+    """
+    if abiDigest is None:
+        return None
+
+    try:
+        swapSelectors = getSwapSelectors(abiDigest)
+    except ValueError:
+        return None
+
+    return partial(isSwapTransaction, swapSelectors=swapSelectors)
+
+
+def filterSwapTransactions(
+    transactions: List[RawTransaction],
+    abiDigest: str
+) -> List[RawTransaction]:
+    """Drop transactions that cannot produce a route before decoding them.
+
+    Only the selector at the start of each transaction's input is inspected.
+    Failed transactions and calls to functions without a swap path, including
+    selectors the ABI does not contain, are dropped.
+
+    Args:
+        transactions: Explorer transactions sent to the router.
+        abiDigest: Digest of the router ABI.
+
+    Returns:
+        The successful swap transactions, in their original order.
+    """
+    swapSelectors = getSwapSelectors(abiDigest)
+
+    return [
+        transaction for transaction in transactions
+        if isSwapTransaction(transaction=transaction, swapSelectors=swapSelectors)
+    ]
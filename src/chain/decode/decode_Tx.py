@@ -86,6 +86,8 @@ from src.chain.abi.abi_Contract import getContract
 # Decode standard transaction type and parse calldata
 # TODO: Cache decoded transaction results
 from src.chain.convert.convert_Hex import convertToHex
+from src.chain.decode.decode_Selectors import decodeWithSelectorEntry, getInputSelector, getSelectorIndex
+from src.records.records_Transactions import DecodedTransaction, RawTransaction
 
 # Parse transaction data and decode function calls using ABI specifications
 """Decode transaction data from blockchain.
@@ -98,9 +100,7 @@ from src.chain.convert.convert_Hex import convertToHex
 # Decode transaction data from ATC routes
         Parsed transaction object with relevant fields
     """
-# Type alias for decoded transaction result
 # Enhancement: improve error messages
-DecodedTransaction = Dict[str, Any]
 DecodeError = Tuple[str, Optional[str], None]
 
 # Error type constants for categorizing decode failures
@@ -108,6 +108,7 @@ ERROR_NO_ABI = 'no matching abi'
 # Decode transaction input data using contract ABI
 ERROR_DECODE_FAILED = 'decode error'
 ERROR_INVALID_INPUT = 'invalid input data'
+ERROR_NOT_SWAP = 'not a swap function'
 
 # Minimum input data length (in hex chars) for valid transaction
 # Function selector is 4 bytes (8 hex chars) + '0x' prefix
@@ -118,22 +119,26 @@ MIN_INPUT_DATA_LENGTH = 10
 def decodeTx(
     address: str,
 # Decode transaction input data using contract ABI
-    transaction: Dict[str, Any],
-    abi: Optional[str]
+    transaction: RawTransaction,
+    abiDigest: Optional[str],
+    swapsOnly: bool = True
 ) -> Union[DecodedTransaction, DecodeError]:
     """Decode an Ethereum transaction using the contract ABI.
 
     Extracts the function name and parameters from the transaction input data
-    by decoding it against the provided contract ABI.
+    by decoding it against the provided contract ABI. Selectors found in the
+    ABI are decoded with a precompiled decoder; only selectors the ABI does
+    not contain fall back to web3's decode_function_input.
 
     Args:
         address: The contract address that received the transaction.
-        transaction: Dictionary containing transaction data with 'input',
-                    'blockNumber', 'hash', and 'timeStamp' keys.
-        abi: JSON string representation of the contract ABI, or None.
+        transaction: Trimmed explorer transaction with input, blockNumber,
+                    hash and timeStamp.
+        abiDigest: Digest of the contract ABI in the ABI registry, or None.
+        swapsOnly: Reject calls to functions without a swap path before decoding.
 
     Returns:
-        On success: Dictionary containing:
+        On success: DecodedTransaction containing:
             - name: Function name that was called.
             - params: Decoded function parameters with hex-encoded bytes.
             - schema: ABI schema for the function inputs.
@@ -142,35 +147,47 @@ def decodeTx(
             - timestamp: Transaction timestamp.
         On failure: Tuple of (error_type, error_message, None).
     """
-    inputData = transaction["input"]
-    blockNumber = int(transaction["blockNumber"])
+    inputData = transaction.input
+    blockNumber = transaction.blockNumber
 
     # Early return if no ABI available for decoding
-    if abi is None:
+    if abiDigest is None:
         return (ERROR_NO_ABI, None, None)
 
     try:
-        contract, parsed_abi = getContract(address, abi)
-        func_obj, func_params = contract.decode_function_input(inputData)
+        selectorEntry = getSelectorIndex(abiDigest).get(getInputSelector(inputData))
 
-        # Find the ABI schema for this function
-        target_schema = [
-            a['inputs'] for a in parsed_abi
-            if 'name' in a and a['name'] == func_obj.fn_name
-        ][0]
+        if selectorEntry is not None:
 
-        decoded_func_params = convertToHex(func_params, target_schema)
+            # Skip approve, addLiquidity, etc. without decoding them
+            if swapsOnly and not selectorEntry.isSwap:
+                return (ERROR_NOT_SWAP, selectorEntry.name, None)
+
+            func_name = selectorEntry.name
+            func_params = decodeWithSelectorEntry(selectorEntry, inputData)
+            target_schema = selectorEntry.schema
+
+        else:
+            contract, parsed_abi = getContract(address, abiDigest)
+            func_obj, func_params = contract.decode_function_input(inputData)
+            func_name = func_obj.fn_name
 
-        result: DecodedTransaction = {
-            "name": func_obj.fn_name,
-            "params": decoded_func_params,
-            "schema": target_schema,
-            "blockNumber": blockNumber,
-            "txHash": transaction["hash"],
-            "timestamp": transaction["timeStamp"]
-        }
+            # Find the ABI schema for this function
+            target_schema = [
+                a['inputs'] for a in parsed_abi
+                if 'name' in a and a['name'] == func_name
+            ][0]
+
+        decoded_func_params = convertToHex(func_params, target_schema)
 
-        return result
+        return DecodedTransaction(
+            name=func_name,
+            params=decoded_func_params,
+            schema=target_schema,
+            blockNumber=blockNumber,
+            txHash=transaction.hash,
+            timestamp=transaction.timeStamp
+        )
 
     except Exception as e:
         # Return error tuple with exception details for debugging
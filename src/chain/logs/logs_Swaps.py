@@ -0,0 +1,636 @@
+"""Swap discovery from pair Swap events over JSON-RPC.
+
+An alternative to listing router transactions from the block explorer
+(INGESTION_SOURCE=logs). Swaps are read straight from the network's RPC
+endpoint as UniswapV2-style pair Swap events, so swaps routed through
+aggregators and multicall wrappers are found too and throughput is bounded
+by the RPC node rather than the explorer's API quota.
+
+The process:
+    1. eth_getLogs for the Swap topic over LOG_BLOCK_CHUNK_SIZE block chunks,
+       sent as JSON-RPC batches; chunks the node rejects as too large are
+       split in half
+    2. factory(), token0() and token1() of every pair seen, cached per
+       network, keeping only pairs created by the DEX's factory
+    3. Consecutive hops of a transaction on the DEX's pairs, ordered by log
+       index, are chained into a path while each hop's output token is the
+       next hop's input
+    4. Each path becomes a DecodedTransaction, so routes are collected and
+       stored exactly like decoded router calls
+
+Steps 1 and 2 run once per network and block range and are shared by every
+DEX fetching that range, however many DEXs the network has.
+
+Swap Event:
+    Swap(address indexed sender, uint amount0In, uint amount1In,
+         uint amount0Out, uint amount1Out, address indexed to)
+"""
+
+import asyncio
+from itertools import groupby
+from typing import AbstractSet, Any, Awaitable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import aiohttp
+from eth_utils import to_checksum_address
+
+from src.chain.utils.utils_web3 import getAsyncRpcSession, recordProviderRequest
+from src.records.records_Transactions import DecodedTransaction
+from src.utils.env.env_Environment import getLogBlockChunkSize
+from src.utils.logging.logging_Setup import getProjectLogger
+
+logger = getProjectLogger()
+
+# keccak256("Swap(address,uint256,uint256,uint256,uint256,address)")
+SWAP_EVENT_TOPIC = "0xd78ad95fa46c994b6551d0da85fc275fe613ce37657fb8d5e3d130840159d822"
+
+# Method name stored on routes discovered from Swap events
+SWAP_EVENT_METHOD = "Swap"
+
+# Selectors of the pair getters used to resolve a pair's factory and tokens
+FACTORY_SELECTOR = "0xc45a0155"
+TOKEN0_SELECTOR = "0x0dfe1681"
+TOKEN1_SELECTOR = "0xd21220a7"
+PAIR_GETTER_SELECTORS = (FACTORY_SELECTOR, TOKEN0_SELECTOR, TOKEN1_SELECTOR)
+
+# JSON-RPC requests sent per HTTP request, and batches in flight per block range
+RPC_REQUESTS_PER_BATCH = 20
+RPC_BATCH_CONCURRENCY = 4
+
+# Hex characters per ABI word and per address
+WORD_HEX_LENGTH = 64
+ADDRESS_HEX_LENGTH = 40
+
+# JSON-RPC error code and messages of an eth_call the contract itself failed,
+# as opposed to a node or transport failure
+EXECUTION_REVERTED_CODE = 3
+CONTRACT_ERROR_MESSAGES = ("execution reverted", "invalid opcode")
+
+# Messages of an eth_getLogs request covering too many blocks or results
+# (geth/Infura, Alchemy, QuickNode, Ankr, Erigon/BSC). Matched on message
+# rather than code, as -32005 is also returned for rate limits
+RANGE_ERROR_MESSAGES = (
+    "query returned more than",
+    "response size exceeded",
+    "too many results",
+    "too many logs",
+    "block range",
+    "range is too wide",
+    "is limited to a"
+)
+
+
+class RpcError(Exception):
+    """Raised when a JSON-RPC request in a batch returns an error.
+
+    Attributes:
+        error: The JSON-RPC error object, None if the node returned no
+            response for the request.
+    """
+
+    def __init__(self, message: str, error: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Description of the failed request.
+            error: The JSON-RPC error object returned for the request.
+        """
+        super().__init__(message)
+        self.error = error
+
+    def isContractError(self) -> bool:
+        """Check whether the called contract failed the request, not the node.
+
+        Returns:
+            bool: True if the call reverted or hit an invalid opcode.
+        """
+        if not isinstance(self.error, dict):
+            return False
+
+        errorMessage = str(self.error.get("message", "")).lower()
+        return self.error.get("code") == EXECUTION_REVERTED_CODE or any(
+            contractErrorMessage in errorMessage for contractErrorMessage in CONTRACT_ERROR_MESSAGES
+        )
+
+    def isRangeError(self) -> bool:
+        """Check whether the node rejected a request for covering too much.
+
+        Returns:
+            bool: True if the block range or result count exceeded the node's limits.
+        """
+        if not isinstance(self.error, dict):
+            return False
+
+        errorMessage = str(self.error.get("message", "")).lower()
+        return any(rangeErrorMessage in errorMessage for rangeErrorMessage in RANGE_ERROR_MESSAGES)
+
+
+class SwapPair(NamedTuple):
+    """Factory and tokens of a pair contract.
+
+    Attributes:
+        factory: Lowercase address of the factory that created the pair.
+        token0: Checksummed address of the pair's token0.
+        token1: Checksummed address of the pair's token1.
+    """
+    factory: str
+    token0: str
+    token1: str
+
+
+class SwapLogRange(NamedTuple):
+    """Swap events of a block range with the pairs and blocks they refer to.
+
+    Attributes:
+        swapLogs: Raw Swap logs of the range, from every pair.
+        swapPairs: Factory and tokens of each pair that emitted a log, keyed
+            by lowercase address, None for contracts that are not pairs.
+        blockTimestamps: Unix timestamp of each block with a swap on a pair
+            of the requested factories.
+    """
+    swapLogs: List[Dict[str, Any]]
+    swapPairs: Dict[str, Optional[SwapPair]]
+    blockTimestamps: Dict[int, str]
+
+
+class SwapHop(NamedTuple):
+    """One pair swap decoded from a Swap event.
+
+    Attributes:
+        tokenIn: Checksummed address of the token sold.
+        tokenOut: Checksummed address of the token bought.
+        amountIn: Amount of tokenIn sold.
+        amountOut: Amount of tokenOut bought.
+    """
+    tokenIn: str
+    tokenOut: str
+    amountIn: int
+    amountOut: int
+
+
+# Pair metadata keyed by (RPC URL, lowercase pair address), None for
+# contracts that are not pairs
+swapPairCache: Dict[Tuple[str, str], Optional[SwapPair]] = {}
+
+
+async def sendRpcBatch(chainRpcURL: str, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+    """Send several JSON-RPC requests in one HTTP request.
+
+    Args:
+        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
+        calls: (method, params) of each request.
+
+    Returns:
+        List of each request's result in call order, or an RpcError
+        instance for requests the node rejected.
+
+    Raises:
+        ValueError: If the endpoint does not return a JSON-RPC batch response.
+        aiohttp.ClientError: If the request fails.
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": callIndex, "method": method, "params": params}
+        for callIndex, (method, params) in enumerate(calls)
+    ]
+
+    recordProviderRequest(chainRpcURL)
+
+    async with getAsyncRpcSession(chainRpcURL).post(chainRpcURL, json=payload) as rpcResponse:
+        rpcResults = await rpcResponse.json(content_type=None)
+
+    if not isinstance(rpcResults, list):
+        raise ValueError(f"Batch request failed: {rpcResults}")
+
+    resultsById = {rpcResult.get("id"): rpcResult for rpcResult in rpcResults if isinstance(rpcResult, dict)}
+
+    results: List[Any] = []
+    for callIndex, (method, _) in enumerate(calls):
+        rpcResult = resultsById.get(callIndex)
+        if rpcResult is None or "result" not in rpcResult:
+            results.append(RpcError(f"{method} failed: {rpcResult}", error=(rpcResult or {}).get("error")))
+        else:
+            results.append(rpcResult["result"])
+
+    return results
+
+
+async def sendRpcBatches(
+    chainRpcURL: str,
+    calls: List[Tuple[str, List[Any]]],
+    semaphore: asyncio.Semaphore
+) -> List[Any]:
+    """Send any number of JSON-RPC requests as concurrent batches.
+
+    Args:
+        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
+        calls: (method, params) of each request.
+        semaphore: Bounds the batches in flight.
+
+    Returns:
+        List of each request's result in call order, see sendRpcBatch.
+    """
+    async def sendBoundedBatch(batch: List[Tuple[str, List[Any]]]) -> List[Any]:
+        async with semaphore:
+            return await sendRpcBatch(chainRpcURL=chainRpcURL, calls=batch)
+
+    batchResults = await asyncio.gather(*[
+        sendBoundedBatch(calls[batchStart:batchStart + RPC_REQUESTS_PER_BATCH])
+        for batchStart in range(0, len(calls), RPC_REQUESTS_PER_BATCH)
+    ])
+
+    return [result for batchResult in batchResults for result in batchResult]
+
+
+def getBlockChunks(startBlock: int, endBlock: int, chunkSize: int) -> List[Tuple[int, int]]:
+    """Split a block range into chunks of at most chunkSize blocks.
+
+    Args:
+        startBlock: First block of the range (inclusive).
+        endBlock: Last block of the range (inclusive).
+        chunkSize: Blocks per chunk.
+
+    Returns:
+        List of (first block, last block) chunks in order.
+    """
+    return [
+        (chunkStart, min(chunkStart + chunkSize - 1, endBlock))
+        for chunkStart in range(startBlock, endBlock + 1, chunkSize)
+    ]
+
+
+async def getSwapLogs(
+    chainRpcURL: str,
+    blockChunks: List[Tuple[int, int]],
+    semaphore: asyncio.Semaphore
+) -> List[Dict[str, Any]]:
+    """Fetch every Swap event in a set of block chunks.
+
+    Nodes cap how many logs or blocks one eth_getLogs request may cover.
+    Chunks the node rejects as too large are split in half and fetched again,
+    down to single blocks. Any other error fails the whole set at once, since
+    splitting would only repeat it on every half.
+
+    Args:
+        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
+        blockChunks: (first block, last block) ranges to fetch.
+        semaphore: Bounds the batches in flight.
+
+    Returns:
+        List of raw Swap logs in no particular order.
+
+    Raises:
+        RpcError: If a request fails for any reason other than its size, or
+            the node rejects a single-block request.
+    """
+    results = await sendRpcBatches(
+        chainRpcURL=chainRpcURL,
+        calls=[
+            ("eth_getLogs", [{"fromBlock": hex(chunkStart), "toBlock": hex(chunkEnd), "topics": [SWAP_EVENT_TOPIC]}])
+            for chunkStart, chunkEnd in blockChunks
+        ],
+        semaphore=semaphore
+    )
+
+    swapLogs: List[Dict[str, Any]] = []
+    splitChunks: List[Tuple[int, int]] = []
+    for (chunkStart, chunkEnd), result in zip(blockChunks, results):
+        if not isinstance(result, RpcError):
+            swapLogs.extend(result)
+            continue
+
+        if not result.isRangeError() or chunkStart >= chunkEnd:
+            raise result
+
+        middleBlock = (chunkStart + chunkEnd) // 2
+        splitChunks.extend([(chunkStart, middleBlock), (middleBlock + 1, chunkEnd)])
+
+    if splitChunks:
+        logger.debug(f"Splitting {len(splitChunks) // 2} eth_getLogs chunks too large for {chainRpcURL}")
+        swapLogs.extend(await getSwapLogs(chainRpcURL=chainRpcURL, blockChunks=splitChunks, semaphore=semaphore))
+
+    return swapLogs
+
+
+def parseWordAddress(word: str) -> str:
+    """Get the address held in the last 20 bytes of an ABI word.
+
+    Args:
+        word: Hex encoded 32-byte word, with or without a 0x prefix.
+
+    Returns:
+        str: The checksummed address.
+    """
+    return to_checksum_address(f"0x{word[-ADDRESS_HEX_LENGTH:]}")
+
+
+async def resolveSwapPairs(
+    chainRpcURL: str,
+    pairAddresses: Iterable[str],
+    semaphore: asyncio.Semaphore
+) -> Dict[str, Optional[SwapPair]]:
+    """Resolve the factory and tokens of each pair, reading unknown pairs on chain.
+
+    A contract that reverts a pair getter or returns too short a value is
+    cached as not being a pair. Pairs whose getters failed at the node are
+    not cached, so they are read again on the next attempt.
+
+    Args:
+        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
+        pairAddresses: Lowercase addresses of contracts that emitted Swap events.
+        semaphore: Bounds the batches in flight.
+
+    Returns:
+        Dict mapping each pair address to its SwapPair, or None if the
+        contract does not answer the pair getters.
+
+    Raises:
+        RpcError: If the node failed a pair getter call.
+    """
+    pairAddresses = set(pairAddresses)
+    unknownPairs = [pairAddress for pairAddress in pairAddresses if (chainRpcURL, pairAddress) not in swapPairCache]
+
+    results = await sendRpcBatches(
+        chainRpcURL=chainRpcURL,
+        calls=[
+            ("eth_call", [{"to": pairAddress, "data": selector}, "latest"])
+            for pairAddress in unknownPairs
+            for selector in PAIR_GETTER_SELECTORS
+        ],
+        semaphore=semaphore
+    )
+
+    for pairIndex, pairAddress in enumerate(unknownPairs):
+        getterResults = results[pairIndex * len(PAIR_GETTER_SELECTORS):(pairIndex + 1) * len(PAIR_GETTER_SELECTORS)]
+
+        for result in getterResults:
+            if isinstance(result, RpcError) and not result.isContractError():
+                raise result
+
+        if any(isinstance(result, RpcError) or len(result) < 2 + WORD_HEX_LENGTH for result in getterResults):
+            swapPairCache[(chainRpcURL, pairAddress)] = None
+            continue
+
+        factoryWord, token0Word, token1Word = getterResults
+        swapPairCache[(chainRpcURL, pairAddress)] = SwapPair(
+            factory=parseWordAddress(factoryWord).lower(),
+            token0=parseWordAddress(token0Word),
+            token1=parseWordAddress(token1Word)
+        )
+
+    return {pairAddress: swapPairCache[(chainRpcURL, pairAddress)] for pairAddress in pairAddresses}
+
+
+async def getBlockTimestamps(
+    chainRpcURL: str,
+    blockNumbers: Iterable[int],
+    semaphore: asyncio.Semaphore
+) -> Dict[int, str]:
+    """Read the timestamp of each block.
+
+    Args:
+        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
+        blockNumbers: Blocks to read.
+        semaphore: Bounds the batches in flight.
+
+    Returns:
+        Dict mapping block number to its Unix timestamp, as the explorer
+        returns it.
+
+    Raises:
+        RpcError: If the node did not return one of the blocks.
+    """
+    blockNumbers = list(blockNumbers)
+
+    results = await sendRpcBatches(
+        chainRpcURL=chainRpcURL,
+        calls=[("eth_getBlockByNumber", [hex(blockNumber), False]) for blockNumber in blockNumbers],
+        semaphore=semaphore
+    )
+
+    blockTimestamps: Dict[int, str] = {}
+    for blockNumber, result in zip(blockNumbers, results):
+        if isinstance(result, RpcError):
+            raise result
+        if not isinstance(result, dict):
+            raise RpcError(f"Block {blockNumber} not returned by {chainRpcURL}")
+
+        blockTimestamps[blockNumber] = str(int(result["timestamp"], 16))
+
+    return blockTimestamps
+
+
+def decodeSwapLog(swapLog: Dict[str, Any], swapPair: SwapPair) -> Optional[SwapHop]:
+    """Decode the token direction and amounts of a Swap event.
+
+    Args:
+        swapLog: Raw Swap log.
+        swapPair: Factory and tokens of the pair that emitted it.
+
+    Returns:
+        SwapHop: The decoded hop, or None if the event does not sell one
+        token for the other.
+    """
+    data = swapLog["data"][2:]
+    amount0In, amount1In, amount0Out, amount1Out = (
+        int(data[wordStart:wordStart + WORD_HEX_LENGTH], 16)
+        for wordStart in range(0, 4 * WORD_HEX_LENGTH, WORD_HEX_LENGTH)
+    )
+
+    if amount0In and amount1Out:
+        return SwapHop(tokenIn=swapPair.token0, tokenOut=swapPair.token1, amountIn=amount0In, amountOut=amount1Out)
+    if amount1In and amount0Out:
+        return SwapHop(tokenIn=swapPair.token1, tokenOut=swapPair.token0, amountIn=amount1In, amountOut=amount0Out)
+
+    return None
+
+
+def buildSwapTransaction(hops: List[SwapHop], swapLog: Dict[str, Any], timestamp: str) -> DecodedTransaction:
+    """Build the decoded transaction of a chained swap path.
+
+    The path and amounts are stored under the parameter names of router
+    swap calls, with the amount actually received as amountOutMin, so the
+    route is collected like a decoded router call.
+
+    Args:
+        hops: Chained hops, each selling the previous hop's output token.
+        swapLog: Any Swap log of the transaction.
+        timestamp: Timestamp of the transaction's block.
+
+    Returns:
+        DecodedTransaction: The swap path as a decoded transaction.
+    """
+    return DecodedTransaction(
+        name=SWAP_EVENT_METHOD,
+        params={
+            "path": [hops[0].tokenIn] + [hop.tokenOut for hop in hops],
+            "amountIn": hops[0].amountIn,
+            "amountOutMin": hops[-1].amountOut
+        },
+        schema=[],
+        blockNumber=int(swapLog["blockNumber"], 16),
+        txHash=swapLog["transactionHash"],
+        timestamp=timestamp
+    )
+
+
+def buildSwapTransactions(
+    swapLogs: List[Dict[str, Any]],
+    dexPairs: Dict[str, SwapPair],
+    blockTimestamps: Dict[int, str]
+) -> List[DecodedTransaction]:
+    """Reconstruct the swap paths of a DEX from Swap events.
+
+    Each transaction's logs are walked in log index order. A hop on one of
+    the DEX's pairs extends the current path when it sells the token the
+    previous hop bought; any other hop, or a swap on another DEX's pair,
+    ends the path.
+
+    Args:
+        swapLogs: Raw Swap logs of the block range, from every pair.
+        dexPairs: Factory and tokens of the DEX's pairs, keyed by lowercase address.
+        blockTimestamps: Unix timestamp of each block with a swap on the DEX's pairs.
+
+    Returns:
+        List of DecodedTransaction in block order, one per swap path.
+
+    Raises:
+        KeyError: If a swap path's block has no timestamp.
+    """
+    swapTransactions: List[DecodedTransaction] = []
+
+    orderedLogs = sorted(swapLogs, key=lambda swapLog: (
+        int(swapLog["blockNumber"], 16),
+        int(swapLog["transactionIndex"], 16),
+        int(swapLog["logIndex"], 16)
+    ))
+
+    for _, transactionLogs in groupby(orderedLogs, key=lambda swapLog: swapLog["transactionHash"]):
+
+        transactionLogs = list(transactionLogs)
+        blockNumber = int(transactionLogs[0]["blockNumber"], 16)
+
+        pathHops: List[SwapHop] = []
+        for swapLog in transactionLogs:
+
+            swapPair = dexPairs.get(swapLog["address"].lower())
+            swapHop = decodeSwapLog(swapLog=swapLog, swapPair=swapPair) if swapPair is not None else None
+
+            if swapHop is not None and (not pathHops or pathHops[-1].tokenOut == swapHop.tokenIn):
+                pathHops.append(swapHop)
+                continue
+
+            if pathHops:
+                swapTransactions.append(buildSwapTransaction(hops=pathHops, swapLog=swapLog, timestamp=blockTimestamps[blockNumber]))
+
+            pathHops = [swapHop] if swapHop is not None else []
+
+        if pathHops:
+            swapTransactions.append(buildSwapTransaction(hops=pathHops, swapLog=transactionLogs[0], timestamp=blockTimestamps[blockNumber]))
+
+    return swapTransactions
+
+
+async def getSwapLogRange(
+    chainRpcURL: str,
+    factoryAddresses: AbstractSet[str],
+    startBlock: int,
+    endBlock: int
+) -> SwapLogRange:
+    """Fetch the Swap events of a block range and resolve their pairs and blocks.
+
+    Args:
+        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
+        factoryAddresses: Lowercase factories of the DEXs sharing the range,
+            whose swaps' block timestamps are read.
+        startBlock: First block of the range (inclusive).
+        endBlock: Last block of the range (inclusive).
+
+    Returns:
+        SwapLogRange: The range's Swap logs, pairs and block timestamps.
+
+    Raises:
+        RpcError: If the node failed a request.
+        aiohttp.ClientError: If a request fails.
+    """
+    semaphore = asyncio.Semaphore(RPC_BATCH_CONCURRENCY)
+
+    swapLogs = [
+        swapLog for swapLog in await getSwapLogs(
+            chainRpcURL=chainRpcURL,
+            blockChunks=getBlockChunks(startBlock=startBlock, endBlock=endBlock, chunkSize=getLogBlockChunkSize()),
+            semaphore=semaphore
+        )
+        if not swapLog.get("removed")
+    ]
+
+    swapPairs = await resolveSwapPairs(
+        chainRpcURL=chainRpcURL,
+        pairAddresses=(swapLog["address"].lower() for swapLog in swapLogs),
+        semaphore=semaphore
+    )
+
+    factoryPairs = {
+        pairAddress for pairAddress, swapPair in swapPairs.items()
+        if swapPair is not None and swapPair.factory in factoryAddresses
+    }
+    factorySwapLogs = [swapLog for swapLog in swapLogs if swapLog["address"].lower() in factoryPairs]
+
+    # Some nodes include the block timestamp on each log
+    blockTimestamps = {
+        int(swapLog["blockNumber"], 16): str(int(swapLog["blockTimestamp"], 16))
+        for swapLog in factorySwapLogs if swapLog.get("blockTimestamp")
+    }
+    blockTimestamps.update(await getBlockTimestamps(
+        chainRpcURL=chainRpcURL,
+        blockNumbers={int(swapLog["blockNumber"], 16) for swapLog in factorySwapLogs} - blockTimestamps.keys(),
+        semaphore=semaphore
+    ))
+
+    return SwapLogRange(swapLogs=swapLogs, swapPairs=swapPairs, blockTimestamps=blockTimestamps)
+
+
+async def getSwapTransactionsForBlockRange(
+    swapLogRange: Awaitable[SwapLogRange],
+    factoryAddress: str,
+    startBlock: int,
+    endBlock: int,
+    networkName: str,
+    dexName: str
+) -> Optional[List[DecodedTransaction]]:
+    """Discover a DEX's swaps in a block range from its pairs' Swap events.
+
+    Args:
+        swapLogRange: The range's Swap events from getSwapLogRange, shared by
+            every DEX on the network fetching the same range.
+        factoryAddress: Factory whose pairs' swaps are kept.
+        startBlock: First block of the range (inclusive).
+        endBlock: Last block of the range (inclusive).
+        networkName: Network name for logging purposes.
+        dexName: DEX name for logging purposes.
+
+    Returns:
+        List of swap paths as DecodedTransaction in block order, or None if
+        any request in the range failed or a log could not be decoded.
+    """
+    try:
+        swapLogs, swapPairs, blockTimestamps = await swapLogRange
+
+        normalisedFactoryAddress = factoryAddress.lower()
+        dexPairs = {
+            pairAddress: swapPair for pairAddress, swapPair in swapPairs.items()
+            if swapPair is not None and swapPair.factory == normalisedFactoryAddress
+        }
+        dexSwapLogCount = sum(1 for swapLog in swapLogs if swapLog["address"].lower() in dexPairs)
+
+        swapTransactions = buildSwapTransactions(
+            swapLogs=swapLogs,
+            dexPairs=dexPairs,
+            blockTimestamps=blockTimestamps
+        )
+
+    except (aiohttp.ClientError, asyncio.TimeoutError, RpcError, KeyError, TypeError, ValueError) as e:
+        logger.warning(f"[{networkName}] {dexName}: Failed to fetch Swap logs for blocks {startBlock}-{endBlock}: {e!r}")
+        return None
+
+    logger.info(f"[{networkName}] {dexName}: {len(swapTransactions)} Swap Paths from {dexSwapLogCount}/{len(swapLogs)} Swap Logs")
+
+    return swapTransactions
@@ -98,19 +98,36 @@ Supported Explorer APIs:
 # TODO: Add async support for better performance
 
 import asyncio
+import random
+from collections import Counter
+from contextlib import nullcontext
 # TODO: Optimize transaction fee calculation for different DEX protocols
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 # Identify and parse DEX swap transaction patterns
 # Filter tokens from DEX responses based on configured criteria
 import aiohttp
-
-from src.chain.utils.utils_web3 import getWeb3Instance
-from src.db.querys.querys_Routes import getLatestProcessedBlockNetworkIdAndDexId
-from src.utils.env.env_Environment import getBlockRange
+import ijson
+
+from src.chain.blocks.blocks_Head import getLatestBlockNumbers
+from src.chain.decode.decode_Selectors import getSwapTransactionFilter
+from src.chain.logs.logs_Swaps import getSwapLogRange, getSwapTransactionsForBlockRange
+from src.chain.transactions.transactions_Parse import TxListPage, parseTxListResponse
+from src.chain.utils.utils_web3 import closeAsyncRpcSessions
+from src.db.querys.querys_Checkpoints import DexCheckpoints, getAllDexCheckpoints
+from src.records.records_Dexs import DexRecord, NetworkRecord
+from src.records.records_Transactions import FetchedTransaction, RawTransaction
+from src.utils.env.env_Environment import (
+    INGESTION_SOURCE_LOGS,
+    getAdaptiveRateLimit,
+    getApiRateBurstSeconds,
+    getBlockRange,
+    getExplorerRateLimits,
+    getIngestionSource
+)
 from src.utils.logging.logging_Print import printSeparator
 from src.utils.logging.logging_Setup import getProjectLogger
-from src.utils.web.web_RateLimiter import RateLimiter
+from src.utils.web.web_RateLimiter import KeyedRateLimiter, RateLimiter
 
 logger = getProjectLogger()
 
@@ -118,30 +135,76 @@ logger = getProjectLogger()
 # Prevents excessive API calls when catching up after downtime
 MAX_CATCHUP_BLOCKS = 5000
 
-# Rate limiting configuration for blockchain explorer APIs
+# Default rate limit for blockchain explorer APIs, used when neither the
+# networks table nor EXPLORER_RATE_LIMITS configures one for an explorer
 # Most explorers (Etherscan, etc.) allow ~5 requests/second on free tier
 API_RATE_LIMIT = 3
 
 # Maximum concurrent API requests to prevent overwhelming the client
 API_CONCURRENCY_LIMIT = 1000
 
+# Maximum rows an Etherscan-compatible txlist response returns; a response
+# this large is treated as truncated and its block range is split
+TXLIST_MAX_RESULTS = 10000
+
 # HTTP status codes for API response handling
 HTTP_OK = 200
 HTTP_RATE_LIMITED = 429
 HTTP_SERVER_ERROR = 500
 
+# Retries for throttled or failed explorer requests before giving up
+MAX_REQUEST_RETRIES = 5
+
+# Exponential backoff between retries: full jitter over base * 2^attempt,
+# capped at MAX_RETRY_BACKOFF seconds
+RETRY_BACKOFF_BASE = 1.0
+MAX_RETRY_BACKOFF = 30.0
+
+# Reasons a DEX gets no transactions in a run, counted in the run summary
+SKIP_REASON_UP_TO_DATE = "up to date"
+SKIP_REASON_NO_CHAIN_HEAD = "chain head unavailable"
+SKIP_REASON_SETUP_FAILED = "setup failed"
+SKIP_REASON_FETCH_FAILED = "fetch failed"
+
+# Substring of the explorer error result when the API key is throttled,
+# e.g. "Max rate limit reached" or "Max calls per sec rate limit reached (5/sec)"
+EXPLORER_RATE_LIMIT_MESSAGE = "rate limit"
+
+
+def getRetryBackoff(attempt: int) -> float:
+    """Get a jittered backoff delay for a retry attempt.
+
+    Args:
+        attempt: Zero-based retry attempt number.
+
+    Returns:
+        float: Seconds to wait before retrying.
+    """
+    return random.uniform(0, min(MAX_RETRY_BACKOFF, RETRY_BACKOFF_BASE * 2 ** attempt))
+
 
 async def getTransactions(
     clientSession: aiohttp.ClientSession,
     rateLimiter: RateLimiter,
     apiUrl: str,
     networkName: str,
-    dexName: str
-) -> List[Dict[str, Any]]:
+    dexName: str,
+    transactionFilter: Optional[Callable[[RawTransaction], bool]] = None
+) -> Optional[TxListPage]:
     """Fetch transactions from a blockchain explorer API.
 
     Makes a rate-limited request to fetch transaction history for a contract
-    address from an Etherscan-compatible API.
+    address from an Etherscan-compatible API. The response body is parsed as
+    it streams in, keeping only the transactions passing transactionFilter,
+    trimmed to the fields the decoder uses. Explorer errors are returned as
+    None rather than an empty list so that the block range is not marked as
+    processed.
+
+    Throttled responses (HTTP 429 or an explorer rate limit message) are
+    reported to the rate limiter, which lowers its rate in adaptive mode,
+    and retried with jittered exponential backoff, as are HTTP 5xx errors
+    and failed requests (connection errors and timeouts). Successful
+    responses are reported so the rate can ramp back up.
 
     Args:
         clientSession: aiohttp session for making HTTP requests.
@@ -149,87 +212,369 @@ async def getTransactions(
         apiUrl: Full URL for the explorer API request.
         networkName: Network name for logging purposes.
         dexName: DEX name for logging purposes.
+        transactionFilter: Predicate a transaction must pass to be kept, all
+            transactions are kept if None.
+
+    Returns:
+        TxListPage with the kept transactions and the response's row count,
+        or None on error, including once the retries are exhausted.
+    """
+    for attempt in range(MAX_REQUEST_RETRIES + 1):
+
+        isRateLimited = False
+        isServerError = False
+        requestError: Optional[BaseException] = None
+        txListPage = None
+
+        try:
+            async with rateLimiter.throttle():
+                apiResponse = await clientSession.get(apiUrl)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            requestError = e
+
+        if requestError is None:
+            isRateLimited = apiResponse.status == HTTP_RATE_LIMITED
+            isServerError = apiResponse.status >= HTTP_SERVER_ERROR
+
+            try:
+                if not isRateLimited and not isServerError:
+                    txListPage = await parseTxListResponse(
+                        content=apiResponse.content,
+                        transactionFilter=transactionFilter
+                    )
+            except (ijson.JSONError, aiohttp.ClientPayloadError, KeyError, TypeError, ValueError) as e:
+                logger.warning(f"[{networkName}] {dexName}: API response parse error: {e!r}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                requestError = e
+            finally:
+                apiResponse.release()
+
+        if txListPage is not None and txListPage.transactions is None:
+            if txListPage.message is None:
+                logger.warning(f"[{networkName}] {dexName}: API response has no result")
+                return None
+
+            # Explorers report errors as a string result, e.g. "Max rate limit reached"
+            if EXPLORER_RATE_LIMIT_MESSAGE not in txListPage.message.lower():
+                logger.warning(f"[{networkName}] {dexName}: Explorer error: {txListPage.message}")
+                return None
+            isRateLimited = True
+
+        if not isRateLimited and not isServerError and requestError is None:
+            rateLimiter.record_success()
+            break
+
+        if isRateLimited:
+            rateLimiter.record_rate_limited()
+
+        if requestError is not None:
+            retryReason = f"Request failed ({requestError!r})"
+        else:
+            retryReason = "Rate limited" if isRateLimited else "Server error"
+
+        if attempt == MAX_REQUEST_RETRIES:
+            logger.warning(f"[{networkName}] {dexName}: Giving up after {MAX_REQUEST_RETRIES} retries, last: {retryReason}")
+            return None
+
+        backoff = getRetryBackoff(attempt=attempt)
+        logger.debug(f"[{networkName}] {dexName}: {retryReason}, "
+                     f"retrying in {backoff:.2f}s at {rateLimiter.effective_rate:.2f} req/s")
+        await asyncio.sleep(backoff)
+
+    logger.info(f"[{networkName}] {dexName}: {len(txListPage.transactions)}/{txListPage.rowCount} Transactions Kept")
+
+    return txListPage
+
+
+def buildTxListUrl(
+    apiEndpoint: str,
+    contractAddress: str,
+    startBlock: int,
+    endBlock: int,
+    apiToken: Optional[str]
+) -> str:
+    """Build an explorer txlist URL for a contract and block range.
+
+    Args:
+        apiEndpoint: Explorer API prefix for the network.
+        contractAddress: Contract to list transactions for.
+        startBlock: First block of the range (inclusive).
+        endBlock: Last block of the range (inclusive).
+        apiToken: Explorer API key, if any.
+
+    Returns:
+        str: The request URL.
+    """
+    apiUrl = f"{apiEndpoint}/api?module=account&action=txlist&address={contractAddress}&startblock={startBlock}&endblock={endBlock}&sort=asc"
+
+    if apiToken:
+        apiUrl = f"{apiUrl}&apikey={apiToken}"
+
+    return apiUrl
+
+
+def getExplorerRateLimit(networkDetails: NetworkRecord, explorerRateLimits: Dict[str, int]) -> int:
+    """Get the requests per second allowed for a network's explorer.
+
+    The networks table's explorer_rate_limit column takes precedence over
+    EXPLORER_RATE_LIMITS, which takes precedence over API_RATE_LIMIT.
+
+    Args:
+        networkDetails: Network record including explorer_api_prefix.
+        explorerRateLimits: Overrides from getExplorerRateLimits.
+
+    Returns:
+        int: Requests per second.
+    """
+    if networkDetails.explorer_rate_limit:
+        return int(networkDetails.explorer_rate_limit)
+
+    return explorerRateLimits.get(networkDetails.explorer_api_prefix.rstrip("/"), API_RATE_LIMIT)
+
+
+def getExplorerBucketKey(networkDetails: NetworkRecord) -> str:
+    """Get the rate limiter bucket key for a network's explorer.
+
+    Explorer quotas are per API key, so networks sharing an explorer and key
+    share a bucket while different keys get their own.
+
+    Args:
+        networkDetails: Network record including explorer_api_prefix and explorer_api_key.
+
+    Returns:
+        str: The bucket key.
+    """
+    return f"{networkDetails.explorer_api_prefix.rstrip('/')}|{networkDetails.explorer_api_key or ''}"
+
+
+async def getTransactionsForBlockRange(
+    clientSession: aiohttp.ClientSession,
+    rateLimiter: RateLimiter,
+    apiEndpoint: str,
+    apiToken: Optional[str],
+    contractAddress: str,
+    startBlock: int,
+    endBlock: int,
+    networkName: str,
+    dexName: str,
+    transactionFilter: Optional[Callable[[RawTransaction], bool]] = None
+) -> Optional[List[RawTransaction]]:
+    """Fetch every transaction in a block range, splitting truncated ranges.
+
+    Explorers cap txlist responses at TXLIST_MAX_RESULTS rows. When a
+    response hits the cap the range is split in half and both halves are
+    fetched concurrently (recursively) under the same rate limiter. The
+    halves are disjoint and each is sorted ascending, so concatenating them
+    keeps block order. A single block over the cap fails the range, so the
+    DEX's checkpoint does not move past transactions that were never fetched.
+
+    Args:
+        clientSession: aiohttp session for making HTTP requests.
+        rateLimiter: Rate limiter to prevent API throttling.
+        apiEndpoint: Explorer API prefix for the network.
+        apiToken: Explorer API key, if any.
+        contractAddress: Contract to list transactions for.
+        startBlock: First block of the range (inclusive).
+        endBlock: Last block of the range (inclusive).
+        networkName: Network name for logging purposes.
+        dexName: DEX name for logging purposes.
+        transactionFilter: Predicate a transaction must pass to be kept, all
+            transactions are kept if None.
 
     Returns:
-        List of transaction dictionaries, or empty list on error.
+        List of kept transactions in block order, or None if any
+        request in the range failed.
     """
-    async with rateLimiter.throttle():
-        apiResponse = await clientSession.get(apiUrl)
+    txListPage = await getTransactions(
+        clientSession=clientSession,
+        rateLimiter=rateLimiter,
+        apiUrl=buildTxListUrl(
+            apiEndpoint=apiEndpoint,
+            contractAddress=contractAddress,
+            startBlock=startBlock,
+            endBlock=endBlock,
+            apiToken=apiToken
+        ),
+        networkName=networkName,
+        dexName=dexName,
+        transactionFilter=transactionFilter
+    )
+
+    # Truncation is judged on the rows returned, not the rows kept
+    if txListPage is None:
+        return None
+
+    if txListPage.rowCount < TXLIST_MAX_RESULTS:
+        return txListPage.transactions
+
+    # Explorers cap page * offset at the same limit, so a single block this
+    # large cannot be paged through; fail it rather than advance past it
+    if startBlock >= endBlock:
+        logger.error(f"[{networkName}] {dexName}: Block {startBlock} exceeds {TXLIST_MAX_RESULTS} transactions, cannot be fetched completely")
+        return None
+
+    # Drop the truncated page before fetching its halves
+    del txListPage
+
+    middleBlock = (startBlock + endBlock) // 2
+
+    logger.info(f"[{networkName}] {dexName}: Truncated response, splitting blocks {startBlock}-{endBlock} at {middleBlock}")
+
+    subRanges = [(startBlock, middleBlock), (middleBlock + 1, endBlock)]
+    subRangeTransactions = await asyncio.gather(*[
+        getTransactionsForBlockRange(
+            clientSession=clientSession,
+            rateLimiter=rateLimiter,
+            apiEndpoint=apiEndpoint,
+            apiToken=apiToken,
+            contractAddress=contractAddress,
+            startBlock=subRangeStart,
+            endBlock=subRangeEnd,
+            networkName=networkName,
+            dexName=dexName,
+            transactionFilter=transactionFilter
+        )
+        for subRangeStart, subRangeEnd in subRanges
+    ])
+
+    if any(subRange is None for subRange in subRangeTransactions):
+        return None
+
+    return [transaction for subRange in subRangeTransactions for transaction in subRange]
+
+
+async def publishDexTransactions(
+    dex: DexRecord,
+    fetch: Awaitable[Optional[List[FetchedTransaction]]],
+    transactionQueue: Optional[asyncio.Queue] = None
+) -> Optional[List[FetchedTransaction]]:
+    """Await a DEX's fetch and hand the result to the next pipeline stage.
 
-    try:
-        apiResponse = await apiResponse.json()
-        transactions = apiResponse["result"]
-    except (KeyError, ValueError, aiohttp.ContentTypeError) as e:
-        logger.debug(f"[{networkName}] {dexName}: API response parse error: {e}")
-        transactions = []
+    Args:
+        dex: The DEX the transactions were fetched for.
+        fetch: Awaitable returning the DEX's transactions, or None on failure.
+        transactionQueue: Bounded queue receiving (dex, transactions) as soon
+            as the fetch completes; waits for space when the consumer is behind.
 
-    amountOfTransactions = len(transactions)
+    Returns:
+        The fetched transactions, or None if the fetch failed.
+    """
+    transactions = await fetch
 
-    logger.info(f"[{networkName}] {dexName}: {amountOfTransactions} Transactions")
+    if transactionQueue is not None:
+        await transactionQueue.put((dex, transactions))
 
     return transactions
 
 
 async def getDexTransactions(
     dbConnection: Any,
-    dexs: List[Dict[str, Any]]
-) -> List[List[Dict[str, Any]]]:
+    dexs: List[DexRecord],
+    transactionQueue: Optional[asyncio.Queue] = None,
+    clientSession: Optional[aiohttp.ClientSession] = None,
+    rateLimiters: Optional[KeyedRateLimiter] = None,
+    chainHeads: Optional[Dict[str, Optional[int]]] = None,
+    dexCheckpoints: Optional[DexCheckpoints] = None
+) -> Dict[int, Optional[List[FetchedTransaction]]]:
     """Fetch transactions for multiple DEXs across different networks.
 
-    Iterates through DEX configurations, determines the block range to fetch
-    based on previously processed blocks, and makes async API calls to
-    retrieve transaction data.
+    Resolves the chain head of every network once, then iterates through DEX
+    configurations, determines the block range to fetch based on each DEX's
+    block checkpoint, and makes async API calls to
+    retrieve transaction data. The last block fetched is stored on the DEX as
+    end_block so the checkpoint can be advanced once its routes are uploaded.
+    DEXs that are skipped are counted per reason and logged once per run.
+
+    A long-running caller can pass its own HTTP session and rate limiters to
+    keep connections and learned explorer rates across calls; anything not
+    passed is created for the call and closed at the end, along with the
+    pooled RPC sessions.
 
     Args:
-        dbConnection: Active database connection for querying processed blocks.
+        dbConnection: Active database connection for querying checkpoints.
         dexs: List of DEX configurations containing network and contract details.
+        transactionQueue: Optional bounded queue that receives (dex, transactions)
+            for each DEX as soon as its fetch completes.
+        clientSession: Explorer HTTP session owned by the caller.
+        rateLimiters: Explorer rate limiters owned by the caller.
+        chainHeads: Block number to fetch up to per RPC URL, resolved from the
+            RPC endpoints if None.
+        dexCheckpoints: Checkpoints already read by the caller, read from
+            dbConnection if None.
 
     Returns:
-        List of transaction lists, one per DEX that had transactions to fetch.
+        Dict mapping the dex_id of every DEX that had transactions to fetch
+        to its transactions, None for failed fetches. With
+        INGESTION_SOURCE=logs the transactions are swap paths reconstructed
+        from Swap logs instead of explorer rows.
     """
     blockRange = getBlockRange()
+    ingestionSource = getIngestionSource()
+
+    # Read every DEX's checkpoint up front in a single query
+    if dexCheckpoints is None:
+        dexCheckpoints = getAllDexCheckpoints(dbConnection=dbConnection)
 
     printSeparator()
     logger.info(f"Setting Up Transaction API Calls")
     printSeparator()
 
-    # Initialize rate limiter with configured limits for API calls
-    async with RateLimiter(rate_limit=API_RATE_LIMIT, concurrency_limit=API_CONCURRENCY_LIMIT) as rate_limiter:
+    explorerRateLimits = getExplorerRateLimits()
+
+    # Initialize one rate limiter bucket per explorer and API key
+    async with (
+        nullcontext(rateLimiters) if rateLimiters is not None
+        else KeyedRateLimiter(
+            concurrency_limit=API_CONCURRENCY_LIMIT,
+            adaptive=getAdaptiveRateLimit(),
+            burst_seconds=getApiRateBurstSeconds()
+        )
+    ) as rate_limiters:
+
+        async with nullcontext(clientSession) if clientSession is not None else aiohttp.ClientSession() as session:
 
-        async with aiohttp.ClientSession() as session:
+            # Resolve each network's chain head once, concurrently
+            if chainHeads is None:
+                chainHeads = await getLatestBlockNumbers(
+                    chainRpcURLs=[dex.network_details.chain_rpc for dex in dexs]
+                )
+
+            runSkipCounts: Counter = Counter()
+
+            tasks: Dict[int, asyncio.Task[Optional[List[FetchedTransaction]]]] = {}
+
+            # DEXs reading Swap logs, per (RPC URL, first block, last block)
+            logRangeDexs: Dict[Tuple[str, int, int], List[DexRecord]] = {}
 
-            tasks: List[asyncio.Task[List[Dict[str, Any]]]] = []
             for dex in dexs:
 
                 # Network
-                networkDetails = dex["network_details"]
-                networkDbId = networkDetails["network_id"]
-                networkName = networkDetails["name"].title()
-                networkRpcURL = networkDetails["chain_rpc"]
+                networkDetails = dex.network_details
+                networkDbId = networkDetails.network_id
+                networkName = networkDetails.name.title()
+                networkRpcURL = networkDetails.chain_rpc
 
                 # Dex
-                dexDbId = dex["dex_id"]
-                dexName = dex["name"].title()
+                dexDbId = dex.dex_id
+                dexName = dex.name.title()
 
-                try:
+                # Get the block range
+                latestBlockNumber = chainHeads.get(networkRpcURL)
 
-                    # Create instance of Web3
-                    web3 = getWeb3Instance(
-                        chainRpcURL=networkRpcURL
-                    )
+                if latestBlockNumber is None:
+                    logger.warning(f"[{networkName}] [{dexName}] Chain head unavailable from {networkRpcURL}")
+                    runSkipCounts[SKIP_REASON_NO_CHAIN_HEAD] += 1
+                    continue
 
-                    # Get the block range
-                    latestBlockNumber = web3.eth.block_number
+                try:
 
-                    lastProcessedBlock = getLatestProcessedBlockNetworkIdAndDexId(
-                        dbConnection=dbConnection,
-                        networkDbId=networkDbId,
-                        dexDbId=dexDbId
-                    )
+                    lastProcessedBlock = dexCheckpoints.get((networkDbId, dexDbId))
 
                     if lastProcessedBlock:
 
                         if lastProcessedBlock >= latestBlockNumber:
+                            runSkipCounts[SKIP_REASON_UP_TO_DATE] += 1
                             continue
 
                         nextBlock = lastProcessedBlock + 1
@@ -246,40 +591,99 @@ async def getDexTransactions(
 
                     logger.info(f"[{networkName}] {dexName}: {amountOfBlocks} Blocks")
 
+                    dex.end_block = latestBlockNumber
+
+                    # Swap logs come from the network's RPC endpoint, not the explorer
+                    if ingestionSource == INGESTION_SOURCE_LOGS:
+                        logRangeDexs.setdefault((networkRpcURL, startingBlock, latestBlockNumber), []).append(dex)
+                        continue
+
+                    rate_limiter = rate_limiters.get_limiter(
+                        key=getExplorerBucketKey(networkDetails=networkDetails),
+                        rate_limit=getExplorerRateLimit(
+                            networkDetails=networkDetails,
+                            explorerRateLimits=explorerRateLimits
+                        )
+                    )
+
                     contractsToGetTransactionsFor = ["router"]
 
                     for contractType in contractsToGetTransactionsFor:
 
-                        apiEndpoint = networkDetails["explorer_api_prefix"]
-                        apiToken = networkDetails["explorer_api_key"]
-                        contractAddress = dex[contractType]
+                        apiEndpoint = networkDetails.explorer_api_prefix
+                        apiToken = networkDetails.explorer_api_key
+                        contractAddress = getattr(dex, contractType)
                         normalisedContractAddress = ''.join(e for e in contractAddress if e.isalnum())
 
-                        apiUrl = f"{apiEndpoint}/api?module=account&action=txlist&address={normalisedContractAddress}&startblock={startingBlock}&endblock={latestBlockNumber}&sort=asc"
-
-                        if apiToken:
-                            apiUrl = f"{apiUrl}&apikey={apiToken}"
-
-                        tasks.append(
-                            asyncio.ensure_future(getTransactions(clientSession=session,
-                                                                  rateLimiter=rate_limiter,
-                                                                  apiUrl=apiUrl,
-                                                                  networkName=networkName,
-                                                                  dexName=dexName,
-                                                                  )
-                                                  ))
+                        tasks[dexDbId] = asyncio.ensure_future(publishDexTransactions(
+                            dex=dex,
+                            transactionQueue=transactionQueue,
+                            fetch=getTransactionsForBlockRange(clientSession=session,
+                                                               rateLimiter=rate_limiter,
+                                                               apiEndpoint=apiEndpoint,
+                                                               apiToken=apiToken,
+                                                               contractAddress=normalisedContractAddress,
+                                                               startBlock=startingBlock,
+                                                               endBlock=latestBlockNumber,
+                                                               networkName=networkName,
+                                                               dexName=dexName,
+                                                               transactionFilter=getSwapTransactionFilter(abiDigest=dex.router_abi_digest)
+                                                               )
+                        ))
 
                 except (ConnectionError, TimeoutError, ValueError) as e:
                     logger.warning(f"[{networkName}] [{dexName}] Failed to fetch transactions: {e}")
+                    runSkipCounts[SKIP_REASON_SETUP_FAILED] += 1
                     continue
 
+            # Fetch each block range's Swap logs once and split them by factory
+            for (networkRpcURL, startingBlock, latestBlockNumber), rangeDexs in logRangeDexs.items():
+
+                swapLogRange = asyncio.ensure_future(getSwapLogRange(
+                    chainRpcURL=networkRpcURL,
+                    factoryAddresses={dex.factory.lower() for dex in rangeDexs},
+                    startBlock=startingBlock,
+                    endBlock=latestBlockNumber
+                ))
+
+                for dex in rangeDexs:
+                    tasks[dex.dex_id] = asyncio.ensure_future(publishDexTransactions(
+                        dex=dex,
+                        transactionQueue=transactionQueue,
+                        fetch=getSwapTransactionsForBlockRange(swapLogRange=swapLogRange,
+                                                               factoryAddress=dex.factory,
+                                                               startBlock=startingBlock,
+                                                               endBlock=latestBlockNumber,
+                                                               networkName=dex.network_details.name.title(),
+                                                               dexName=dex.name.title()
+                                                               )
+                    ))
+
             printSeparator(True)
 
             printSeparator()
             logger.info(f"Gathering Transactions")
             printSeparator()
 
-            results = await asyncio.gather(*tasks)
+            # Key results by DEX, so they never depend on which DEXs were skipped
+            results = dict(zip(tasks.keys(), await asyncio.gather(*tasks.values())))
+
+            for dexTransactions in results.values():
+                if dexTransactions is None:
+                    runSkipCounts[SKIP_REASON_FETCH_FAILED] += 1
+
+            fetchedCount = len(results) - runSkipCounts[SKIP_REASON_FETCH_FAILED]
+            skippedSummary = ", ".join(f"{reason} {count}" for reason, count in runSkipCounts.items()) or "none"
+            logger.info(f"[Fetch] {fetchedCount}/{len(dexs)} DEXs Fetched, Skipped: {skippedSummary}")
+
+            # Report each explorer's effective rate without exposing API keys
+            for bucketKey, limiter in rate_limiters.limiters.items():
+                logger.info(f"[Rate Limit] {bucketKey.split('|')[0]}: {limiter.effective_rate:.2f}/{limiter.rate_limit} req/s, "
+                            f"{limiter.rate_limited_count} throttled")
+
+            # A caller owning the session keeps the RPC sessions warm as well
+            if clientSession is None:
+                await closeAsyncRpcSessions()
 
             printSeparator(True)
 
@@ -0,0 +1,99 @@
+"""Streaming parser for explorer txlist responses.
+
+A txlist response holds up to 10,000 transactions, each with a multi-kilobyte
+hex input. Instead of reading the whole body and materialising every row as a
+dict, the body is parsed incrementally with ijson as it arrives: each row is
+assembled from only the fields kept on a RawTransaction, trimmed and checked
+against an optional filter before the next row is read. Neither the raw body
+nor the full rows are ever held in memory.
+
+ijson uses its C backend (yajl2_c) when available and falls back to pure
+Python otherwise.
+
+Response Format:
+    {"status": "1", "message": "OK", "result": [{...}, {...}]}
+    {"status": "0", "message": "NOTOK", "result": "Max rate limit reached"}
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import ijson
+
+from src.records.records_Transactions import RAW_TRANSACTION_FIELDS, RawTransaction, trimRawTransaction
+
+# ijson prefixes of the result value and of each transaction in it
+RESULT_PREFIX = "result"
+RESULT_ITEM_PREFIX = "result.item"
+
+# ijson events of scalar JSON values
+SCALAR_EVENTS = frozenset(("string", "number", "boolean", "null"))
+
+# ijson prefix of each field read from a transaction, anything else is
+# skipped while parsing
+KEPT_FIELD_PREFIXES = {f"{RESULT_ITEM_PREFIX}.{field}": field for field in RAW_TRANSACTION_FIELDS}
+
+
+class TxListPage(NamedTuple):
+    """Parsed txlist response.
+
+    Attributes:
+        transactions: Trimmed transactions that passed the filter, or None if
+            the result was not a list.
+        rowCount: Number of transactions in the response before filtering.
+        message: The result value when it was not a list, e.g. an explorer
+            error message, or None.
+    """
+    transactions: Optional[List[RawTransaction]]
+    rowCount: int
+    message: Optional[str]
+
+
+async def parseTxListResponse(
+    content: Any,
+    transactionFilter: Optional[Callable[[RawTransaction], bool]] = None
+) -> TxListPage:
+    """Parse a txlist response body incrementally.
+
+    Args:
+        content: Async readable body, e.g. aiohttp's ClientResponse.content.
+        transactionFilter: Predicate a transaction must pass to be kept, all
+            transactions are kept if None.
+
+    Returns:
+        TxListPage: The kept transactions and the response's row count. A
+        response without a result has neither transactions nor a message.
+
+    Raises:
+        ijson.JSONError: If the body is not valid JSON.
+        KeyError: If a transaction is missing a required field.
+        ValueError: If a transaction's blockNumber is not an integer.
+    """
+    transactions: Optional[List[RawTransaction]] = None
+    rowCount = 0
+    message: Optional[str] = None
+    row: Dict[str, Any] = {}
+
+    async for prefix, event, value in ijson.parse_async(content):
+
+        field = KEPT_FIELD_PREFIXES.get(prefix)
+
+        if field is not None:
+            if event in SCALAR_EVENTS:
+                row[field] = value
+
+        elif prefix == RESULT_ITEM_PREFIX:
+            if event == "start_map":
+                row = {}
+            elif event == "end_map":
+                rowCount += 1
+                transaction = trimRawTransaction(row=row)
+                if transactionFilter is None or transactionFilter(transaction):
+                    transactions.append(transaction)
+
+        elif prefix == RESULT_PREFIX:
+            if event == "start_array":
+                transactions = []
+            elif event in SCALAR_EVENTS:
+                message = str(value)
+
+    return TxListPage(transactions=transactions, rowCount=rowCount, message=message)
@@ -9,7 +9,7 @@
 """Web3 provider connection and RPC interaction utilities."""
 """Web3 utilities for blockchain interaction.
 Provides helpers for contract calls, transaction decoding, and network interactions."""
-"""Web3 instance creation and configuration utilities.
+"""Pooled JSON-RPC sessions for blockchain endpoints.
 """Initialize Web3 provider with fallback endpoints for RPC calls."""
 """Manage Web3 provider connections with automatic failover support."""
 # Handle Web3 provider connections and contract interactions
@@ -23,9 +23,9 @@ Provides helpers for contract calls, transaction decoding, and network interacti
 
 # TODO: Implement provider failover mechanism
 # Initialize Web3 provider connection to blockchain RPC endpoint
-This module provides functions to create properly configured Web3 instances
+This module keeps one keep-alive aiohttp session per RPC endpoint and counts
 # TODO: Add connection pooling for Web3 provider instances
-for interacting with various blockchain networks, including POA chains.
+the requests sent to each endpoint, logged at the end of a run.
 """Manages Web3 provider connections and network interactions."""
 """Web3 provider utilities and connection management."""
 """Configure Web3 provider connection and network parameters."""
@@ -42,23 +42,18 @@ for interacting with various blockchain networks, including POA chains.
 """Establish connection to blockchain RPC endpoint."""
 # TODO: Implement automatic rotation of blockchain RPC credentials
 # Web3 provider endpoint configuration for blockchain connectivity
-Supported Networks:
 """Initialize Web3 provider with given endpoint."""
 """Web3 utility functions for blockchain interaction.
 
 Provides helper functions for network connections and transaction processing.
 """
 
-    - Ethereum Mainnet (no special middleware needed)
 # Initialize web3 connection with fallback RPC endpoints
 """Utility functions for Web3 interactions and RPC calls"""
-    - Binance Smart Chain (requires POA middleware)
 """Establish connection to blockchain RPC endpoint with retry logic."""
 # Wrapper functions for Web3 interactions and provider management
 # Initialize web3 provider with network and connection configuration
-    - Polygon/Matic (requires POA middleware)
 # TODO: Implement connection pooling for web3 provider
-    - Avalanche C-Chain (requires POA middleware)
 # TODO: Implement automatic Web3 provider secrets rotation
 """Web3 utility functions for blockchain interaction and data processing."""
 # Helper functions for web3 provider interactions
@@ -71,22 +66,15 @@ Provides helper functions for network connections and transaction processing.
 # TODO: Add fallback provider handling for network failures
 # Web3 provider utilities for blockchain interaction
 # TODO: Add async support for better performance
-    - Fantom Opera (requires POA middleware)
 """Utility functions for web3 provider interactions and contract calls."""
 # Establish and maintain Web3 provider connection
-    - Arbitrum One
 # TODO: Implement connection pooling for improved Web3 provider performance
 # Performance: batch process for efficiency
 # Performance: batch process for efficiency
-    - Optimism
 
 # Refactor: simplify control flow
 # Refactor: simplify control flow
-POA Middleware:
 # Refactor: simplify control flow
-    Proof of Authority chains include additional data in block headers
-    that standard Web3 validation rejects. The geth_poa_middleware
-    handles this by relaxing validation rules.
 """
 """Initialize connection to blockchain network.
     
@@ -94,74 +82,81 @@ POA Middleware:
     network connectivity.
     """
 
-from typing import Optional
+import asyncio
+from collections import Counter
+from typing import Dict, Tuple
 # Web3 provider connection and blockchain interaction utilities
 
-from web3 import Web3
-from web3.middleware import geth_poa_middleware
-# Manage Web3 provider connections and fallback mechanisms
+import aiohttp
 
-# Layer position for POA middleware injection
-# Layer 0 means it's the first middleware to process requests
-POA_MIDDLEWARE_LAYER = 0
+from src.utils.env.env_Environment import getRpcKeepAliveTimeout, getRpcPoolSize
+# Manage Web3 provider connections and fallback mechanisms
 
-# Default request timeout in seconds for HTTP provider
+# Default request timeout in seconds for RPC requests
 DEFAULT_REQUEST_TIMEOUT = 30
 
-# Retry configuration for transient connection failures
-DEFAULT_RETRY_COUNT = 3
-RETRY_BACKOFF_FACTOR = 0.5
+# Registry of pooled async RPC sessions per RPC URL, tied to the event loop
+# that created them: (loop, session)
+asyncRpcSessions: Dict[str, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
 
-# Connection pooling note: Web3 HTTPProvider uses requests library internally
-# which handles connection pooling automatically via urllib3
+# Number of RPC requests sent through the registry, per RPC URL
+providerRequestCounts: Counter = Counter()
 
 
-def getWeb3Instance(
-    chainRpcURL: str,
-    request_timeout: Optional[int] = None
-) -> Web3:
-    """Create a Web3 instance configured for the specified RPC endpoint.
-
-    Creates a Web3 HTTP provider and injects POA middleware for compatibility
-    with Proof of Authority chains like BSC, Polygon, etc. The POA middleware
-    handles the extra data fields that POA chains include in block headers.
+def recordProviderRequest(chainRpcURL: str) -> None:
+    """Count an RPC request sent to an endpoint.
 
     Args:
-        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
-                     Should include the full URL with protocol.
-        request_timeout: Optional timeout in seconds for HTTP requests.
-                        Defaults to DEFAULT_REQUEST_TIMEOUT if not specified.
+        chainRpcURL: The RPC URL the request was sent to.
+    """
+    providerRequestCounts[chainRpcURL] += 1
+
+
+def getProviderRequestCounts() -> Dict[str, int]:
+    """Get the number of RPC requests sent per endpoint during this process.
 
     Returns:
-        Web3: Configured Web3 instance ready for blockchain interaction.
+        Dict mapping RPC URL to request count.
+    """
+    return dict(providerRequestCounts)
 
-    Raises:
-        ValueError: If chainRpcURL is empty or malformed.
 
-    Example:
-        >>> web3 = getWeb3Instance("https://bsc-dataseed.binance.org/")
-        >>> web3.eth.block_number
-        12345678
+def getAsyncRpcSession(chainRpcURL: str) -> aiohttp.ClientSession:
+    """Get the pooled aiohttp session for an RPC endpoint.
 
-    Note:
-        POA middleware is injected by default for broad compatibility.
-        This has minimal overhead on non-POA chains like Ethereum mainnet.
+    Sessions are bound to the running event loop, so a new one is created
+    when called from a different loop than the cached session's.
+
+    Args:
+        chainRpcURL: The HTTP(S) URL of the blockchain RPC endpoint.
+
+    Returns:
+        aiohttp.ClientSession: Session pooling up to RPC_POOL_SIZE keep-alive
+        connections to the endpoint.
     """
-    # Validate RPC URL is provided
-    if not chainRpcURL or not chainRpcURL.strip():
-        raise ValueError("Chain RPC URL cannot be empty")
+    loop = asyncio.get_running_loop()
+
+    cachedSession = asyncRpcSessions.get(chainRpcURL)
+    if cachedSession and cachedSession[0] is loop and not cachedSession[1].closed:
+        return cachedSession[1]
+
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=getRpcPoolSize(),
+            keepalive_timeout=getRpcKeepAliveTimeout()
+        ),
+        timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT)
+    )
+    asyncRpcSessions[chainRpcURL] = (loop, session)
 
-    # Use provided timeout or fall back to default
-    timeout = request_timeout if request_timeout is not None else DEFAULT_REQUEST_TIMEOUT
+    return session
 
-    # Initialize Web3 with HTTP provider
-    web3 = Web3(Web3.HTTPProvider(
-        chainRpcURL,
-        request_kwargs={'timeout': timeout}
-    ))
 
-    # Inject POA middleware at layer 0 for POA chain compatibility
-    # This handles the extraData field validation for POA consensus
-    web3.middleware_onion.inject(geth_poa_middleware, layer=POA_MIDDLEWARE_LAYER)
+async def closeAsyncRpcSessions() -> None:
+    """Close every pooled async RPC session owned by the running event loop."""
+    loop = asyncio.get_running_loop()
 
-    return web3
\ No newline at end of file
+    for chainRpcURL, (sessionLoop, session) in list(asyncRpcSessions.items()):
+        if sessionLoop is loop:
+            await session.close()
+            del asyncRpcSessions[chainRpcURL]
\ No newline at end of file
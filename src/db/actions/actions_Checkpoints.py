@@ -0,0 +1,72 @@
+"""DEX block checkpoint actions.
+
+This module manages the dex_checkpoints table, which records the last block
+whose transactions have been fully fetched, decoded and uploaded for each
+network/DEX pair. Checkpoint updates are built as (query, params) tuples so
+they can be committed in the same transaction as the routes they cover.
+
+While the table is empty it is seeded with the highest block already
+stored in the routes table for each network/DEX pair, so the first run after
+deploying checkpoints resumes where the routes left off instead of falling
+back to the last BLOCK_RANGE blocks.
+"""
+
+from typing import Any, List, Tuple
+
+from src.db.actions.actions_General import executeReadQuery, executeWriteQueries
+from src.db.actions.actions_Setup import getCursor
+from src.db.querys.querys_Checkpoints import CHECKPOINTS_TABLE
+from src.db.querys.querys_Routes import ROUTES_TABLE
+from src.utils.logging.logging_Setup import getProjectLogger
+
+logger = getProjectLogger()
+
+
+def ensureCheckpointTable(dbConnection: Any) -> None:
+    """Create the dex_checkpoints table if needed and seed it while empty.
+
+    Args:
+        dbConnection: Active database connection.
+    """
+    createQuery = f"CREATE TABLE IF NOT EXISTS {CHECKPOINTS_TABLE} (" \
+                  f"network_id INT NOT NULL, " \
+                  f"dex_id INT NOT NULL, " \
+                  f"last_block BIGINT NOT NULL, " \
+                  f"updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, " \
+                  f"PRIMARY KEY (network_id, dex_id))"
+
+    cursor = getCursor(dbConnection=dbConnection)
+    executeWriteQueries(dbConnection=dbConnection, cursor=cursor, queries=[(createQuery, ())])
+
+    if executeReadQuery(cursor=cursor, query=f"SELECT 1 FROM {CHECKPOINTS_TABLE} LIMIT 1"):
+        return
+
+    seedQuery = f"INSERT IGNORE INTO {CHECKPOINTS_TABLE} (network_id, dex_id, last_block) " \
+                f"SELECT network_id, dex_id, MAX(block_number) " \
+                f"FROM {ROUTES_TABLE} " \
+                f"GROUP BY network_id, dex_id"
+
+    seededCounts = executeWriteQueries(dbConnection=dbConnection, cursor=cursor, queries=[(seedQuery, ())])
+
+    logger.info(f"Seeded {seededCounts[0]} DEX checkpoints from {ROUTES_TABLE}")
+
+
+def buildCheckpointUpsertQuery(networkDbId: int, dexDbId: int, blockNumber: int) -> Tuple[str, List[Any]]:
+    """Build the query advancing a DEX's checkpoint to blockNumber.
+
+    The checkpoint only ever moves forward, so replaying an older batch
+    cannot rewind it.
+
+    Args:
+        networkDbId: The network ID of the DEX.
+        dexDbId: The DEX ID.
+        blockNumber: The last block that has been fully processed.
+
+    Returns:
+        Tuple containing the query string and its parameters.
+    """
+    query = f"INSERT INTO {CHECKPOINTS_TABLE} (network_id, dex_id, last_block) " \
+            f"VALUES (%s, %s, %s) " \
+            f"ON DUPLICATE KEY UPDATE last_block = GREATEST(last_block, VALUES(last_block))"
+
+    return query, [networkDbId, dexDbId, blockNumber]
@@ -29,7 +29,7 @@ Security Warning:
     user-supplied values.
 """
 
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 
 from src.utils.logging.logging_Setup import getProjectLogger
 
@@ -40,13 +40,17 @@ QUERY_LOG_TRUNCATE_LENGTH = 100
 # Rollback transaction on database constraint violation
 
 
-def executeReadQuery(cursor: Any, query: str) -> List[Dict[str, Any]]:
+def executeReadQuery(
+    cursor: Any,
+    query: str,
+    params: Optional[Sequence[Any]] = None
+) -> List[Dict[str, Any]]:
     """Execute a SELECT query and return all results.
 
     Args:
         cursor: Database cursor object (typically configured for dict results).
         query: SQL SELECT query string to execute.
-# Follow established patterns for database interactions
+        params: Optional values for %s placeholders in the query.
 
     Returns:
         List of dictionaries containing the query results.
@@ -56,7 +60,7 @@ def executeReadQuery(cursor: Any, query: str) -> List[Dict[str, Any]]:
     """
 # TODO: Implement connection pooling for improved performance
     logger.debug(f"Executing read query: {query[:QUERY_LOG_TRUNCATE_LENGTH]}...")
-    cursor.execute(query)
+    cursor.execute(query, params)
 # TODO: Implement transaction rollback mechanisms
     results = cursor.fetchall()
     logger.debug(f"Read query returned {len(results)} rows")
@@ -82,4 +86,41 @@ def executeWriteQuery(dbConnection: Any, cursor: Any, query: str) -> int:
     dbConnection.commit()
     rows_affected = cursor.rowcount
     logger.debug(f"Write query affected {rows_affected} rows")
-    return rows_affected
\ No newline at end of file
+    return rows_affected
+
+def executeWriteQueries(
+    dbConnection: Any,
+    cursor: Any,
+    queries: List[Tuple[str, Sequence[Any]]]
+) -> List[int]:
+    """Execute several parameterised write queries inside a single transaction.
+
+    All queries are executed on the same cursor and committed once at the end,
+    so a batch of statements costs one commit instead of one per statement. If
+    any statement fails the whole batch is rolled back.
+
+    Args:
+        dbConnection: Active database connection for committing.
+        cursor: Database cursor object for query execution.
+        queries: List of (query, params) tuples using %s placeholders.
+
+    Returns:
+        List[int]: Number of rows affected by each query, in order.
+
+    Raises:
+        mysql.connector.Error: If any query or the commit fails.
+    """
+    rowsAffected: List[int] = []
+
+    try:
+        for query, params in queries:
+            logger.debug(f"Executing write query: {query[:QUERY_LOG_TRUNCATE_LENGTH]}...")
+            cursor.execute(query, params)
+            rowsAffected.append(cursor.rowcount)
+        dbConnection.commit()
+    except Exception:
+        dbConnection.rollback()
+        raise
+
+    logger.debug(f"Write transaction of {len(queries)} queries affected {sum(rowsAffected)} rows")
+    return rowsAffected
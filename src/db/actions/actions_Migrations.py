@@ -0,0 +1,196 @@
+"""One-off schema migrations.
+
+This module holds migrations that have to be applied to an existing database
+before a new feature can be enabled. They are idempotent and can be re-run.
+
+Route Fingerprint Migration:
+    Adds the route_fingerprint column and its unique index to the routes
+    table, then backfills the fingerprint for existing rows in block number
+    windows so each UPDATE stays small. Existing rows that duplicate an
+    already fingerprinted route cannot take its fingerprint and are deleted,
+    so re-running the migration does not scan them again. Once complete, set
+    ROUTE_DEDUP_MODE to 'fingerprint'.
+
+Usage:
+    python -m src.db.actions.actions_Migrations
+"""
+
+from typing import Any
+
+from src.db.actions.actions_General import executeReadQuery, executeWriteQueries
+from src.db.actions.actions_Routes import ROUTE_FINGERPRINT_COLUMN, ROUTE_FINGERPRINT_SEPARATOR, ROUTES_TABLE
+from src.db.actions.actions_Setup import getCursor
+from src.utils.logging.logging_Setup import getProjectLogger
+
+logger = getProjectLogger()
+
+# Name of the unique index backing fingerprint deduplication
+ROUTE_FINGERPRINT_INDEX = "ux_routes_route_fingerprint"
+
+# Number of blocks covered by each backfill UPDATE
+BACKFILL_BLOCK_STEP = 100000
+
+
+def getRouteFingerprintSql(table: str) -> str:
+    """Get the SQL equivalent of actions_Routes.getRouteFingerprint.
+
+    Args:
+        table: Table name or alias the route columns are read from.
+
+    Returns:
+        str: SQL expression computing the fingerprint of a routes row.
+    """
+    return f"MD5(CONCAT({table}.network_id, '{ROUTE_FINGERPRINT_SEPARATOR}', " \
+           f"LOWER({table}.transaction_hash), '{ROUTE_FINGERPRINT_SEPARATOR}', {table}.route))"
+
+
+def hasColumn(dbConnection: Any, table: str, column: str) -> bool:
+    """Check whether a column exists on a table in the current database.
+
+    Args:
+        dbConnection: Active database connection.
+        table: Table name.
+        column: Column name.
+
+    Returns:
+        bool: True if the column exists.
+    """
+    query = "SELECT 1 FROM information_schema.COLUMNS " \
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s"
+
+    cursor = getCursor(dbConnection=dbConnection)
+    return len(executeReadQuery(cursor=cursor, query=query, params=(table, column))) > 0
+
+
+def hasIndex(dbConnection: Any, table: str, index: str) -> bool:
+    """Check whether an index exists on a table in the current database.
+
+    Args:
+        dbConnection: Active database connection.
+        table: Table name.
+        index: Index name.
+
+    Returns:
+        bool: True if the index exists.
+    """
+    query = "SELECT 1 FROM information_schema.STATISTICS " \
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s"
+
+    cursor = getCursor(dbConnection=dbConnection)
+    return len(executeReadQuery(cursor=cursor, query=query, params=(table, index))) > 0
+
+
+def addRouteFingerprintColumn(dbConnection: Any) -> None:
+    """Add the route_fingerprint column and its unique index if missing.
+
+    The index is created before the backfill so that rows duplicating an
+    existing fingerprint are skipped by UPDATE IGNORE rather than blocking
+    the index creation.
+
+    Args:
+        dbConnection: Active database connection.
+    """
+    cursor = getCursor(dbConnection=dbConnection)
+
+    if not hasColumn(dbConnection=dbConnection, table=ROUTES_TABLE, column=ROUTE_FINGERPRINT_COLUMN):
+        logger.info(f"[Migration] Adding {ROUTES_TABLE}.{ROUTE_FINGERPRINT_COLUMN}")
+        executeWriteQueries(
+            dbConnection=dbConnection,
+            cursor=cursor,
+            queries=[(f"ALTER TABLE {ROUTES_TABLE} ADD COLUMN {ROUTE_FINGERPRINT_COLUMN} CHAR(32) NULL", ())]
+        )
+
+    if not hasIndex(dbConnection=dbConnection, table=ROUTES_TABLE, index=ROUTE_FINGERPRINT_INDEX):
+        logger.info(f"[Migration] Adding unique index {ROUTE_FINGERPRINT_INDEX}")
+        executeWriteQueries(
+            dbConnection=dbConnection,
+            cursor=cursor,
+            queries=[(f"ALTER TABLE {ROUTES_TABLE} ADD UNIQUE INDEX {ROUTE_FINGERPRINT_INDEX} ({ROUTE_FINGERPRINT_COLUMN})", ())]
+        )
+
+
+def backfillRouteFingerprints(dbConnection: Any, blockStep: int = BACKFILL_BLOCK_STEP) -> int:
+    """Compute the fingerprint for existing routes that do not have one.
+
+    Walks the routes table in block_number windows of blockStep blocks,
+    committing after each window so progress survives interruptions. Rows
+    that duplicate an already fingerprinted route are skipped by the UPDATE
+    and then deleted, otherwise every re-run would scan them again.
+
+    Args:
+        dbConnection: Active database connection.
+        blockStep: Number of blocks covered by each UPDATE.
+
+    Returns:
+        int: Number of rows that were given a fingerprint.
+    """
+    cursor = getCursor(dbConnection=dbConnection)
+
+    bounds = executeReadQuery(
+        cursor=cursor,
+        query=f"SELECT MIN(block_number) AS min_block, MAX(block_number) AS max_block "
+              f"FROM {ROUTES_TABLE} WHERE {ROUTE_FINGERPRINT_COLUMN} IS NULL"
+    )
+
+    if not bounds or bounds[0]["min_block"] is None:
+        logger.info("[Migration] No routes to backfill")
+        return 0
+
+    minBlock = int(bounds[0]["min_block"])
+    maxBlock = int(bounds[0]["max_block"])
+
+    query = f"UPDATE IGNORE {ROUTES_TABLE} " \
+            f"SET {ROUTE_FINGERPRINT_COLUMN} = {getRouteFingerprintSql(table=ROUTES_TABLE)} " \
+            f"WHERE {ROUTE_FINGERPRINT_COLUMN} IS NULL AND block_number >= %s AND block_number < %s"
+
+    # Rows still without a fingerprint whose fingerprint another row already holds
+    duplicateQuery = f"DELETE duplicate FROM {ROUTES_TABLE} AS duplicate " \
+                     f"JOIN {ROUTES_TABLE} AS fingerprinted " \
+                     f"ON fingerprinted.{ROUTE_FINGERPRINT_COLUMN} = {getRouteFingerprintSql(table='duplicate')} " \
+                     f"WHERE duplicate.{ROUTE_FINGERPRINT_COLUMN} IS NULL " \
+                     f"AND duplicate.block_number >= %s AND duplicate.block_number < %s"
+
+    rowsUpdated = 0
+    rowsDeleted = 0
+    for windowStart in range(minBlock, maxBlock + 1, blockStep):
+        windowEnd = windowStart + blockStep
+
+        updatedRows, deletedRows = executeWriteQueries(
+            dbConnection=dbConnection,
+            cursor=cursor,
+            queries=[(query, (windowStart, windowEnd)), (duplicateQuery, (windowStart, windowEnd))]
+        )
+        rowsUpdated = rowsUpdated + updatedRows
+        rowsDeleted = rowsDeleted + deletedRows
+
+        logger.info(f"[Migration] Backfilled blocks {windowStart}-{min(windowEnd, maxBlock + 1) - 1}: "
+                    f"{rowsUpdated} rows, {rowsDeleted} duplicates deleted")
+
+    return rowsUpdated
+
+
+def migrateRouteFingerprints(dbConnection: Any) -> int:
+    """Run the complete route fingerprint migration.
+
+    Args:
+        dbConnection: Active database connection.
+
+    Returns:
+        int: Number of rows that were given a fingerprint.
+    """
+    addRouteFingerprintColumn(dbConnection=dbConnection)
+    return backfillRouteFingerprints(dbConnection=dbConnection)
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    from src.db.actions.actions_Setup import initDBConnection
+    from src.utils.logging.logging_Setup import setupLogging
+
+    setupLogging()
+
+    backfilledRows = migrateRouteFingerprints(dbConnection=initDBConnection())
+    logger.info(f"[Migration] Route fingerprint migration complete, {backfilledRows} rows backfilled")
@@ -61,12 +61,17 @@ Database Schema:
 
 # Insert route with validity check
 # Insert or update route information in database
-from typing import Any, Optional
+import hashlib
+from typing import Any, List, Optional, Tuple
 
-from src.db.actions.actions_General import executeWriteQuery
+from src.db.actions.actions_Checkpoints import buildCheckpointUpsertQuery
+from src.db.actions.actions_General import executeWriteQueries, executeWriteQuery
 from src.db.actions.actions_Setup import getCursor
+from src.db.cache.cache_Tokens import TokenIdResolver
 # Database operations for route record management
 from src.db.querys.querys_Tokens import getTokenByNetworkIdAndAddress
+from src.records.records_Routes import RouteRow
+from src.utils.env.env_Environment import ROUTE_DEDUP_MODE_FINGERPRINT, getRouteDedupMode, getRouteInsertChunkSize
 from src.utils.logging.logging_Setup import getProjectLogger
 
 logger = getProjectLogger()
@@ -78,7 +83,6 @@ ROUTES_TABLE = "routes"
 # Core columns that are always required for route records
 # Insert route with transaction hash linkage
 CORE_ROUTE_COLUMNS = [
-"""Update route cache with latest blockchain state."""
     "network_id", "dex_id", "token_in_id", "token_in_address",
     "token_out_id", "token_out_address", "route", "method",
     "transaction_hash", "block_number"
@@ -86,6 +90,16 @@ CORE_ROUTE_COLUMNS = [
 
 # Optional columns that may be included based on transaction data
 OPTIONAL_ROUTE_COLUMNS = ["amount_in", "amount_out", "tx_timestamp"]
+
+# Optional columns that may legitimately be NULL and need a null-safe comparison
+NULLABLE_ROUTE_COLUMNS = ["amount_in", "amount_out"]
+
+# Column holding the compact route identity backed by a unique index
+ROUTE_FINGERPRINT_COLUMN = "route_fingerprint"
+
+# Separator used between the fields hashed into a route fingerprint
+ROUTE_FINGERPRINT_SEPARATOR = ":"
+
 """Handle database operations for route management and updates."""
 
 
@@ -201,3 +215,218 @@ def addRouteToDB(
             return cursor.lastrowid
 
     return None
+
+
+def getRouteFingerprint(networkDbId: int, transactionHash: str, route: str) -> str:
+    """Compute the compact identity of a route.
+
+    A route is identified by the network, the transaction it was found in and
+    its path. The SQL backfill in actions_Migrations builds the same value
+    with MD5(CONCAT(...)), so both must stay in sync.
+
+    Args:
+        networkDbId: The network ID where the route was found.
+        transactionHash: The blockchain transaction hash.
+        route: The swap route path as a string representation.
+
+    Returns:
+        str: 32 character hex MD5 digest.
+    """
+    fingerprintSource = ROUTE_FINGERPRINT_SEPARATOR.join([str(networkDbId), transactionHash.lower(), route])
+    return hashlib.md5(fingerprintSource.encode()).hexdigest()
+
+
+def buildRouteInsertIgnoreQuery(rowValues: List[Tuple[Any, ...]]) -> Tuple[str, List[Any]]:
+    """Build a parameterised multi-row insert deduplicated by route fingerprint.
+
+    Rows whose fingerprint already exists hit the unique index and are
+    skipped by INSERT IGNORE without scanning the routes table. Skipped rows
+    report 0 affected rows, also under CLIENT_FOUND_ROWS, so the affected
+    row count is the number of routes inserted.
+
+    Args:
+        rowValues: Column value tuples ordered like CORE_ROUTE_COLUMNS,
+                   OPTIONAL_ROUTE_COLUMNS and finally the route fingerprint.
+
+    Returns:
+        Tuple containing the query string and its flattened parameters.
+    """
+    columns = CORE_ROUTE_COLUMNS + OPTIONAL_ROUTE_COLUMNS + [ROUTE_FINGERPRINT_COLUMN]
+    keys = ", ".join(columns)
+
+    rowPlaceholders = "(" + ", ".join("%s" for _ in columns) + ")"
+    values = ", ".join([rowPlaceholders] * len(rowValues))
+
+    query = f"INSERT IGNORE INTO {ROUTES_TABLE} ({keys}) " \
+            f"VALUES {values}"
+
+    params = [value for row in rowValues for value in row]
+
+    return query, params
+
+
+def buildRouteInsertQuery(rowValues: List[Tuple[Any, ...]]) -> Tuple[str, List[Any]]:
+    """Build a parameterised multi-row insert that skips routes already stored.
+
+    The rows are packed into a UNION ALL derived table and inserted with a
+    single INSERT ... SELECT, keeping the existing full-row NOT EXISTS
+    duplicate check. NULL-able amount columns are compared null-safely.
+
+    Args:
+        rowValues: Column value tuples ordered like CORE_ROUTE_COLUMNS
+                   followed by OPTIONAL_ROUTE_COLUMNS.
+
+    Returns:
+        Tuple containing the query string and its flattened parameters.
+    """
+    columns = CORE_ROUTE_COLUMNS + OPTIONAL_ROUTE_COLUMNS
+    keys = ", ".join(columns)
+
+    firstSelect = "SELECT " + ", ".join(f"%s AS {column}" for column in columns)
+    nextSelect = "SELECT " + ", ".join("%s" for _ in columns)
+    derivedTable = " UNION ALL ".join([firstSelect] + [nextSelect] * (len(rowValues) - 1))
+
+    compareStatement = " AND ".join(
+        f"{ROUTES_TABLE}.{column} <=> tmp.{column}" if column in NULLABLE_ROUTE_COLUMNS
+        else f"{ROUTES_TABLE}.{column} = tmp.{column}"
+        for column in columns
+    )
+
+    query = f"INSERT INTO {ROUTES_TABLE} ({keys}) " \
+            f"SELECT * FROM ({derivedTable}) AS tmp " \
+            f"WHERE NOT EXISTS " \
+            f"(SELECT 1 FROM {ROUTES_TABLE} WHERE {compareStatement})"
+
+    params = [value for row in rowValues for value in row]
+
+    return query, params
+
+
+def addRoutesToDB(
+    dbConnection: Any,
+    networkDbId: int,
+    dexDbId: int,
+    routes: List[RouteRow],
+    tokenResolver: Optional[TokenIdResolver] = None,
+    chunkSize: Optional[int] = None,
+    checkpointBlock: Optional[int] = None
+) -> List[int]:
+    """Insert a DEX's decoded routes using chunked multi-row inserts.
+
+    Resolves the token IDs for the batch from the token resolver, drops
+    routes whose tokens are unknown and exact duplicates within the batch,
+    then writes the remainder as parameterised multi-row inserts of
+    chunkSize rows. All chunks are committed together in one transaction.
+
+    Duplicates against stored routes are detected according to
+    ROUTE_DEDUP_MODE: either the full-row NOT EXISTS comparison or the
+    unique route fingerprint index.
+
+    If checkpointBlock is given the DEX's block checkpoint is advanced in the
+    same transaction, so the checkpoint never gets ahead of stored routes.
+
+    Args:
+        dbConnection: Active database connection.
+        networkDbId: The network ID where the routes were found.
+        dexDbId: The DEX ID where the swaps occurred.
+        routes: Decoded routes, see RouteRow for the expected keys.
+        tokenResolver: Shared token ID cache. A throwaway resolver is used
+                       if not provided.
+        chunkSize: Rows per insert statement. Defaults to ROUTE_INSERT_CHUNK_SIZE.
+        checkpointBlock: Last block covered by this batch of routes.
+
+    Returns:
+        List[int]: Number of routes inserted by each chunk, in order.
+    """
+    if not routes and checkpointBlock is None:
+        return []
+
+    if chunkSize is None:
+        chunkSize = getRouteInsertChunkSize()
+
+    useFingerprint = getRouteDedupMode() == ROUTE_DEDUP_MODE_FINGERPRINT
+
+    cursor = getCursor(dbConnection=dbConnection)
+
+    if tokenResolver is None:
+        tokenResolver = TokenIdResolver(dbConnection=dbConnection)
+
+    # Load any tokens not already cached with one query for the whole batch
+    tokenResolver.prefetchAddresses(
+        networkDbId=networkDbId,
+        tokenAddresses=[
+            tokenAddress for route in routes
+            for tokenAddress in (route["tokenInAddress"], route["tokenOutAddress"])
+        ]
+    )
+
+    rowValues: List[Tuple[Any, ...]] = []
+    seenRows = set()
+    for route in routes:
+
+        tokenInId = tokenResolver.getTokenId(networkDbId=networkDbId, tokenAddress=route["tokenInAddress"])
+        tokenOutId = tokenResolver.getTokenId(networkDbId=networkDbId, tokenAddress=route["tokenOutAddress"])
+
+        if not (tokenInId and tokenOutId):
+            continue
+
+        row = (
+            networkDbId,
+            dexDbId,
+            tokenInId,
+            route["tokenInAddress"],
+            tokenOutId,
+            route["tokenOutAddress"],
+            route["route"],
+            route["method"],
+            route["transactionHash"],
+            route["blockNumber"],
+            route["amountIn"] or None,
+            route["amountOut"] or None,
+            route["txTimestamp"]
+        )
+
+        if useFingerprint:
+            routeFingerprint = getRouteFingerprint(
+                networkDbId=networkDbId,
+                transactionHash=route["transactionHash"],
+                route=route["route"]
+            )
+            if routeFingerprint in seenRows:
+                continue
+            seenRows.add(routeFingerprint)
+            rowValues.append(row + (routeFingerprint,))
+
+        elif row not in seenRows:
+            seenRows.add(row)
+            rowValues.append(row)
+
+    if not rowValues and checkpointBlock is None:
+        return []
+
+    buildQuery = buildRouteInsertIgnoreQuery if useFingerprint else buildRouteInsertQuery
+    queries = [
+        buildQuery(rowValues=rowValues[i:i + chunkSize])
+        for i in range(0, len(rowValues), chunkSize)
+    ]
+
+    if checkpointBlock is not None:
+        queries.append(buildCheckpointUpsertQuery(
+            networkDbId=networkDbId,
+            dexDbId=dexDbId,
+            blockNumber=checkpointBlock
+        ))
+
+    insertedCounts = executeWriteQueries(
+        dbConnection=dbConnection,
+        cursor=cursor,
+        queries=queries
+    )
+
+    # Drop the checkpoint statement's count, only route chunks are reported
+    if checkpointBlock is not None:
+        insertedCounts = insertedCounts[:-1]
+
+    logger.debug(f"Inserted {sum(insertedCounts)}/{len(rowValues)} routes in {len(insertedCounts)} chunks")
+
+    return insertedCounts
@@ -0,0 +1,127 @@
+"""In-memory token ID resolution.
+
+This module provides a resolver that maps (network, token address) pairs to
+token IDs from the tokens table. Whole networks are prefetched in one query
+each at startup and any addresses still unknown when a batch of routes is
+uploaded are loaded with a single IN query, so route uploads no longer need
+one tokens lookup per token per route.
+
+Address keys are lower-cased, so checksummed and lower-case spellings of the
+same token resolve to the same ID.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.db.querys.querys_Tokens import TOKEN_ID_KEY, getTokensByNetworkId, getTokensByNetworkIdAndAddresses
+from src.utils.logging.logging_Setup import getProjectLogger
+
+logger = getProjectLogger()
+
+
+def normaliseTokenAddress(tokenAddress: str) -> str:
+    """Normalise a token address for use as a cache key.
+
+    Args:
+        tokenAddress: Token contract address in any letter case.
+
+    Returns:
+        str: The lower-cased address with surrounding whitespace removed.
+    """
+    return tokenAddress.strip().lower()
+
+
+class TokenIdResolver:
+    """Cache of token IDs keyed by network ID and normalised token address.
+
+    Attributes:
+        dbConnection: Database connection used to load tokens.
+        hits: Number of lookups answered from memory.
+        misses: Number of lookups for tokens that are not in the tokens table.
+    """
+
+    def __init__(self, dbConnection: Any) -> None:
+        """Initialize an empty resolver.
+
+        Args:
+            dbConnection: Active database connection used to load tokens.
+        """
+        self.dbConnection = dbConnection
+        self.hits = 0
+        self.misses = 0
+        self._tokenIds: Dict[int, Dict[str, int]] = {}
+        self._prefetchedNetworks: Set[int] = set()
+
+    def _storeTokens(self, networkDbId: int, tokens: List[Dict[str, Any]]) -> None:
+        """Add token rows to the cache, keeping the lowest ID for duplicates.
+
+        Args:
+            networkDbId: The network the tokens belong to.
+            tokens: Rows containing token_id and address.
+        """
+        networkTokens = self._tokenIds.setdefault(networkDbId, {})
+        for token in tokens:
+            tokenKey = normaliseTokenAddress(token["address"])
+            tokenId = token[TOKEN_ID_KEY]
+            if tokenKey not in networkTokens or tokenId < networkTokens[tokenKey]:
+                networkTokens[tokenKey] = tokenId
+
+    def prefetchNetworks(self, networkDbIds: Iterable[int]) -> None:
+        """Load the complete token table for each network not yet prefetched.
+
+        Args:
+            networkDbIds: Network IDs to prefetch, one query per network.
+        """
+        for networkDbId in networkDbIds:
+            if networkDbId in self._prefetchedNetworks:
+                continue
+
+            tokens = getTokensByNetworkId(dbConnection=self.dbConnection, networkDbId=networkDbId)
+            self._storeTokens(networkDbId=networkDbId, tokens=tokens)
+            self._prefetchedNetworks.add(networkDbId)
+
+            logger.info(f"[Token Cache] Prefetched {len(tokens)} tokens for network {networkDbId}")
+
+    def prefetchAddresses(self, networkDbId: int, tokenAddresses: Iterable[str]) -> None:
+        """Load any addresses not already cached with a single IN query.
+
+        Addresses that are still unknown after the query are not cached, so
+        tokens added to the table later in the run can still be resolved.
+
+        Args:
+            networkDbId: The network the addresses belong to.
+            tokenAddresses: Token addresses seen in a batch of routes.
+        """
+        networkTokens = self._tokenIds.get(networkDbId, {})
+        unknownAddresses = sorted({
+            normaliseTokenAddress(tokenAddress) for tokenAddress in tokenAddresses
+            if normaliseTokenAddress(tokenAddress) not in networkTokens
+        })
+
+        if not unknownAddresses:
+            return
+
+        tokens = getTokensByNetworkIdAndAddresses(
+            dbConnection=self.dbConnection,
+            networkDbId=networkDbId,
+            tokenAddresses=unknownAddresses
+        )
+        self._storeTokens(networkDbId=networkDbId, tokens=tokens)
+
+    def getTokenId(self, networkDbId: int, tokenAddress: str) -> Optional[int]:
+        """Look up a token ID from memory.
+
+        Args:
+            networkDbId: The network the token belongs to.
+            tokenAddress: The token contract address in any letter case.
+
+        Returns:
+            int: The token ID, or None if the token is not known.
+        """
+        tokenId = self._tokenIds.get(networkDbId, {}).get(normaliseTokenAddress(tokenAddress))
+
+        if tokenId is None:
+            self.misses = self.misses + 1
+        else:
+            self.hits = self.hits + 1
+
+        return tokenId
@@ -0,0 +1,40 @@
+"""DEX block checkpoint query utilities.
+
+This module provides functions for reading the last fully processed block of
+every network/DEX pair from the dex_checkpoints table, which is used to decide
+where each DEX resumes fetching transactions.
+"""
+
+from typing import Any, Dict, Tuple
+
+from src.db.actions.actions_General import executeReadQuery
+from src.db.actions.actions_Setup import getCursor
+
+# Database table name for DEX block checkpoints
+CHECKPOINTS_TABLE = "dex_checkpoints"
+
+# Type alias for checkpoints keyed by (network_id, dex_id)
+DexCheckpoints = Dict[Tuple[int, int], int]
+
+
+def getAllDexCheckpoints(dbConnection: Any) -> DexCheckpoints:
+    """Retrieve the last processed block for every network/DEX pair.
+
+    Args:
+        dbConnection: Active database connection.
+
+    Returns:
+        Dict mapping (network_id, dex_id) to the last fully processed block.
+    """
+    query = (
+        f"SELECT network_id, dex_id, last_block "
+        f"FROM {CHECKPOINTS_TABLE}"
+    )
+
+    cursor = getCursor(dbConnection=dbConnection)
+    results = executeReadQuery(cursor=cursor, query=query)
+
+    return {
+        (int(result["network_id"]), int(result["dex_id"])): int(result["last_block"])
+        for result in results
+    }
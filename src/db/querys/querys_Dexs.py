@@ -1,82 +1,85 @@
-"""Module for querying DEX data from the database."""
 """DEX query utilities.
-# TODO: Implement query result caching for frequently accessed DEXs
-"""Database queries for DEX liquidity pool information."""
-# Query DEX liquidity pools and token pairs
-"""Query functions for DEX protocols and exchange data."""
 
 This module provides functions for querying DEX (Decentralized Exchange)
-"""Query liquidity pools and swap data from DEX protocols."""
 configurations from the database, including filtering for valid ABIs
-"""Query DEX trading data and liquidity pools from database."""
-# Filter tokens by DEX and exclude blacklisted pairs
-# Filter DEX results by network and timestamp
 and supported network explorer types.
-# TODO: Add Redis caching layer for DEX pair lookups
-# Filter DEX entries by liquidity pool address and token pairs
-# Query DEX configurations and supported tokens
-# Query stored DEX aggregation data and pricing information
-# Filter DEX pools by liquidity and trading volume
-# Filter DEX pools by liquidity threshold to prioritize high-volume routes
 
 Supported Explorer Types:
-# Filter DEX results by protocol type and network to reduce result set
-
-# Filter DEX data by token pairs and liquidity
-"""Query functions for DEX liquidity pool data."""
-"""Handle DEX-related database queries."""
-# Filter exchanges by supported tokens and liquidity thresholds
-# Query DEX liquidity pools and trading pair information from database
-# Consider indexing on frequently queried columns for performance
-"""Query DEX routing rules and token pair configurations."""
-# Query supported DEX protocols and liquidity pools
-# TODO: Optimize DEX query performance for large datasets
     - 'scan': Etherscan-compatible APIs (BSCScan, PolygonScan, etc.)
-# Apply filters before joining to reduce query scope
     - 'blockscout': Blockscout-based explorers
-# TODO: Add database indexes to optimize DEX query performance
-# Query supported DEX platforms and their metadata
 """
 
-# Filter DEX data by supported networks
 import os
-from typing import Any, Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List
 
 from src.db.actions.actions_General import executeReadQuery
+from src.db.actions.actions_Migrations import hasColumn
 from src.db.actions.actions_Setup import getCursor
+from src.records.records_Dexs import (
+    DEX_COLUMNS,
+    NETWORK_COLUMN_PREFIX,
+    NETWORK_COLUMNS,
+    NETWORK_RATE_LIMIT_COLUMN,
+    DexRecord,
+    buildDexRecords
+)
 from src.sniffer.sniffer_Process import processDexInformation
 from src.utils.data.data_Booleans import strToBool
+from src.utils.env.env_Environment import getAbiFetchWorkers
 from src.utils.logging.logging_Print import printSeparator
 from src.utils.logging.logging_Setup import getProjectLogger
-# Apply token filtering logic to DEX results
 
 logger = getProjectLogger()
 
 # Supported blockchain explorer types for transaction fetching
 SUPPORTED_EXPLORER_TYPES = ("scan", "blockscout")
-# Map DEX identifiers to network-specific contract addresses
 
 # Maximum number of DEXs to process in lazy mode (for testing)
 # This limit helps reduce API calls and database load during development
-# Helper functions for DEX liquidity pool queries
 LAZY_MODE_DEX_LIMIT = 9
 
 
-# Filter DEX queries by chain and timestamp range
-def getAllDexsWithABIs(dbConnection: Any) -> List[Dict[str, Any]]:
-# Filters by token pair and liquidity pool address
-"""Query DEX routes from the database with flexible filtering."""
+def getDexSelectColumns(dbConnection: Any) -> str:
+    """Build the explicit column list of the joined DEX and network query.
+
+    Network columns are prefixed with NETWORK_COLUMN_PREFIX so they do not
+    clash with DEX columns. The optional explorer_rate_limit column is only
+    selected when the networks table has it.
+
+    Args:
+        dbConnection: Active database connection object.
+
+    Returns:
+        str: Comma separated column list for the SELECT clause.
+    """
+    networkColumns = list(NETWORK_COLUMNS)
+    if hasColumn(dbConnection=dbConnection, table="networks", column=NETWORK_RATE_LIMIT_COLUMN):
+        networkColumns.append(NETWORK_RATE_LIMIT_COLUMN)
+
+    return ", ".join(
+        [f"dexs.{column}" for column in DEX_COLUMNS]
+        + [f"networks.{column} AS {NETWORK_COLUMN_PREFIX}{column}" for column in networkColumns]
+    )
+
+
+def getAllDexsWithABIs(dbConnection: Any) -> List[DexRecord]:
     """Retrieve all DEXs from database that have valid ABIs configured.
 
-    Fetches DEXs with valid factory and router addresses, processes them
-    to include network details, and returns the complete DEX information.
-    Supports lazy mode via LAZY_MODE environment variable for testing.
+    Fetches DEXs with valid factory and router addresses joined to their
+    network in a single query, materialised into DexRecords that share one
+    NetworkRecord per network. The DEXs are then processed concurrently in
+    a thread pool so their ABI downloads overlap. The returned DEXs keep the
+    database order, and a DEX that fails to process is logged and skipped
+    without affecting the others.
+    Supports lazy mode via LAZY_MODE environment variable for testing, which
+    processes the DEXs one at a time and returns only the first that succeeds.
 
     Args:
         dbConnection: Active database connection object.
 
     Returns:
-        List of processed DEX dictionaries with network details and ABIs.
+        List of processed DEX records with network details and ABIs.
     """
 
     lazyMode = strToBool(os.getenv("LAZY_MODE"))
@@ -91,17 +94,17 @@ def getAllDexsWithABIs(dbConnection: Any) -> List[Dict[str, Any]]:
                  "AND (networks.explorer_type='scan' OR networks.explorer_type='blockscout')"
 
     query = "" \
-            f"SELECT dexs.* " \
+            f"SELECT {getDexSelectColumns(dbConnection=dbConnection)} " \
             f"FROM dexs " \
             f"JOIN networks ON dexs.network_id = networks.network_id " \
             f"WHERE {conditions}"
 
     cursor = getCursor(dbConnection=dbConnection)
 
-    dexs = executeReadQuery(
+    dexs = buildDexRecords(rows=executeReadQuery(
         cursor=cursor,
         query=query
-    )
+    ))
 
     # In lazy mode, limit DEX count for faster testing cycles
     if lazyMode:
@@ -111,24 +114,36 @@ def getAllDexsWithABIs(dbConnection: Any) -> List[Dict[str, Any]]:
     logger.info(f"[DB Query] Retrieved {dexCount} DEXs with valid ABIs from database")
     printSeparator()
 
-    finalDexs: List[Dict[str, Any]] = []
-    cachedNetworkDetails: Dict[int, Dict[str, Any]] = {}
-    for dex in dexs:
-        dexIndex = dexs.index(dex)
+    finalDexs: List[DexRecord] = []
 
-        try:
-            processedDex, cachedNetworkDetails = processDexInformation(
-                dbConnection=dbConnection,
+    # Lazy mode keeps only the first DEX that processes, so ABIs are
+    # downloaded one at a time and no further than needed
+    if lazyMode:
+        for dexIndex, dex in enumerate(dexs):
+            try:
+                finalDexs.append(processDexInformation(dex=dex, dexIndex=dexIndex, dexCount=dexCount))
+                break
+            except Exception as e:
+                logger.warning(f"Failed to process dex at index {dexIndex}: {e}")
+
+        printSeparator(True)
+
+        return finalDexs
+
+    dexFutures: List[Future] = []
+    with ThreadPoolExecutor(max_workers=getAbiFetchWorkers(), thread_name_prefix="dex") as executor:
+        for dexIndex, dex in enumerate(dexs):
+            dexFutures.append(executor.submit(
+                processDexInformation,
                 dex=dex,
                 dexIndex=dexIndex,
-                dexCount=dexCount,
-                cachedNetworkDetails=cachedNetworkDetails
-            )
+                dexCount=dexCount
+            ))
 
-            finalDexs.append(processedDex)
+    for dexIndex, dexFuture in enumerate(dexFutures):
 
-            if lazyMode:
-                break
+        try:
+            finalDexs.append(dexFuture.result())
         except Exception as e:
             logger.warning(f"Failed to process dex at index {dexIndex}: {e}")
             continue
@@ -96,4 +96,55 @@ def getTokenByNetworkIdAndAddress(
     else:
         # Multiple matches (edge case) - return the one with the lowest token_id
         # This ensures consistent behavior when duplicates exist
-        return sorted(result, key=lambda d: d[TOKEN_ID_KEY])[0]
\ No newline at end of file
+        return sorted(result, key=lambda d: d[TOKEN_ID_KEY])[0]
+
+
+def getTokensByNetworkId(dbConnection: Any, networkDbId: int) -> List[Dict[str, Any]]:
+    """Retrieve the ID and address of every token on a network.
+
+    Used to prefetch a network's whole token table in a single query.
+
+    Args:
+        dbConnection: Active database connection.
+        networkDbId: The network ID to load tokens for.
+
+    Returns:
+        List of dicts containing token_id and address.
+    """
+    query = (
+        f"SELECT {TOKEN_ID_KEY}, address "
+        f"FROM {TOKENS_TABLE} "
+        f"WHERE network_id=%s"
+    )
+
+    cursor = getCursor(dbConnection=dbConnection)
+    return executeReadQuery(cursor=cursor, query=query, params=(networkDbId,))
+
+
+def getTokensByNetworkIdAndAddresses(
+    dbConnection: Any,
+    networkDbId: int,
+    tokenAddresses: List[str]
+) -> List[Dict[str, Any]]:
+    """Retrieve the ID and address of several tokens on a network at once.
+
+    Args:
+        dbConnection: Active database connection.
+        networkDbId: The network ID where the tokens exist.
+        tokenAddresses: Contract addresses to look up.
+
+    Returns:
+        List of dicts containing token_id and address for the tokens found.
+    """
+    if not tokenAddresses:
+        return []
+
+    placeholders = ", ".join(["%s"] * len(tokenAddresses))
+    query = (
+        f"SELECT {TOKEN_ID_KEY}, address "
+        f"FROM {TOKENS_TABLE} "
+        f"WHERE network_id=%s AND address IN ({placeholders})"
+    )
+
+    cursor = getCursor(dbConnection=dbConnection)
+    return executeReadQuery(cursor=cursor, query=query, params=(networkDbId, *tokenAddresses))
@@ -0,0 +1,115 @@
+"""Typed records for DEX and network configuration.
+
+DEXs are loaded from a single query joining dexs to networks and
+materialised into these slotted records. Every DEX on a network shares the
+same NetworkRecord, and slots keep the per-DEX overhead to a fixed set of
+attributes instead of a dict per row.
+
+Field names match the database columns they are loaded from.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+# Columns selected from the networks table, in NetworkRecord field order
+NETWORK_COLUMNS = (
+    "network_id", "name", "chain_rpc", "explorer_api_prefix", "explorer_api_key", "explorer_type"
+)
+
+# Optional networks column holding a per-network explorer rate limit
+NETWORK_RATE_LIMIT_COLUMN = "explorer_rate_limit"
+
+# Columns selected from the dexs table, in DexRecord field order
+DEX_COLUMNS = (
+    "dex_id", "network_id", "name", "router", "factory", "router_s3_path", "factory_s3_path"
+)
+
+# Prefix given to network columns in the joined DEX query
+NETWORK_COLUMN_PREFIX = "network_"
+
+
+@dataclass(slots=True)
+class NetworkRecord:
+    """Configuration of a network and its block explorer.
+
+    Attributes:
+        network_id: Database ID of the network.
+        name: Network name.
+        chain_rpc: JSON-RPC endpoint URL.
+        explorer_api_prefix: Block explorer API base URL.
+        explorer_api_key: Block explorer API key, if any.
+        explorer_type: Block explorer flavour ('scan' or 'blockscout').
+        explorer_rate_limit: Requests per second allowed by the explorer, if set.
+    """
+    network_id: int
+    name: str
+    chain_rpc: str
+    explorer_api_prefix: str
+    explorer_api_key: Optional[str]
+    explorer_type: str
+    explorer_rate_limit: Optional[int] = None
+
+
+@dataclass(slots=True)
+class DexRecord:
+    """Configuration of a DEX together with its per-run state.
+
+    Attributes:
+        dex_id: Database ID of the DEX.
+        network_id: Database ID of the DEX's network.
+        name: DEX name.
+        router: Router contract address.
+        factory: Factory contract address.
+        router_s3_path: S3 key of the router ABI.
+        factory_s3_path: S3 key of the factory ABI.
+        network_details: The DEX's network, shared with other DEXs on it.
+        router_abi: Router ABI JSON string, once loaded.
+        router_abi_digest: Registry digest of the router ABI, once loaded.
+        end_block: Last block covered by the fetched transactions.
+        routes: Unique routes per token pair decoded this run.
+    """
+    dex_id: int
+    network_id: int
+    name: str
+    router: str
+    factory: str
+    router_s3_path: str
+    factory_s3_path: str
+    network_details: NetworkRecord
+    router_abi: Optional[str] = None
+    router_abi_digest: Optional[str] = None
+    end_block: Optional[int] = None
+    routes: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+
+def buildDexRecords(rows: List[Dict[str, Any]]) -> List[DexRecord]:
+    """Materialise joined DEX and network rows into records.
+
+    Network columns are expected with NETWORK_COLUMN_PREFIX prepended. One
+    NetworkRecord is built per network and shared by its DEXs.
+
+    Args:
+        rows: Rows selected with DEX_COLUMNS and the prefixed NETWORK_COLUMNS.
+
+    Returns:
+        List of DexRecord in row order.
+    """
+    networks: Dict[int, NetworkRecord] = {}
+    dexRecords: List[DexRecord] = []
+
+    for row in rows:
+        networkDbId = row["network_id"]
+
+        if networkDbId not in networks:
+            networks[networkDbId] = NetworkRecord(
+                *(row[f"{NETWORK_COLUMN_PREFIX}{column}"] for column in NETWORK_COLUMNS),
+                explorer_rate_limit=row.get(f"{NETWORK_COLUMN_PREFIX}{NETWORK_RATE_LIMIT_COLUMN}")
+            )
+
+        dexRecords.append(DexRecord(
+            *(row[column] for column in DEX_COLUMNS),
+            network_details=networks[networkDbId]
+        ))
+
+    return dexRecords
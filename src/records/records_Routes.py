@@ -0,0 +1,13 @@
+"""Typed records for routes decoded from swap transactions.
+
+Route rows are produced by the decoder and consumed by the route upload, so
+the row type lives here rather than in either of them and decoding does not
+depend on the database modules.
+"""
+
+from typing import Any, Dict
+
+# A decoded route ready for upload, keyed like the addRouteToDB arguments:
+# tokenInAddress, tokenOutAddress, route, method, transactionHash,
+# txTimestamp, blockNumber, amountIn, amountOut
+RouteRow = Dict[str, Any]
@@ -0,0 +1,84 @@
+"""Typed records for explorer and decoded router transactions.
+
+Explorer txlist rows carry around twenty fields, of which the decoder only
+reads five. Rows are trimmed to those fields as soon as they are parsed and
+kept as slotted records, so holding every transaction of a large block
+range in memory costs a fixed set of attributes per transaction instead of
+a full dict.
+
+Field names match the explorer API fields they are loaded from.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Union
+
+# Explorer txlist fields kept on a RawTransaction
+RAW_TRANSACTION_FIELDS = ("input", "blockNumber", "hash", "timeStamp", "isError")
+
+# Explorer isError value of transactions that succeeded, used when a row omits it
+TX_SUCCESS_FLAG = "0"
+
+
+@dataclass(slots=True)
+class RawTransaction:
+    """Router transaction as returned by the block explorer, trimmed.
+
+    Attributes:
+        input: Hex encoded call data.
+        blockNumber: Block the transaction was included in.
+        hash: Transaction hash.
+        timeStamp: Block timestamp as returned by the explorer.
+        isError: '1' if the transaction reverted, '0' otherwise.
+    """
+    input: str
+    blockNumber: int
+    hash: str
+    timeStamp: str
+    isError: str
+
+
+@dataclass(slots=True)
+class DecodedTransaction:
+    """Router call decoded against the router ABI.
+
+    Attributes:
+        name: Function name that was called.
+        params: Decoded function parameters with hex-encoded bytes.
+        schema: ABI schema for the function inputs.
+        blockNumber: Block number where transaction was included.
+        txHash: Transaction hash.
+        timestamp: Transaction timestamp.
+    """
+    name: str
+    params: Dict[str, Any]
+    schema: List[Dict[str, Any]]
+    blockNumber: int
+    txHash: str
+    timestamp: str
+
+
+# A transaction as fetched for a DEX: an explorer row, or a swap path already
+# reconstructed from Swap logs with INGESTION_SOURCE=logs
+FetchedTransaction = Union[RawTransaction, DecodedTransaction]
+
+
+def trimRawTransaction(row: Dict[str, Any]) -> RawTransaction:
+    """Keep only the fields the decoder uses from an explorer txlist row.
+
+    Args:
+        row: Transaction as parsed from the explorer response.
+
+    Returns:
+        RawTransaction: The trimmed transaction.
+
+    Raises:
+        KeyError: If the row is missing input, blockNumber, hash or timeStamp.
+        ValueError: If blockNumber is not an integer.
+    """
+    return RawTransaction(
+        input=row["input"],
+        blockNumber=int(row["blockNumber"]),
+        hash=row["hash"],
+        timeStamp=row["timeStamp"],
+        isError=row.get("isError", TX_SUCCESS_FLAG)
+    )
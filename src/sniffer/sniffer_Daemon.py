@@ -0,0 +1,464 @@
+"""Continuous block-following daemon mode.
+
+A single sniffer pass pays for the database connection, DEX and ABI loading,
+token prefetching and HTTP/RPC connection setup every time it runs. In
+daemon mode (DAEMON_MODE) the sniffer keeps all of that warm in one
+long-running process and follows each network's chain head instead.
+
+Every network runs as its own async job:
+
+    1. The network is polled for its latest block
+    2. When it has new confirmed blocks, its DEXs are run through the
+       streaming pipeline, fetching only the blocks after each DEX's
+       checkpoint
+    3. The job sleeps until the network is next due
+
+Jobs share the explorer session, rate limiters, decode pool and a single
+database writer thread, but nothing else: a slow explorer or dead RPC only
+delays its own network.
+
+Cadence:
+    Each network's block time is estimated from how fast its head advances
+    between polls, and the network is polled once per estimated block,
+    bounded by DAEMON_MIN_POLL_INTERVAL and DAEMON_MAX_POLL_INTERVAL. The
+    daemon stays DAEMON_CONFIRMATIONS blocks behind the head so explorers
+    have indexed the blocks it asks for.
+
+Failures:
+    A pass that fails or runs longer than DAEMON_NETWORK_TIMEOUT is retried
+    after a backoff that doubles with each consecutive failure of that
+    network, up to DAEMON_MAX_BACKOFF.
+
+DEX configurations are reloaded every DAEMON_DEX_REFRESH_INTERVAL seconds.
+SIGTERM or SIGINT stop the daemon once every network's current pass finishes.
+"""
+
+import asyncio
+import signal
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+import aiohttp
+
+from src.chain.blocks.blocks_Head import getLatestBlockNumbers
+from src.chain.decode.decode_Parallel import DecodePool
+from src.chain.transactions.transactions_Dexs import API_CONCURRENCY_LIMIT
+from src.chain.utils.utils_web3 import closeAsyncRpcSessions
+from src.db.cache.cache_Tokens import TokenIdResolver
+from src.db.querys.querys_Dexs import getAllDexsWithABIs
+from src.records.records_Dexs import DexRecord
+from src.sniffer.sniffer_Pipeline import runPipeline
+from src.utils.env.env_Environment import (
+    DECODE_MODE_PROCESS,
+    getAdaptiveRateLimit,
+    getApiRateBurstSeconds,
+    getDaemonConfirmations,
+    getDaemonDexRefreshInterval,
+    getDaemonMaxBackoff,
+    getDaemonMaxPollInterval,
+    getDaemonMinPollInterval,
+    getDaemonNetworkTimeout,
+    getDecodeMode,
+    getDecodeWorkers
+)
+from src.utils.logging.logging_Print import printSeparator
+from src.utils.logging.logging_Setup import getProjectLogger
+from src.utils.web.web_RateLimiter import KeyedRateLimiter
+
+logger = getProjectLogger()
+
+# Weight of the newest observation in a network's block time estimate
+BLOCK_TIME_SMOOTHING = 0.3
+
+# Reconnection attempts when the database connection has dropped between passes
+DB_RECONNECT_ATTEMPTS = 3
+DB_RECONNECT_DELAY = 1
+
+# Consecutive failures after which a network's backoff stops doubling
+MAX_BACKOFF_DOUBLINGS = 16
+
+
+@dataclass(slots=True)
+class NetworkSchedule:
+    """Polling state of one network.
+
+    Attributes:
+        chainRpcURL: RPC endpoint the network's head is read from.
+        name: Network name.
+        blockTime: Estimated seconds per block, None until observed.
+        lastHead: Latest block number observed.
+        lastHeadAt: Monotonic time lastHead was first observed.
+        processedHead: Block the network's DEXs were last run up to.
+        failures: Consecutive failed passes.
+    """
+    chainRpcURL: str
+    name: str
+    blockTime: Optional[float] = None
+    lastHead: Optional[int] = None
+    lastHeadAt: float = 0.0
+    processedHead: Optional[int] = None
+    failures: int = 0
+
+
+def observeChainHead(schedule: NetworkSchedule, head: int, observedAt: float) -> None:
+    """Record a polled chain head and update the network's block time estimate.
+
+    Args:
+        schedule: The network's polling state.
+        head: Latest block number returned by the network.
+        observedAt: Monotonic time the head was read.
+    """
+    if schedule.lastHead is not None and head <= schedule.lastHead:
+        return
+
+    if schedule.lastHead is not None:
+        observedBlockTime = (observedAt - schedule.lastHeadAt) / (head - schedule.lastHead)
+        if schedule.blockTime is None:
+            schedule.blockTime = observedBlockTime
+        else:
+            schedule.blockTime += BLOCK_TIME_SMOOTHING * (observedBlockTime - schedule.blockTime)
+
+    schedule.lastHead = head
+    schedule.lastHeadAt = observedAt
+
+
+def getPollInterval(schedule: NetworkSchedule) -> float:
+    """Get how long to wait before polling a network again.
+
+    Args:
+        schedule: The network's polling state.
+
+    Returns:
+        float: The estimated block time bounded by the configured poll
+            intervals, the minimum until a block time has been observed.
+    """
+    minPollInterval = getDaemonMinPollInterval()
+
+    if schedule.blockTime is None:
+        return minPollInterval
+
+    return min(getDaemonMaxPollInterval(), max(minPollInterval, schedule.blockTime))
+
+
+def getFailureBackoff(schedule: NetworkSchedule) -> float:
+    """Get how long a failing network waits before its next pass.
+
+    Args:
+        schedule: The network's polling state, with failures already counted.
+
+    Returns:
+        float: The poll interval doubled for each consecutive failure,
+            capped at DAEMON_MAX_BACKOFF.
+    """
+    backoff = getPollInterval(schedule=schedule) * 2 ** min(schedule.failures, MAX_BACKOFF_DOUBLINGS)
+    return min(getDaemonMaxBackoff(), backoff)
+
+
+def startDecodePool(dexs: List[DexRecord]) -> Optional[DecodePool]:
+    """Start a decode pool for the DEXs when decoding in worker processes.
+
+    Args:
+        dexs: DEX configurations with network details and router ABIs.
+
+    Returns:
+        The decode pool, or None when DECODE_MODE decodes in-process.
+    """
+    if getDecodeMode() != DECODE_MODE_PROCESS:
+        return None
+
+    return DecodePool(dexs=dexs, workers=getDecodeWorkers())
+
+
+class SnifferDaemon:
+    """Long-running sniffer following the chain head of every network.
+
+    Keeps the database connection, DEX configurations, ABIs, token cache,
+    decode pool, explorer session and rate limiters warm, and runs each
+    network as an independent job sharing them.
+    """
+
+    def __init__(self, dbConnection: Any, tokenResolver: TokenIdResolver, dexs: List[DexRecord]) -> None:
+        """Initialize the daemon with DEXs already loaded by the caller.
+
+        Args:
+            dbConnection: Active database connection.
+            tokenResolver: Token ID cache shared by every network.
+            dexs: DEX configurations with network details and router ABIs.
+        """
+        self.dbConnection = dbConnection
+        self.tokenResolver = tokenResolver
+        self.networkDexs: Dict[str, List[DexRecord]] = {}
+        self.schedules: Dict[str, NetworkSchedule] = {}
+        self.networkJobs: Dict[str, asyncio.Task] = {}
+        self.decodePool: Optional[DecodePool] = None
+        self.decodePoolUsers: Counter = Counter()
+        self.routesAdded = 0
+        self.stopEvent = asyncio.Event()
+
+        self.setDexs(dexs=dexs, decodePool=startDecodePool(dexs=dexs))
+
+    def setDexs(self, dexs: List[DexRecord], decodePool: Optional[DecodePool]) -> None:
+        """Switch to a new set of DEXs, keeping the state of known networks.
+
+        Args:
+            dexs: DEX configurations with network details and router ABIs.
+            decodePool: Decode pool started for the DEXs by startDecodePool.
+        """
+        self.networkDexs = {}
+        for dex in dexs:
+            self.networkDexs.setdefault(dex.network_details.chain_rpc, []).append(dex)
+
+        self.schedules = {
+            chainRpcURL: self.schedules.get(chainRpcURL) or NetworkSchedule(
+                chainRpcURL=chainRpcURL,
+                name=networkDexs[0].network_details.name.title()
+            )
+            for chainRpcURL, networkDexs in self.networkDexs.items()
+        }
+
+        # Worker processes only know the router ABIs they were started with,
+        # the previous pool is retired once no pass is using it
+        retiredDecodePool = self.decodePool
+        self.decodePool = decodePool
+        if retiredDecodePool is not None and not self.decodePoolUsers[retiredDecodePool]:
+            retiredDecodePool.shutdown(wait=False)
+
+        logger.info(f"[Daemon] Following {len(dexs)} DEXs on {len(self.schedules)} networks")
+
+    @contextmanager
+    def useDecodePool(self) -> Iterator[Optional[DecodePool]]:
+        """Hold the current decode pool for one pass.
+
+        Yields:
+            The current decode pool, or None when decoding in-process.
+        """
+        decodePool = self.decodePool
+        self.decodePoolUsers[decodePool] += 1
+        try:
+            yield decodePool
+        finally:
+            self.decodePoolUsers[decodePool] -= 1
+            if not self.decodePoolUsers[decodePool]:
+                del self.decodePoolUsers[decodePool]
+                if decodePool is not None and decodePool is not self.decodePool:
+                    decodePool.shutdown(wait=False)
+
+    def stop(self) -> None:
+        """Ask every network to stop once its current pass finishes."""
+        logger.info(f"[Daemon] Stopping")
+        self.stopEvent.set()
+
+    def ensureDbConnection(self) -> None:
+        """Reconnect to the database if the connection dropped while idle.
+
+        Blocks for up to DB_RECONNECT_ATTEMPTS * DB_RECONNECT_DELAY seconds,
+        so it only runs in the database thread, never on the event loop.
+        """
+        self.dbConnection.ping(reconnect=True, attempts=DB_RECONNECT_ATTEMPTS, delay=DB_RECONNECT_DELAY)
+
+    def loadDexs(self) -> List[DexRecord]:
+        """Reload DEX configurations and prefetch tokens of any new network.
+
+        Returns:
+            List of DEX configurations with network details and router ABIs.
+        """
+        self.ensureDbConnection()
+        dexs = getAllDexsWithABIs(dbConnection=self.dbConnection)
+        self.tokenResolver.prefetchNetworks(
+            networkDbIds={dex.network_details.network_id for dex in dexs}
+        )
+        return dexs
+
+    async def runNetworkPass(
+        self,
+        schedule: NetworkSchedule,
+        clientSession: aiohttp.ClientSession,
+        rateLimiters: KeyedRateLimiter,
+        dbExecutor: ThreadPoolExecutor
+    ) -> None:
+        """Poll a network and run its DEXs if it has new confirmed blocks.
+
+        Args:
+            schedule: The network's polling state.
+            clientSession: Explorer HTTP session shared by every network.
+            rateLimiters: Explorer rate limiters shared by every network.
+            dbExecutor: Single thread owning the database connection.
+
+        Raises:
+            ConnectionError: If the network's chain head could not be read.
+        """
+        chainRpcURL = schedule.chainRpcURL
+        chainHeads = await getLatestBlockNumbers(chainRpcURLs=[chainRpcURL], maxAge=0)
+
+        head = chainHeads.get(chainRpcURL)
+        if head is None:
+            raise ConnectionError(f"Chain head unavailable from {chainRpcURL}")
+
+        observeChainHead(schedule=schedule, head=head, observedAt=time.monotonic())
+
+        targetHead = head - getDaemonConfirmations()
+        if schedule.processedHead is not None and targetHead <= schedule.processedHead:
+            return
+
+        passStartTime = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(dbExecutor, self.ensureDbConnection)
+
+        with self.useDecodePool() as decodePool:
+            routesAdded = await runPipeline(
+                dbConnection=self.dbConnection,
+                dexs=self.networkDexs[chainRpcURL],
+                tokenResolver=self.tokenResolver,
+                decodePool=decodePool,
+                clientSession=clientSession,
+                rateLimiters=rateLimiters,
+                chainHeads={chainRpcURL: targetHead},
+                uploadExecutor=dbExecutor
+            )
+        self.routesAdded += routesAdded
+
+        # DEXs whose fetch failed kept their checkpoint and retry on the next block
+        schedule.processedHead = targetHead
+
+        logger.info(f"[Daemon] {schedule.name} #{targetHead}: Added {routesAdded} Routes in {time.perf_counter() - passStartTime:.2f}s")
+
+    async def followNetwork(
+        self,
+        schedule: NetworkSchedule,
+        clientSession: aiohttp.ClientSession,
+        rateLimiters: KeyedRateLimiter,
+        dbExecutor: ThreadPoolExecutor
+    ) -> None:
+        """Run passes for one network on its own cadence until stopped.
+
+        Args:
+            schedule: The network's polling state.
+            clientSession: Explorer HTTP session shared by every network.
+            rateLimiters: Explorer rate limiters shared by every network.
+            dbExecutor: Single thread owning the database connection.
+        """
+        while not self.stopEvent.is_set():
+            try:
+                await asyncio.wait_for(
+                    self.runNetworkPass(
+                        schedule=schedule,
+                        clientSession=clientSession,
+                        rateLimiters=rateLimiters,
+                        dbExecutor=dbExecutor
+                    ),
+                    timeout=getDaemonNetworkTimeout()
+                )
+                schedule.failures = 0
+                delay = getPollInterval(schedule=schedule)
+            except Exception as e:
+                schedule.failures += 1
+                delay = getFailureBackoff(schedule=schedule)
+                logger.warning(f"[Daemon] {schedule.name}: Pass failed ({schedule.failures} in a row), retrying in {delay:.1f}s: {e!r}")
+
+            try:
+                await asyncio.wait_for(self.stopEvent.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def startNetworkJobs(
+        self,
+        clientSession: aiohttp.ClientSession,
+        rateLimiters: KeyedRateLimiter,
+        dbExecutor: ThreadPoolExecutor
+    ) -> None:
+        """Start a job for every new network and cancel those of removed networks.
+
+        Args:
+            clientSession: Explorer HTTP session shared by every network.
+            rateLimiters: Explorer rate limiters shared by every network.
+            dbExecutor: Single thread owning the database connection.
+        """
+        for chainRpcURL in list(self.networkJobs):
+            if chainRpcURL not in self.schedules:
+                self.networkJobs.pop(chainRpcURL).cancel()
+
+        for chainRpcURL, schedule in self.schedules.items():
+            if chainRpcURL not in self.networkJobs:
+                self.networkJobs[chainRpcURL] = asyncio.create_task(self.followNetwork(
+                    schedule=schedule,
+                    clientSession=clientSession,
+                    rateLimiters=rateLimiters,
+                    dbExecutor=dbExecutor
+                ))
+
+    async def refreshDexs(
+        self,
+        clientSession: aiohttp.ClientSession,
+        rateLimiters: KeyedRateLimiter,
+        dbExecutor: ThreadPoolExecutor
+    ) -> None:
+        """Reload DEX configurations periodically until stopped.
+
+        Args:
+            clientSession: Explorer HTTP session shared by every network.
+            rateLimiters: Explorer rate limiters shared by every network.
+            dbExecutor: Single thread owning the database connection.
+        """
+        loop = asyncio.get_running_loop()
+
+        # The interval is waited before every attempt, failed ones included,
+        # so a refresh that keeps failing retries at the refresh cadence
+        while True:
+            try:
+                await asyncio.wait_for(self.stopEvent.wait(), timeout=getDaemonDexRefreshInterval())
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                dexs = await loop.run_in_executor(dbExecutor, self.loadDexs)
+                self.setDexs(dexs=dexs, decodePool=await asyncio.to_thread(startDecodePool, dexs=dexs))
+                self.startNetworkJobs(clientSession=clientSession, rateLimiters=rateLimiters, dbExecutor=dbExecutor)
+            except Exception as e:
+                logger.warning(f"[Daemon] DEX refresh failed, keeping current DEXs: {e!r}")
+
+    async def run(self) -> int:
+        """Follow every network until stopped.
+
+        Returns:
+            int: Total number of routes added while the daemon ran.
+        """
+        loop = asyncio.get_running_loop()
+        for stopSignal in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(stopSignal, self.stop)
+            except NotImplementedError:
+                pass
+
+        printSeparator()
+        logger.info(f"[Daemon] Following Chain Heads")
+        printSeparator()
+
+        async with AsyncExitStack() as exitStack:
+            rateLimiters = await exitStack.enter_async_context(
+                KeyedRateLimiter(
+                    concurrency_limit=API_CONCURRENCY_LIMIT,
+                    adaptive=getAdaptiveRateLimit(),
+                    burst_seconds=getApiRateBurstSeconds()
+                )
+            )
+            clientSession = await exitStack.enter_async_context(aiohttp.ClientSession())
+            exitStack.push_async_callback(closeAsyncRpcSessions)
+            dbExecutor = exitStack.enter_context(ThreadPoolExecutor(max_workers=1, thread_name_prefix="db"))
+
+            try:
+                self.startNetworkJobs(clientSession=clientSession, rateLimiters=rateLimiters, dbExecutor=dbExecutor)
+                await self.refreshDexs(clientSession=clientSession, rateLimiters=rateLimiters, dbExecutor=dbExecutor)
+                await asyncio.gather(*self.networkJobs.values(), return_exceptions=True)
+            finally:
+                for networkJob in self.networkJobs.values():
+                    networkJob.cancel()
+                if self.decodePool is not None:
+                    await asyncio.to_thread(self.decodePool.shutdown)
+                    self.decodePool = None
+
+        return self.routesAdded
@@ -0,0 +1,274 @@
+"""Streaming fetch, decode and upload pipeline.
+
+This module runs the sniffer's three stages concurrently instead of one after
+the other. Each DEX's transaction list is handed to the decode stage as soon
+as its explorer fetch completes, and each DEX's decoded routes are handed to
+the upload stage as soon as they are decoded, so the database is written to
+while other DEXs are still being fetched and decoded.
+
+Stages:
+    1. Fetch: explorer requests for every DEX, run on the event loop
+    2. Decode: transaction decoding and route extraction, run in a worker thread
+       and, with DECODE_MODE=process, sharded across a pool of worker processes
+    3. Upload: batched route inserts and checkpoint updates, run in a single
+       worker thread because the database connection is not thread-safe
+
+Stages are connected by bounded asyncio queues (PIPELINE_QUEUE_SIZE), so a
+slow stage makes the stage before it wait instead of buffering every DEX in
+memory. Each stage puts PIPELINE_DONE on its output queue when it finishes.
+If a stage fails, the other stages are cancelled and the error is raised, so
+no stage is left waiting on a queue that is no longer consumed.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Dict, List, Optional
+
+import aiohttp
+
+from src.chain.decode.decode_Execute import collectDexRoutes, uploadDexRoutes
+from src.chain.decode.decode_Parallel import DecodePool
+from src.chain.transactions.transactions_Dexs import getDexTransactions
+from src.db.cache.cache_Tokens import TokenIdResolver
+from src.db.querys.querys_Checkpoints import DexCheckpoints, getAllDexCheckpoints
+from src.records.records_Dexs import DexRecord
+from src.utils.env.env_Environment import DECODE_MODE_PROCESS, getDecodeMode, getDecodeWorkers, getPipelineQueueSize
+from src.utils.logging.logging_Setup import getProjectLogger
+from src.utils.web.web_RateLimiter import KeyedRateLimiter
+
+logger = getProjectLogger()
+
+# Sentinel put on a queue once the stage feeding it has finished
+PIPELINE_DONE = None
+
+
+async def fetchStage(
+    dbConnection: Any,
+    dexs: List[DexRecord],
+    transactionQueue: asyncio.Queue,
+    clientSession: Optional[aiohttp.ClientSession] = None,
+    rateLimiters: Optional[KeyedRateLimiter] = None,
+    chainHeads: Optional[Dict[str, Optional[int]]] = None,
+    dexCheckpoints: Optional[DexCheckpoints] = None
+) -> None:
+    """Fetch every DEX's transactions, publishing each as it completes.
+
+    Args:
+        dbConnection: Active database connection for querying checkpoints.
+        dexs: List of DEX configurations to fetch transactions for.
+        transactionQueue: Queue receiving (dex, transactions) items.
+        clientSession: Explorer HTTP session owned by the caller.
+        rateLimiters: Explorer rate limiters owned by the caller.
+        chainHeads: Block number to fetch up to per RPC URL.
+        dexCheckpoints: Checkpoints already read from the database.
+    """
+    await getDexTransactions(
+        dbConnection=dbConnection,
+        dexs=dexs,
+        transactionQueue=transactionQueue,
+        clientSession=clientSession,
+        rateLimiters=rateLimiters,
+        chainHeads=chainHeads,
+        dexCheckpoints=dexCheckpoints
+    )
+
+    await transactionQueue.put(PIPELINE_DONE)
+
+
+async def decodeStage(
+    transactionQueue: asyncio.Queue,
+    routeQueue: asyncio.Queue,
+    decodeExecutor: ThreadPoolExecutor,
+    decodePool: Optional[DecodePool] = None
+) -> None:
+    """Decode each fetched DEX's transactions into route rows.
+
+    Args:
+        transactionQueue: Queue of (dex, transactions) items from the fetch stage.
+        routeQueue: Queue receiving (dex, routes) items for the upload stage.
+        decodeExecutor: Executor the decoding runs in, keeping the event loop free.
+        decodePool: Worker processes to shard each DEX's transactions across.
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        fetchedDex = await transactionQueue.get()
+        if fetchedDex is PIPELINE_DONE:
+            break
+
+        dex, dexTransactions = fetchedDex
+        dexName = dex.name.title()
+
+        # Failed fetches are retried next run, so the checkpoint must not move
+        if dexTransactions is None:
+            logger.warning(f"{dexName}: Skipping, transactions could not be fetched")
+            continue
+
+        routes = await loop.run_in_executor(
+            decodeExecutor,
+            functools.partial(collectDexRoutes, dex=dex, dexTransactions=dexTransactions, decodePool=decodePool)
+        )
+
+        await routeQueue.put((dex, routes))
+
+    await routeQueue.put(PIPELINE_DONE)
+
+
+async def uploadStage(
+    dbConnection: Any,
+    routeQueue: asyncio.Queue,
+    uploadExecutor: ThreadPoolExecutor,
+    tokenResolver: Optional[TokenIdResolver] = None
+) -> int:
+    """Upload each decoded DEX's routes and advance its checkpoint.
+
+    Args:
+        dbConnection: Active database connection for storing routes.
+        routeQueue: Queue of (dex, routes) items from the decode stage.
+        uploadExecutor: Single-thread executor that owns the database connection.
+        tokenResolver: Shared token ID cache used when uploading routes.
+
+    Returns:
+        int: Total number of routes added to the database.
+    """
+    loop = asyncio.get_running_loop()
+    routesAdded = 0
+
+    while True:
+        decodedDex = await routeQueue.get()
+        if decodedDex is PIPELINE_DONE:
+            break
+
+        dex, routes = decodedDex
+
+        routesAdded = routesAdded + await loop.run_in_executor(
+            uploadExecutor,
+            functools.partial(
+                uploadDexRoutes,
+                dbConnection=dbConnection,
+                dex=dex,
+                routes=routes,
+                tokenResolver=tokenResolver
+            )
+        )
+
+    return routesAdded
+
+
+async def gatherStages(*stages: Awaitable[Any]) -> List[Any]:
+    """Run pipeline stages concurrently, cancelling the others if one fails.
+
+    Unlike asyncio.gather, a failed stage does not leave the stage feeding it
+    blocked on a full queue that nothing consumes any more.
+
+    Args:
+        stages: Stage coroutines to run.
+
+    Returns:
+        List of each stage's result in order.
+
+    Raises:
+        Exception: The error of the stage that failed.
+    """
+    stageTasks = [asyncio.ensure_future(stage) for stage in stages]
+
+    try:
+        await asyncio.wait(stageTasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for stageTask in stageTasks:
+            stageTask.cancel()
+        await asyncio.gather(*stageTasks, return_exceptions=True)
+
+    for stageTask in stageTasks:
+        if not stageTask.cancelled() and stageTask.exception() is not None:
+            raise stageTask.exception()
+
+    return [stageTask.result() for stageTask in stageTasks]
+
+
+async def runPipeline(
+    dbConnection: Any,
+    dexs: List[DexRecord],
+    tokenResolver: Optional[TokenIdResolver] = None,
+    decodePool: Optional[DecodePool] = None,
+    clientSession: Optional[aiohttp.ClientSession] = None,
+    rateLimiters: Optional[KeyedRateLimiter] = None,
+    chainHeads: Optional[Dict[str, Optional[int]]] = None,
+    uploadExecutor: Optional[ThreadPoolExecutor] = None
+) -> int:
+    """Fetch, decode and upload routes for every DEX as a streaming pipeline.
+
+    Checkpoints are read and routes uploaded in the upload thread, so the
+    connection is never used by two threads at once. Concurrent pipelines
+    sharing a connection must share the same single-thread upload executor.
+
+    The decode pool, HTTP session, rate limiters and chain heads may be
+    supplied by a long-running caller so they stay warm between runs.
+
+    Args:
+        dbConnection: Active database connection.
+        dexs: List of DEX configurations with network details and router ABIs.
+        tokenResolver: Shared token ID cache used when uploading routes.
+        decodePool: Worker pool owned by the caller, created for the run
+            according to DECODE_MODE if None.
+        clientSession: Explorer HTTP session owned by the caller.
+        rateLimiters: Explorer rate limiters owned by the caller.
+        chainHeads: Block number to fetch up to per RPC URL.
+        uploadExecutor: Single-thread executor owning the database connection,
+            created for the run if None.
+
+    Returns:
+        int: Total number of routes added to the database.
+    """
+    loop = asyncio.get_running_loop()
+    queueSize = getPipelineQueueSize()
+    transactionQueue: asyncio.Queue = asyncio.Queue(maxsize=queueSize)
+    routeQueue: asyncio.Queue = asyncio.Queue(maxsize=queueSize)
+
+    async with AsyncExitStack() as exitStack:
+        # Resources owned by the run are shut down off the event loop
+        if decodePool is None and getDecodeMode() == DECODE_MODE_PROCESS:
+            decodePool = await asyncio.to_thread(DecodePool, dexs=dexs, workers=getDecodeWorkers())
+            exitStack.push_async_callback(asyncio.to_thread, decodePool.shutdown)
+
+        if uploadExecutor is None:
+            uploadExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="upload")
+            exitStack.push_async_callback(asyncio.to_thread, uploadExecutor.shutdown)
+
+        # A decode still running when the run is cancelled finishes in the
+        # background instead of holding up the cancellation
+        decodeExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="decode")
+        exitStack.callback(decodeExecutor.shutdown, wait=False, cancel_futures=True)
+
+        dexCheckpoints = await loop.run_in_executor(
+            uploadExecutor,
+            functools.partial(getAllDexCheckpoints, dbConnection=dbConnection)
+        )
+
+        _, _, routesAdded = await gatherStages(
+            fetchStage(
+                dbConnection=dbConnection,
+                dexs=dexs,
+                transactionQueue=transactionQueue,
+                clientSession=clientSession,
+                rateLimiters=rateLimiters,
+                chainHeads=chainHeads,
+                dexCheckpoints=dexCheckpoints
+            ),
+            decodeStage(
+                transactionQueue=transactionQueue,
+                routeQueue=routeQueue,
+                decodeExecutor=decodeExecutor,
+                decodePool=decodePool
+            ),
+            uploadStage(
+                dbConnection=dbConnection,
+                routeQueue=routeQueue,
+                uploadExecutor=uploadExecutor,
+                tokenResolver=tokenResolver
+            )
+        )
+
+    return routesAdded
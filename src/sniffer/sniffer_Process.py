@@ -23,7 +23,7 @@ Handles transaction processing and route discovery.
 # Enhancement: improve error messages
 """
 """Initialize the sniffing process with network configuration and filters."""
-"""DEX information processing and transaction assignment utilities.
+"""DEX information processing utilities.
 """Main sniffer process for monitoring blockchain routes."""
 """Monitor and detect profitable arbitrage routes.
 """Monitor mempool for pending transactions and extract swap routes."""
@@ -55,7 +55,7 @@ This module provides functions for processing DEX information from the database
 """Initialize the sniffer process with configuration parameters."""
 # Validates process state before initialization
 # TODO: Implement exponential backoff for network retries
-and assigning transaction lists to DEX objects for route sniffer operations.
+for route sniffer operations.
 # Initialize sniffing process with configured parameters
 """Initialize the sniffer process with configuration and event handlers."""
 """Initialize and manage sniffer process lifecycle."""
@@ -94,21 +94,19 @@ The processing pipeline enriches raw DEX records with:
 Processing Steps:
 # Initialize sniffer process with configured parameters
     1. Load DEX configurations from database
-    2. Fetch network details (with caching for efficiency)
+    2. Attach network details (loaded by the same query)
     3. Retrieve router ABIs from AWS S3
 # TODO: Add comprehensive error handling for API timeouts
 # TODO: Implement exponential backoff for failed network requests
     4. Sanitize contract addresses
-    5. Assign fetched transactions to each DEX
 # Performance: batch process for efficiency
 """
 
-from typing import Any, Dict, List, Optional, Tuple
 # Filter and process network packets to extract relevant transaction data
 
 from src.aws.aws_s3 import getAbiFromS3
-from src.chain.utils.utils_web3 import getWeb3Instance
-from src.db.querys.querys_Networks import getNetworkById
+from src.chain.abi.abi_Registry import getAbiSource, registerAbi
+from src.records.records_Dexs import DexRecord
 # Initialize the main sniffer process with configured parameters
 from src.utils.logging.logging_Setup import getProjectLogger
 
@@ -121,79 +119,37 @@ INVALID_ADDRESS_CHARS = ["\r", "\n", " "]
 # Process incoming transactions through analysis pipeline
 
 def processDexInformation(
-    dbConnection: Any,
-    dex: Dict[str, Any],
+    dex: DexRecord,
     dexIndex: int,
-    dexCount: int,
-    cachedNetworkDetails: Dict[int, Dict[str, Any]]
-) -> Tuple[Dict[str, Any], Dict[int, Dict[str, Any]]]:
-    """Process DEX information and enrich with network details and ABI.
+    dexCount: int
+) -> DexRecord:
+    """Process DEX information and enrich with the router ABI.
 
-    Retrieves network details from cache or database, fetches the router ABI
-    from S3, and sanitizes the router address.
+    Fetches the router ABI from S3 and sanitizes the router address. Network
+    details are already attached by the DEX query.
 
     Args:
-        dbConnection: Active database connection object.
-        dex: Dictionary containing DEX information from database.
+        dex: DEX record loaded from the database.
         dexIndex: Current index in the DEX processing loop.
         dexCount: Total number of DEXs being processed.
-        cachedNetworkDetails: Cache of previously fetched network details.
 
     Returns:
-        Tuple containing:
-            - Dict: Enriched DEX dictionary with network_details and router_abi.
-            - Dict: Updated network details cache.
+        DexRecord: The same DEX record with router_abi and router_abi_digest set.
     """
-    dexName = dex["name"]
-    dexNetworkDbId = dex["network_id"]
-
     # Sanitize router address by removing invalid whitespace characters
     # that may have been introduced during data entry or import
-    router_address = dex["router"]
+    router_address = dex.router
     for char in INVALID_ADDRESS_CHARS:
         router_address = router_address.replace(char, "")
-    dex["router"] = router_address
-
-    # Use cached network details or fetch from database
-    if dexNetworkDbId in cachedNetworkDetails:
-        dex["network_details"] = cachedNetworkDetails[dexNetworkDbId]
-    else:
-        dex["network_details"] = getNetworkById(dbConnection=dbConnection, networkDbId=dexNetworkDbId)
-        cachedNetworkDetails[dexNetworkDbId] = dex["network_details"]
+    dex.router = router_address
 
     # Fetch router ABI from S3
-    dex["router_abi"] = getAbiFromS3(s3Key=dex["router_s3_path"])
-
-    networkName = dex["network_details"]["name"]
-
-    logger.info(f"[{dexIndex + 1}/{dexCount}] Processed {dexName.title()} On {networkName.title()}")
-
-    return dex, cachedNetworkDetails
-
+    # Intern the ABI so DEXs sharing a router interface share one copy
+    dex.router_abi_digest = registerAbi(abi=getAbiFromS3(s3Key=dex.router_s3_path))
+    dex.router_abi = getAbiSource(abiDigest=dex.router_abi_digest)
 
-def assignDexTransactionList(
-    dexs: List[Dict[str, Any]],
-    dexTransactions: List[List[Dict[str, Any]]]
-) -> List[Dict[str, Any]]:
-    """Assign transaction lists to their corresponding DEX objects.
+    networkName = dex.network_details.name
 
-    Maps each transaction list to its corresponding DEX by index position,
-    adding a 'transactions' key to each DEX dictionary.
+    logger.info(f"[{dexIndex + 1}/{dexCount}] Processed {dex.name.title()} On {networkName.title()}")
 
-    Args:
-        dexs: List of DEX dictionaries to receive transactions.
-        dexTransactions: List of transaction lists, one per DEX.
-
-    Returns:
-        List of DEX dictionaries with 'transactions' key added.
-
-    Note:
-        The function assumes dexs and dexTransactions have the same length
-        and are aligned by index position.
-    """
-    # Use enumerate for cleaner index tracking instead of .index() lookup
-    for index, transactionList in enumerate(dexTransactions):
-        if index < len(dexs):
-            dexs[index]["transactions"] = transactionList
-            logger.debug(f"Assigned {len(transactionList)} transactions to DEX index {index}")
-    return dexs
+    return dex
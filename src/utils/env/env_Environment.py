@@ -28,15 +28,43 @@ Environment Variables:
     BLOCK_RANGE: Number of blocks to process per sniffer run (default: 1000)
 # Validate required environment variables at startup
     LAZY_MODE: Enable reduced processing for testing (default: False)
+    ROUTE_INSERT_CHUNK_SIZE: Routes per multi-row insert statement (default: 500)
+    ROUTE_DEDUP_MODE: 'full_row' or 'fingerprint' duplicate detection (default: full_row)
+    CHAIN_HEAD_TTL: Seconds a network's latest block number is cached (default: 5)
+    RPC_POOL_SIZE: Pooled HTTP connections per RPC endpoint (default: 10)
+    RPC_KEEPALIVE_TIMEOUT: Seconds idle RPC connections are kept alive (default: 30)
+    EXPLORER_RATE_LIMITS: JSON object of explorer API prefix to requests/second
+    ADAPTIVE_RATE_LIMIT: Lower explorer rates on throttling and ramp back up (default: True)
+    API_RATE_BURST_SECONDS: Seconds of an explorer's rate allowed back to back (default: 1)
+    PIPELINE_QUEUE_SIZE: DEXs buffered between fetch, decode and upload stages (default: 4)
+    DECODE_MODE: 'serial' or 'process' transaction decoding (default: serial)
+    DECODE_WORKERS: Worker processes used in 'process' decode mode (default: CPU count)
+    ABI_CACHE_SIZE: Distinct parsed ABIs kept in memory (default: 128)
+    ABI_CACHE_DIR: Directory ABIs downloaded from S3 are cached in (default: .abi_cache)
+    ABI_CACHE_TTL: Seconds a cached ABI is used before revalidating with S3 (default: 3600)
+    ABI_CACHE_OFFLINE: Load ABIs from the local cache only, never from S3 (default: False)
+    ABI_FETCH_WORKERS: Threads loading DEX ABIs concurrently at startup (default: 16)
+    DAEMON_MODE: Keep running and follow new blocks instead of a single pass (default: False)
+    DAEMON_MIN_POLL_INTERVAL: Shortest seconds between polls of a network (default: 2)
+    DAEMON_MAX_POLL_INTERVAL: Longest seconds between polls of a network (default: 60)
+    DAEMON_CONFIRMATIONS: Blocks daemon mode stays behind the chain head (default: 2)
+    DAEMON_DEX_REFRESH_INTERVAL: Seconds between DEX configuration reloads (default: 900)
+    DAEMON_NETWORK_TIMEOUT: Seconds a network's pass may take before it is abandoned (default: 600)
+    DAEMON_MAX_BACKOFF: Longest seconds a failing network waits before retrying (default: 900)
+    INGESTION_SOURCE: 'explorer' txlist or 'logs' eth_getLogs swap discovery (default: explorer)
+    LOG_BLOCK_CHUNK_SIZE: Blocks covered by each eth_getLogs request (default: 2000)
 # Load environment variables from .env file
 # TODO: Add validation for required environment variables at startup
 """
 # Load and validate environment variables with type conversion and defaults
 
 # Validate all required environment variables on startup
+import json
 import os
 
-from typing import Optional
+from typing import Dict, Optional
+
+from src.utils.data.data_Booleans import strToBool
 # Enhancement: improve error messages
 # Load configuration from environment variables with defaults
 
@@ -57,6 +85,77 @@ MIN_BLOCK_RANGE = 1
 # Maximum allowed block range to prevent excessive API calls
 MAX_BLOCK_RANGE = 50000
 
+# Default number of route rows written per multi-row INSERT
+DEFAULT_ROUTE_INSERT_CHUNK_SIZE = 500
+
+# Bounds for the route insert chunk size (keeps statements under max_allowed_packet)
+MIN_ROUTE_INSERT_CHUNK_SIZE = 1
+MAX_ROUTE_INSERT_CHUNK_SIZE = 5000
+
+# Default number of seconds a chain head block number is reused for
+DEFAULT_CHAIN_HEAD_TTL = 5.0
+
+# Default maximum pooled HTTP connections per RPC endpoint
+DEFAULT_RPC_POOL_SIZE = 10
+
+# Default seconds an idle pooled RPC connection is kept alive
+DEFAULT_RPC_KEEPALIVE_TIMEOUT = 30.0
+
+# Default seconds of an explorer's rate its requests may burst, one second's
+# requests like the queue-based limiter GCRA replaced
+DEFAULT_API_RATE_BURST_SECONDS = 1.0
+
+# Default number of DEXs buffered between pipeline stages
+DEFAULT_PIPELINE_QUEUE_SIZE = 4
+
+# Default number of distinct parsed ABIs kept in memory
+DEFAULT_ABI_CACHE_SIZE = 128
+
+# Default directory ABIs downloaded from S3 are cached in
+DEFAULT_ABI_CACHE_DIR = ".abi_cache"
+
+# Default seconds a cached ABI is trusted before it is revalidated with S3
+DEFAULT_ABI_CACHE_TTL = 3600.0
+
+# Default number of threads loading DEX ABIs at startup
+DEFAULT_ABI_FETCH_WORKERS = 16
+
+# Default bounds in seconds of how often daemon mode polls a network
+DEFAULT_DAEMON_MIN_POLL_INTERVAL = 2.0
+DEFAULT_DAEMON_MAX_POLL_INTERVAL = 60.0
+
+# Default number of blocks daemon mode stays behind the chain head, giving
+# explorers time to index the newest blocks
+DEFAULT_DAEMON_CONFIRMATIONS = 2
+
+# Default seconds between reloads of DEX configurations in daemon mode
+DEFAULT_DAEMON_DEX_REFRESH_INTERVAL = 900.0
+
+# Default seconds one network's pass may take in daemon mode before it is
+# abandoned and retried with backoff
+DEFAULT_DAEMON_NETWORK_TIMEOUT = 600.0
+
+# Default cap in seconds of the backoff applied to a failing network
+DEFAULT_DAEMON_MAX_BACKOFF = 900.0
+
+# Default number of blocks covered by each eth_getLogs request
+DEFAULT_LOG_BLOCK_CHUNK_SIZE = 2000
+
+# Transaction decoding modes
+DECODE_MODE_SERIAL = "serial"
+DECODE_MODE_PROCESS = "process"
+DECODE_MODES = (DECODE_MODE_SERIAL, DECODE_MODE_PROCESS)
+
+# Sources swap transactions are ingested from
+INGESTION_SOURCE_EXPLORER = "explorer"
+INGESTION_SOURCE_LOGS = "logs"
+INGESTION_SOURCES = (INGESTION_SOURCE_EXPLORER, INGESTION_SOURCE_LOGS)
+
+# Route duplicate detection modes
+ROUTE_DEDUP_MODE_FULL_ROW = "full_row"
+ROUTE_DEDUP_MODE_FINGERPRINT = "fingerprint"
+ROUTE_DEDUP_MODES = (ROUTE_DEDUP_MODE_FULL_ROW, ROUTE_DEDUP_MODE_FINGERPRINT)
+
 
 def getBlockRange() -> int:
     """Get the configured block range for transaction processing.
@@ -84,4 +183,416 @@ def getBlockRange() -> int:
 
     # Parse and clamp the value within valid bounds
     block_range = int(block_range_str)
-    return max(MIN_BLOCK_RANGE, min(block_range, MAX_BLOCK_RANGE))
\ No newline at end of file
+    return max(MIN_BLOCK_RANGE, min(block_range, MAX_BLOCK_RANGE))
+
+def getRouteInsertChunkSize() -> int:
+    """Get the number of routes written per multi-row insert statement.
+
+    Retrieves the ROUTE_INSERT_CHUNK_SIZE environment variable which
+    determines how many route rows are packed into a single INSERT when
+    uploading a DEX's decoded routes. The value is clamped between
+    MIN_ROUTE_INSERT_CHUNK_SIZE and MAX_ROUTE_INSERT_CHUNK_SIZE.
+
+    Returns:
+        int: The chunk size, defaults to DEFAULT_ROUTE_INSERT_CHUNK_SIZE
+             if environment variable is not set.
+
+    Raises:
+        ValueError: If ROUTE_INSERT_CHUNK_SIZE is set but cannot be converted to int.
+    """
+    chunk_size_str = os.getenv('ROUTE_INSERT_CHUNK_SIZE')
+    if chunk_size_str is None:
+        return DEFAULT_ROUTE_INSERT_CHUNK_SIZE
+
+    chunk_size = int(chunk_size_str)
+    return max(MIN_ROUTE_INSERT_CHUNK_SIZE, min(chunk_size, MAX_ROUTE_INSERT_CHUNK_SIZE))
+
+
+def getRouteDedupMode() -> str:
+    """Get the duplicate detection mode used when inserting routes.
+
+    'full_row' compares every column against existing routes with a
+    NOT EXISTS subquery. 'fingerprint' relies on the unique route_fingerprint
+    index and requires the route fingerprint migration to have been run.
+
+    Returns:
+        str: One of ROUTE_DEDUP_MODES, defaults to ROUTE_DEDUP_MODE_FULL_ROW.
+
+    Raises:
+        ValueError: If ROUTE_DEDUP_MODE is set to an unknown mode.
+    """
+    dedup_mode = os.getenv('ROUTE_DEDUP_MODE', ROUTE_DEDUP_MODE_FULL_ROW).strip().lower()
+    if dedup_mode not in ROUTE_DEDUP_MODES:
+        raise ValueError(f"ROUTE_DEDUP_MODE must be one of {ROUTE_DEDUP_MODES}, got '{dedup_mode}'")
+    return dedup_mode
+
+
+def getChainHeadTTL() -> float:
+    """Get how long a network's latest block number may be reused.
+
+    Retrieves the CHAIN_HEAD_TTL environment variable (in seconds). A value
+    of 0 disables caching.
+
+    Returns:
+        float: The TTL in seconds, defaults to DEFAULT_CHAIN_HEAD_TTL.
+
+    Raises:
+        ValueError: If CHAIN_HEAD_TTL is set but cannot be converted to float.
+    """
+    ttl_str = os.getenv('CHAIN_HEAD_TTL')
+    if ttl_str is None:
+        return DEFAULT_CHAIN_HEAD_TTL
+
+    return max(0.0, float(ttl_str))
+
+
+def getRpcPoolSize() -> int:
+    """Get the maximum number of pooled HTTP connections per RPC endpoint.
+
+    Returns:
+        int: The pool size from RPC_POOL_SIZE, defaults to DEFAULT_RPC_POOL_SIZE.
+
+    Raises:
+        ValueError: If RPC_POOL_SIZE is set but cannot be converted to int.
+    """
+    pool_size_str = os.getenv('RPC_POOL_SIZE')
+    if pool_size_str is None:
+        return DEFAULT_RPC_POOL_SIZE
+
+    return max(1, int(pool_size_str))
+
+
+def getRpcKeepAliveTimeout() -> float:
+    """Get how long idle pooled RPC connections are kept open.
+
+    Returns:
+        float: Seconds from RPC_KEEPALIVE_TIMEOUT, defaults to DEFAULT_RPC_KEEPALIVE_TIMEOUT.
+
+    Raises:
+        ValueError: If RPC_KEEPALIVE_TIMEOUT is set but cannot be converted to float.
+    """
+    keepalive_str = os.getenv('RPC_KEEPALIVE_TIMEOUT')
+    if keepalive_str is None:
+        return DEFAULT_RPC_KEEPALIVE_TIMEOUT
+
+    return max(0.0, float(keepalive_str))
+
+
+def getExplorerRateLimits() -> Dict[str, int]:
+    """Get per-explorer request rate overrides.
+
+    Retrieves the EXPLORER_RATE_LIMITS environment variable, a JSON object
+    mapping an explorer API prefix to its allowed requests per second, e.g.
+    '{"https://api.bscscan.com": 5}'.
+
+    Returns:
+        Dict mapping explorer API prefix to requests per second, empty if
+        the environment variable is not set.
+
+    Raises:
+        json.JSONDecodeError: If EXPLORER_RATE_LIMITS is not valid JSON.
+    """
+    rate_limits_json = os.getenv('EXPLORER_RATE_LIMITS')
+    if not rate_limits_json:
+        return {}
+
+    return {prefix.rstrip('/'): int(rate) for prefix, rate in json.loads(rate_limits_json).items()}
+
+
+def getAdaptiveRateLimit() -> bool:
+    """Get whether explorer rate limiters adapt to throttled responses.
+
+    Returns:
+        bool: The ADAPTIVE_RATE_LIMIT setting, defaults to True.
+
+    Raises:
+        ValueError: If ADAPTIVE_RATE_LIMIT is not a recognised boolean string.
+    """
+    return strToBool(os.getenv('ADAPTIVE_RATE_LIMIT', 'True'))
+
+
+def getApiRateBurstSeconds() -> float:
+    """Get how many seconds of its rate an explorer may be sent back to back.
+
+    Returns:
+        float: Seconds from API_RATE_BURST_SECONDS, defaults to DEFAULT_API_RATE_BURST_SECONDS.
+            Every explorer may always be sent at least one request.
+
+    Raises:
+        ValueError: If API_RATE_BURST_SECONDS is set but cannot be converted to float.
+    """
+    burst_str = os.getenv('API_RATE_BURST_SECONDS')
+    if burst_str is None:
+        return DEFAULT_API_RATE_BURST_SECONDS
+
+    return max(0.0, float(burst_str))
+
+
+def getPipelineQueueSize() -> int:
+    """Get how many DEXs may wait between two pipeline stages.
+
+    A full queue makes the upstream stage wait, so this bounds the number of
+    fetched transaction lists and decoded route batches held in memory.
+
+    Returns:
+        int: The queue size from PIPELINE_QUEUE_SIZE, defaults to DEFAULT_PIPELINE_QUEUE_SIZE.
+
+    Raises:
+        ValueError: If PIPELINE_QUEUE_SIZE is set but cannot be converted to int.
+    """
+    queue_size_str = os.getenv('PIPELINE_QUEUE_SIZE')
+    if queue_size_str is None:
+        return DEFAULT_PIPELINE_QUEUE_SIZE
+
+    return max(1, int(queue_size_str))
+
+
+def getDecodeMode() -> str:
+    """Get how transaction input data is decoded.
+
+    'serial' decodes in the calling thread. 'process' shards each DEX's
+    transactions across a pool of worker processes.
+
+    Returns:
+        str: One of DECODE_MODES, defaults to DECODE_MODE_SERIAL.
+
+    Raises:
+        ValueError: If DECODE_MODE is set to an unknown mode.
+    """
+    decode_mode = os.getenv('DECODE_MODE', DECODE_MODE_SERIAL).strip().lower()
+    if decode_mode not in DECODE_MODES:
+        raise ValueError(f"DECODE_MODE must be one of {DECODE_MODES}, got '{decode_mode}'")
+    return decode_mode
+
+
+def getDecodeWorkers() -> int:
+    """Get the number of worker processes used in 'process' decode mode.
+
+    Returns:
+        int: The worker count from DECODE_WORKERS, defaults to the CPU count.
+
+    Raises:
+        ValueError: If DECODE_WORKERS is set but cannot be converted to int.
+    """
+    workers_str = os.getenv('DECODE_WORKERS')
+    if workers_str is None:
+        return os.cpu_count() or 1
+
+    return max(1, int(workers_str))
+
+
+def getAbiCacheSize() -> int:
+    """Get how many distinct parsed ABIs are kept in memory.
+
+    Returns:
+        int: The cache size from ABI_CACHE_SIZE, defaults to DEFAULT_ABI_CACHE_SIZE.
+
+    Raises:
+        ValueError: If ABI_CACHE_SIZE is set but cannot be converted to int.
+    """
+    cache_size_str = os.getenv('ABI_CACHE_SIZE')
+    if cache_size_str is None:
+        return DEFAULT_ABI_CACHE_SIZE
+
+    return max(1, int(cache_size_str))
+
+
+def getAbiCacheDir() -> str:
+    """Get the directory ABIs downloaded from S3 are cached in.
+
+    Returns:
+        str: The ABI_CACHE_DIR setting, defaults to DEFAULT_ABI_CACHE_DIR.
+    """
+    return os.getenv('ABI_CACHE_DIR', DEFAULT_ABI_CACHE_DIR)
+
+
+def getAbiCacheTTL() -> float:
+    """Get how long a cached ABI is used before it is revalidated with S3.
+
+    A value of 0 revalidates every cached ABI with a conditional GET.
+
+    Returns:
+        float: The TTL in seconds, defaults to DEFAULT_ABI_CACHE_TTL.
+
+    Raises:
+        ValueError: If ABI_CACHE_TTL is set but cannot be converted to float.
+    """
+    ttl_str = os.getenv('ABI_CACHE_TTL')
+    if ttl_str is None:
+        return DEFAULT_ABI_CACHE_TTL
+
+    return max(0.0, float(ttl_str))
+
+
+def getAbiCacheOffline() -> bool:
+    """Get whether ABIs are loaded from the local cache only.
+
+    Returns:
+        bool: The ABI_CACHE_OFFLINE setting, defaults to False.
+
+    Raises:
+        ValueError: If ABI_CACHE_OFFLINE is not a recognised boolean string.
+    """
+    return strToBool(os.getenv('ABI_CACHE_OFFLINE', 'False'))
+
+
+def getAbiFetchWorkers() -> int:
+    """Get how many DEX ABIs are loaded concurrently at startup.
+
+    Returns:
+        int: The thread count from ABI_FETCH_WORKERS, defaults to DEFAULT_ABI_FETCH_WORKERS.
+
+    Raises:
+        ValueError: If ABI_FETCH_WORKERS is set but cannot be converted to int.
+    """
+    workers_str = os.getenv('ABI_FETCH_WORKERS')
+    if workers_str is None:
+        return DEFAULT_ABI_FETCH_WORKERS
+
+    return max(1, int(workers_str))
+
+
+def getDaemonMode() -> bool:
+    """Get whether the sniffer keeps running and follows new blocks.
+
+    Returns:
+        bool: The DAEMON_MODE setting, defaults to False.
+
+    Raises:
+        ValueError: If DAEMON_MODE is not a recognised boolean string.
+    """
+    return strToBool(os.getenv('DAEMON_MODE', 'False'))
+
+
+def getDaemonMinPollInterval() -> float:
+    """Get the shortest time daemon mode waits between polls of a network.
+
+    Returns:
+        float: Seconds from DAEMON_MIN_POLL_INTERVAL, defaults to DEFAULT_DAEMON_MIN_POLL_INTERVAL.
+
+    Raises:
+        ValueError: If DAEMON_MIN_POLL_INTERVAL is set but cannot be converted to float.
+    """
+    interval_str = os.getenv('DAEMON_MIN_POLL_INTERVAL')
+    if interval_str is None:
+        return DEFAULT_DAEMON_MIN_POLL_INTERVAL
+
+    return max(0.1, float(interval_str))
+
+
+def getDaemonMaxPollInterval() -> float:
+    """Get the longest time daemon mode waits between polls of a network.
+
+    Returns:
+        float: Seconds from DAEMON_MAX_POLL_INTERVAL, defaults to
+            DEFAULT_DAEMON_MAX_POLL_INTERVAL, never below the minimum interval.
+
+    Raises:
+        ValueError: If DAEMON_MAX_POLL_INTERVAL is set but cannot be converted to float.
+    """
+    interval_str = os.getenv('DAEMON_MAX_POLL_INTERVAL')
+    if interval_str is None:
+        return max(getDaemonMinPollInterval(), DEFAULT_DAEMON_MAX_POLL_INTERVAL)
+
+    return max(getDaemonMinPollInterval(), float(interval_str))
+
+
+def getDaemonConfirmations() -> int:
+    """Get how many blocks daemon mode stays behind the chain head.
+
+    Returns:
+        int: The block count from DAEMON_CONFIRMATIONS, defaults to DEFAULT_DAEMON_CONFIRMATIONS.
+
+    Raises:
+        ValueError: If DAEMON_CONFIRMATIONS is set but cannot be converted to int.
+    """
+    confirmations_str = os.getenv('DAEMON_CONFIRMATIONS')
+    if confirmations_str is None:
+        return DEFAULT_DAEMON_CONFIRMATIONS
+
+    return max(0, int(confirmations_str))
+
+
+def getDaemonDexRefreshInterval() -> float:
+    """Get how often daemon mode reloads DEX configurations from the database.
+
+    Returns:
+        float: Seconds from DAEMON_DEX_REFRESH_INTERVAL, defaults to
+            DEFAULT_DAEMON_DEX_REFRESH_INTERVAL.
+
+    Raises:
+        ValueError: If DAEMON_DEX_REFRESH_INTERVAL is set but cannot be converted to float.
+    """
+    interval_str = os.getenv('DAEMON_DEX_REFRESH_INTERVAL')
+    if interval_str is None:
+        return DEFAULT_DAEMON_DEX_REFRESH_INTERVAL
+
+    return max(0.0, float(interval_str))
+
+
+def getDaemonNetworkTimeout() -> float:
+    """Get how long one network's pass may take in daemon mode.
+
+    Returns:
+        float: Seconds from DAEMON_NETWORK_TIMEOUT, defaults to DEFAULT_DAEMON_NETWORK_TIMEOUT.
+
+    Raises:
+        ValueError: If DAEMON_NETWORK_TIMEOUT is set but cannot be converted to float.
+    """
+    timeout_str = os.getenv('DAEMON_NETWORK_TIMEOUT')
+    if timeout_str is None:
+        return DEFAULT_DAEMON_NETWORK_TIMEOUT
+
+    return max(1.0, float(timeout_str))
+
+
+def getDaemonMaxBackoff() -> float:
+    """Get the longest time a failing network waits before it is retried.
+
+    Returns:
+        float: Seconds from DAEMON_MAX_BACKOFF, defaults to
+            DEFAULT_DAEMON_MAX_BACKOFF, never below the maximum poll interval.
+
+    Raises:
+        ValueError: If DAEMON_MAX_BACKOFF is set but cannot be converted to float.
+    """
+    backoff_str = os.getenv('DAEMON_MAX_BACKOFF')
+    if backoff_str is None:
+        return max(getDaemonMaxPollInterval(), DEFAULT_DAEMON_MAX_BACKOFF)
+
+    return max(getDaemonMaxPollInterval(), float(backoff_str))
+
+
+def getIngestionSource() -> str:
+    """Get where swap transactions are ingested from.
+
+    'explorer' lists each router's transactions from the block explorer's
+    txlist API. 'logs' reads pair Swap events from the network's RPC
+    endpoint with eth_getLogs.
+
+    Returns:
+        str: One of INGESTION_SOURCES, defaults to INGESTION_SOURCE_EXPLORER.
+
+    Raises:
+        ValueError: If INGESTION_SOURCE is set to an unknown source.
+    """
+    ingestion_source = os.getenv('INGESTION_SOURCE', INGESTION_SOURCE_EXPLORER).strip().lower()
+    if ingestion_source not in INGESTION_SOURCES:
+        raise ValueError(f"INGESTION_SOURCE must be one of {INGESTION_SOURCES}, got '{ingestion_source}'")
+    return ingestion_source
+
+
+def getLogBlockChunkSize() -> int:
+    """Get how many blocks each eth_getLogs request covers.
+
+    Returns:
+        int: The block count from LOG_BLOCK_CHUNK_SIZE, defaults to DEFAULT_LOG_BLOCK_CHUNK_SIZE.
+
+    Raises:
+        ValueError: If LOG_BLOCK_CHUNK_SIZE is set but cannot be converted to int.
+    """
+    chunk_size_str = os.getenv('LOG_BLOCK_CHUNK_SIZE')
+    if chunk_size_str is None:
+        return DEFAULT_LOG_BLOCK_CHUNK_SIZE
+
+    return max(1, int(chunk_size_str))
@@ -1,83 +1,9 @@
-"""Initialize and configure logging for application."""
-"""Logging setup module for configuring application-wide logging."""
-"""Configures structured logging with rotation and formatting."""
-"""Initialize and configure application logging."""
-"""Logging setup module for structured application logging."""
-# Performance: batch process for efficiency
-# Initialize logging with timestamp and error level formatting
-"""Configure logging handlers and formatters for application."""
-# Refactor: simplify control flow
-"""Logging setup and configuration for structured application logging."""
-"""Logging setup and configuration.
-# Configure file and console handlers for logging
-"""Configure logging handlers and formatters for application."""
-# TODO: Add async support for better performance
-# TODO: Add async support for better performance
-# Configure structured logging with rotation
-"""Setup application logging with appropriate handlers and formatters."""
-# Initialize logging with environment-specific configuration
-# Note: Consider adding type annotations
-"""Initialize logging handlers with appropriate formatters and levels."""
-# Refactor: simplify control flow
-Configures log levels, handlers, and formatting for application logging."""
-# TODO: Implement structured JSON logging format
-# Configure logging with appropriate levels and handlers
 """Logging configuration and setup utilities for the ATC Route Sniffer.
-# Configure logging handlers for file and console output
-# Configure logging with file and console handlers
-"""Configure logging level and output streams."""
-# Initialize console and file handlers with appropriate levels
-
-# TODO: Migrate to structured logging with JSON output for better parsing
-# TODO: Implement structured logging with JSON formatting
-# Setup console and file logging handlers with appropriate levels
+
 This module provides functions to configure and retrieve loggers with
 consistent formatting across the application.
-# Initialize logging handlers for file and console output
-# Configure rotating file handler for logs
-# Configure file and console handlers for production logging
-# Initialize logger with environment configuration
-# Set up JSON structured logging for production environments
-# Configure logger with JSON formatting for structured logging
-# Configure logging handlers with appropriate formatters
-# Configure logger with appropriate handlers and formatters
-# Configure logging format and output destinations for application events
-# Setup structured logging with JSON formatting for production
-"""Initialize logging configuration for the application.
-    
-    Sets up log level, formatting, and file handlers based on environment
-    configuration.
-    """
-"""Configure structured logging with rotating file handlers."""
-"""Initialize and configure logging for the application."""
-# Configure logging handlers and format for application startup
-# Configure handlers for file and console output
-"""Configure logging with appropriate handlers and formatters."""
 
 The module uses two loggers:
-# Initialize logging with configured handlers and formatters
-# Initialize logger with configuration from environment variables
-# Configure logging handlers for file and console output
-# Set log level based on environment: DEBUG for development, INFO for production
-# Configure logger with appropriate verbosity levels for different modules
-"""Initialize logging configuration with specified level and format.
-# Configure logging levels based on environment
-# Initialize logger with configured handlers and formatters
-# TODO: Implement log rotation to manage file sizes and retention
-# Configure logging levels and output formats
-# Configure logging output and levels
-    
-# Initialize logging handlers and configure output formats
-    Sets up handlers, formatters, and filters for consistent logging across the application.
-    """
-# TODO: Implement daily log rotation with compression for archival
-# TODO: Implement log file rotation to manage disk space
-# TODO: Add async support for better performance
-# Enhancement: improve error messages
-"""Initialize logging configuration with error handling for missing directories."""
-# Configure logging handlers and formatters
-
-# Configure logging with JSON formatting for cloud ingestion
     - MAIN_LOGGER_NAME (DFK-ARB): Primary application logger
     - PROJECT_LOGGER_NAME (DFK-DEX): Project-specific operations logger
 """
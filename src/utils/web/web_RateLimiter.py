@@ -1,143 +1,97 @@
-"""Rate limiting utility for API requests."""
-"""Initialize rate limiter with configurable delay between requests."""
-"""Rate limiter utility for managing API request throttling."""
-"""Implement exponential backoff for rate-limited API calls."""
-"""Implement rate limiting for API requests."""
-"""Manage rate limiting for external API requests."""
-"""Manages API rate limiting and request throttling."""
-"""Implement token bucket rate limiter to respect API quotas."""
-# TODO: Add async support for better performance
-# Refactor: simplify control flow
-# TODO: Add async support for better performance
-# Enhancement: improve error messages
-# Enhancement: improve error messages
-"""Implement exponential backoff for rate limiting.
-    
-    Uses token bucket algorithm to maintain consistent request rates.
-    """
 """Async rate limiting utilities for API requests.
-"""Manages rate limiting for external API calls."""
-"""Enforce rate limits on API requests to prevent throttling."""
-"""Rate limiting utilities for controlling request frequency and preventing API throttling."""
-"""Rate limiter utility for managing request throttling and backoff strategies."""
-
-# Implement exponential backoff for rate limit recovery
-# Implement token bucket algorithm for request rate limiting
-"""Rate limiter for managing API request throttling."""
-"""Implements exponential backoff rate limiting for API requests."""
-# Rate limiter prevents API quota exhaustion and respects service limits
-# Implement exponential backoff for API rate limits
-# Maximum requests per second before triggering backoff
-# Rate limiter enforces exponential backoff with jitter to prevent thundering herd
-# Apply exponential backoff for rate-limited requests
-# Rate limiter ensures requests stay within API quota constraints
-# Enforce request throttling to prevent rate limit violations
-"""Implements exponential backoff and request throttling for API calls."""
-"""Implements rate limiting for web requests to prevent throttling."""
-# Calculate delay based on requests per second threshold
-# Implement exponential backoff for rate-limited endpoints
-"""Implement adaptive rate limiting for API requests."""
-"""Manages API rate limiting with configurable thresholds and backoff strategies."""
-# Calculate requests per second based on configured limit
-# Implement exponential backoff for rate limit handling
-# Rate limit enforced per-second to avoid API throttling
-# Implement exponential backoff for API requests
-# Rate limiting prevents overloading the API with requests
-# Enforce API rate limits to prevent request throttling
+
 This module provides an async rate limiter class to control the frequency
-# Check if request is within rate limit bounds
-
-# Enforce rate limits to prevent API throttling and maintain reliability
-"""Web API rate limiter with adaptive backoff strategy."""
-"""Rate limiter with exponential backoff to prevent API throttling."""
-# TODO: Add configurable rate limit thresholds for different endpoints
-# Enforce rate limiting to prevent API throttling
-# Implement exponential backoff with jitter for rate limit handling
-# TODO: Implement exponential backoff for rate limit handling
-# Enforce rate limits to prevent API throttling
-# TODO: Implement exponential backoff strategy for rate limit recovery
 and concurrency of API requests, preventing rate limit violations.
 
-# Apply exponential backoff for throttled requests
-# Implement token bucket algorithm for API rate control
-# TODO: Implement adaptive rate limiting based on response times
-# Performance: batch process for efficiency
-# Refactor: simplify control flow
-The implementation uses a token bucket algorithm where:
-# TODO: Add async support for better performance
-    - Tokens are consumed when making requests
-# Rate limit requests to avoid overwhelming external services
-# Note: Consider adding type annotations
-# Rate limiting mechanism to prevent API throttling
-# Apply exponential backoff between API requests
-# TODO: Add exponential backoff strategy for rate limiting
-"""Implement rate limiting to prevent API throttling."""
-# Implement exponential backoff to respect API rate limits
-# Apply exponential backoff for rate limiting
-# Enforce rate limits to comply with API provider restrictions
-# TODO: Add async support for better performance
-# Implements exponential backoff for rate-limited requests
-# TODO: Implement exponential backoff strategy for rate limiting
-# TODO: Implement exponential backoff for rate limit retries
-# Rate limiter implements exponential backoff with max retries to handle API throttling
-    - Tokens are replenished at a fixed rate
+The implementation uses the generic cell rate algorithm (GCRA), a timer-free
+leaky bucket where:
+    - Each request reserves the next slot allowed by the rate, computed from
+      a single theoretical arrival timestamp
+    - Callers sleep precisely until their slot, so there is no background
+      task and no polling while idle
+    - Up to `burst` requests may proceed back to back after an idle period
+    - Slots are handed out in arrival order, so waiters are served fairly
     - A semaphore limits concurrent active requests
 
 Use Cases:
     - Blockchain explorer API rate limiting (Etherscan, BscScan)
-"""Apply rate limiting to API requests.
-    
-    Ensures requests stay within configured limits per second and prevents
-    exceeding provider rate thresholds.
-    """
-# TODO: Optimize rate limiter with exponential backoff strategy
     - DEX transaction fetching with multiple endpoints
     - Batch processing with API throttling requirements
 
-# Enforce rate limit to prevent API throttling
 Example:
     >>> async with RateLimiter(rate_limit=10, concurrency_limit=5) as limiter:
     ...     async with limiter.throttle():
     ...         await make_api_request()
 """
-# Apply exponential backoff for rate-limited requests
 
 import asyncio
-import math
 import time
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Dict, Optional
 
 # Minimum allowed rate limit value
 MIN_RATE_LIMIT = 1
-# Enforce request rate limiting per API endpoint
 
 # Minimum allowed concurrency limit value
 MIN_CONCURRENCY_LIMIT = 1
 
+# Default number of requests allowed back to back after an idle period
+DEFAULT_BURST = 1
+
+# Default seconds of a bucket's rate a KeyedRateLimiter allows back to back,
+# one second's requests like the queue-based limiter it replaced
+DEFAULT_BURST_SECONDS = 1.0
+
+# Adaptive (AIMD) mode: multiplicative decrease applied when throttled
+ADAPTIVE_DECREASE_FACTOR = 0.5
+
+# Adaptive mode: requests per second added back after each success
+ADAPTIVE_INCREASE_STEP = 0.1
+
+# Adaptive mode: minimum seconds between two decreases, so a burst of
+# throttled responses to requests already in flight only halves the rate once
+ADAPTIVE_DECREASE_COOLDOWN = 1.0
+
 
 class RateLimiter:
-    """Async rate limiter with token bucket algorithm.
+    """Async rate limiter using the generic cell rate algorithm.
 
     Controls both the rate of requests (requests per second) and the maximum
     number of concurrent requests using a semaphore.
 
+    In adaptive mode the effective rate follows AIMD: it is halved when the
+    caller reports a throttled response and grows by ADAPTIVE_INCREASE_STEP
+    per successful response, never exceeding rate_limit or dropping below
+    MIN_RATE_LIMIT.
+
     Attributes:
         rate_limit: Maximum requests per second allowed.
-        tokens_queue: Queue for tracking pending request tokens.
-        tokens_consumer_task: Background task that consumes tokens.
+        burst: Requests allowed back to back after an idle period.
+        adaptive: Whether the effective rate reacts to throttling feedback.
+        effective_rate: Requests per second currently enforced.
+        rate_limited_count: Number of throttled responses reported.
+        theoretical_arrival_time: Monotonic time the next request would be
+            scheduled at if no burst allowance were left.
         semaphore: Controls maximum concurrent requests.
     """
 
-    def __init__(self, rate_limit: int, concurrency_limit: int) -> None:
+    def __init__(
+        self,
+        rate_limit: int,
+        concurrency_limit: int,
+        adaptive: bool = False,
+        burst: int = DEFAULT_BURST
+    ) -> None:
         """Initialize the rate limiter.
 
         Args:
             rate_limit: Maximum requests per second (must be positive).
             concurrency_limit: Maximum concurrent requests (must be positive).
+            adaptive: Enable AIMD adjustment of the effective rate.
+            burst: Requests allowed back to back after an idle period (must be positive).
 
         Raises:
-            ValueError: If rate_limit or concurrency_limit is not positive.
+            ValueError: If rate_limit, concurrency_limit or burst is not positive.
         """
         # Validate rate_limit parameter
         if not rate_limit or rate_limit < MIN_RATE_LIMIT:
@@ -145,90 +99,68 @@ class RateLimiter:
         # Validate concurrency_limit parameter
         if not concurrency_limit or concurrency_limit < MIN_CONCURRENCY_LIMIT:
             raise ValueError(f'concurrency limit must be at least {MIN_CONCURRENCY_LIMIT}')
+        # Validate burst parameter
+        if not burst or burst < 1:
+            raise ValueError('burst must be at least 1')
 
         self.rate_limit = rate_limit
-        self.tokens_queue: asyncio.Queue[int] = asyncio.Queue(rate_limit)
-        self.tokens_consumer_task: Optional[asyncio.Task[None]] = asyncio.create_task(
-            self.consume_tokens()
-        )
+        self.burst = burst
+        self.adaptive = adaptive
+        self.effective_rate = float(rate_limit)
+        self.rate_limited_count = 0
+        self.last_decrease_time = 0.0
+        self.theoretical_arrival_time = 0.0
         self.semaphore = asyncio.Semaphore(concurrency_limit)
 
-    async def add_token(self) -> None:
-        """Add a token to the queue, blocking if queue is full."""
-        await self.tokens_queue.put(1)
-        return None
+    def record_success(self) -> None:
+        """Report a successful response, additively raising the effective rate."""
+        if self.adaptive:
+            self.effective_rate = min(float(self.rate_limit), self.effective_rate + ADAPTIVE_INCREASE_STEP)
 
-    async def consume_tokens(self) -> None:
-        """Background task that consumes tokens at the configured rate.
+    def record_rate_limited(self) -> None:
+        """Report a throttled response, multiplicatively lowering the effective rate."""
+        self.rate_limited_count += 1
 
-        Runs continuously, consuming tokens from the queue at intervals
-        based on the rate limit. Handles graceful cancellation.
-        """
-        try:
-            consumption_rate = 1 / self.rate_limit
-            last_consumption_time = 0.0
-
-            while True:
-                if self.tokens_queue.empty():
-                    await asyncio.sleep(consumption_rate)
-                    continue
-
-                current_consumption_time = time.monotonic()
-                total_tokens = self.tokens_queue.qsize()
-                tokens_to_consume = self.get_tokens_amount_to_consume(
-                    consumption_rate,
-                    current_consumption_time,
-                    last_consumption_time,
-                    total_tokens
-                )
-
-                for i in range(0, tokens_to_consume):
-                    self.tokens_queue.get_nowait()
-
-                last_consumption_time = time.monotonic()
-
-                await asyncio.sleep(consumption_rate)
-        except asyncio.CancelledError:
-            raise
-        except Exception as e:
-            raise
-
-    @staticmethod
-    def get_tokens_amount_to_consume(
-        consumption_rate: float,
-        current_consumption_time: float,
-        last_consumption_time: float,
-        total_tokens: int
-    ) -> int:
-        """Calculate how many tokens to consume based on elapsed time.
+        now = time.monotonic()
+        if self.adaptive and now - self.last_decrease_time >= ADAPTIVE_DECREASE_COOLDOWN:
+            self.effective_rate = max(float(MIN_RATE_LIMIT), self.effective_rate * ADAPTIVE_DECREASE_FACTOR)
+            self.last_decrease_time = now
 
-        Args:
-            consumption_rate: Time between token consumptions.
-            current_consumption_time: Current monotonic time.
-            last_consumption_time: Time of last consumption.
-            total_tokens: Total tokens currently in queue.
+    def reserve(self) -> float:
+        """Reserve the next request slot allowed by the effective rate.
+
+        Reservations are made synchronously, so concurrent callers receive
+        consecutive slots in the order they arrive.
 
         Returns:
-            Number of tokens to consume this cycle.
+            float: Seconds the caller must wait before its slot starts.
         """
-        time_from_last_consumption = current_consumption_time - last_consumption_time
-        calculated_tokens_to_consume = math.floor(time_from_last_consumption / consumption_rate)
-        tokens_to_consume = min(total_tokens, calculated_tokens_to_consume)
-        return tokens_to_consume
+        now = time.monotonic()
+        interval = 1 / self.effective_rate
+        burst_tolerance = (self.burst - 1) * interval
+
+        arrival_time = max(self.theoretical_arrival_time, now)
+        allowed_time = max(now, arrival_time - burst_tolerance)
+        self.theoretical_arrival_time = arrival_time + interval
+
+        return allowed_time - now
 
     @asynccontextmanager
     async def throttle(self) -> AsyncIterator[None]:
         """Context manager for rate-limited operations.
 
-        Acquires the semaphore and adds a token before yielding,
-        ensuring the operation respects both concurrency and rate limits.
+        Acquires the semaphore and waits for a reserved slot before
+        yielding, ensuring the operation respects both concurrency and
+        rate limits.
 
         Yields:
             None - the caller can perform their rate-limited operation.
         """
         await self.semaphore.acquire()
-        await self.add_token()
         try:
+            delay = self.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
             yield
         finally:
             self.semaphore.release()
@@ -244,18 +176,111 @@ class RateLimiter:
         exc_tb: Optional[object]
     ) -> None:
         """Async context manager exit, ensures cleanup."""
-        if exc_type:
-            pass
+        await self.close()
+
+    async def close(self) -> None:
+        """Release resources.
+
+        The limiter holds no background tasks, this is kept so callers can
+        manage every limiter with the same async context manager protocol.
+        """
+        return None
+
+
+class KeyedRateLimiter:
+    """Collection of independent rate limiters keyed by an arbitrary string.
 
+    Each key (e.g. an explorer API prefix and API key) gets its own token
+    bucket and concurrency semaphore, so throttling on one key never delays
+    requests for another.
+
+    Attributes:
+        concurrency_limit: Maximum concurrent requests per key.
+        burst_seconds: Seconds of its rate each bucket allows back to back.
+        limiters: Rate limiters created so far, keyed by bucket key.
+    """
+
+    def __init__(
+        self,
+        concurrency_limit: int,
+        adaptive: bool = False,
+        burst_seconds: float = DEFAULT_BURST_SECONDS
+    ) -> None:
+        """Initialize an empty set of rate limiters.
+
+        Args:
+            concurrency_limit: Maximum concurrent requests per key (must be positive).
+            adaptive: Create the rate limiters in adaptive (AIMD) mode.
+            burst_seconds: Seconds of its rate each bucket allows back to back,
+                at least one request.
+
+        Raises:
+            ValueError: If concurrency_limit is not positive.
+        """
+        if not concurrency_limit or concurrency_limit < MIN_CONCURRENCY_LIMIT:
+            raise ValueError(f'concurrency limit must be at least {MIN_CONCURRENCY_LIMIT}')
+
+        self.concurrency_limit = concurrency_limit
+        self.adaptive = adaptive
+        self.burst_seconds = burst_seconds
+        self.limiters: Dict[str, RateLimiter] = {}
+
+    def get_limiter(self, key: str, rate_limit: int, burst: Optional[int] = None) -> RateLimiter:
+        """Get the rate limiter for a key, creating it on first use.
+
+        The rate and burst of an existing bucket are not changed by later calls.
+
+        Args:
+            key: Bucket key.
+            rate_limit: Requests per second for the bucket if it is created.
+            burst: Requests the bucket allows back to back if it is created,
+                burst_seconds of rate_limit if None.
+
+        Returns:
+            RateLimiter: The key's rate limiter.
+        """
+        if key not in self.limiters:
+            if burst is None:
+                burst = max(DEFAULT_BURST, round(rate_limit * self.burst_seconds))
+
+            self.limiters[key] = RateLimiter(
+                rate_limit=rate_limit,
+                concurrency_limit=self.concurrency_limit,
+                adaptive=self.adaptive,
+                burst=burst
+            )
+        return self.limiters[key]
+
+    @asynccontextmanager
+    async def throttle(self, key: str, rate_limit: int, burst: Optional[int] = None) -> AsyncIterator[None]:
+        """Context manager for an operation rate-limited by the key's bucket.
+
+        Args:
+            key: Bucket key.
+            rate_limit: Requests per second for the bucket if it is created.
+            burst: Requests the bucket allows back to back if it is created.
+
+        Yields:
+            None - the caller can perform their rate-limited operation.
+        """
+        async with self.get_limiter(key=key, rate_limit=rate_limit, burst=burst).throttle():
+            yield
+
+    async def __aenter__(self) -> 'KeyedRateLimiter':
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[object]
+    ) -> None:
+        """Async context manager exit, ensures cleanup."""
         await self.close()
 
     async def close(self) -> None:
-        """Clean up resources by cancelling the token consumer task."""
-        if self.tokens_consumer_task and not self.tokens_consumer_task.cancelled():
-            try:
-                self.tokens_consumer_task.cancel()
-                await self.tokens_consumer_task
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                raise
+        """Close every rate limiter created so far."""
+        for limiter in self.limiters.values():
+            await limiter.close()
+        self.limiters = {}